@@ -5,6 +5,7 @@ A Streamlit web application for translating French text to English with PSP-spec
 rules, glossary integration, and terminology checking tools.
 """
 
+import logging
 import os
 import streamlit as st
 import time
@@ -17,6 +18,11 @@ from tools import translate_text, fetch_glossary, scrape_termium, scrape_oqlf, s
 from tools import log_action, add_to_glossary, parse_word, export_word
 from tools import clickable_text, word_alignment
 
+# Progress from the tools modules goes through logging; configured once,
+# since Streamlit re-runs this script on every interaction
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=os.getenv('LOG_LEVEL', 'INFO'))
+
 # Page configuration
 st.set_page_config(
     page_title="PSP Translator",
@@ -192,7 +198,8 @@ def load_glossary():
     if needs_reload:
         with st.spinner("Loading glossary from Excel file..."):
             try:
-                st.session_state.glossary = fetch_glossary.fetch_glossary(force_refresh=True)
+                # Prompt template and API client get ready alongside the glossary
+                st.session_state.glossary = translate_text.warmup(force_refresh=True)
                 st.session_state.glossary_loaded = True
                 st.session_state.glossary_loaded_at = _time.time()
                 return True
@@ -731,16 +738,11 @@ def main():
                         st.session_state.translated_text = result['translated_text']
 
                         # Generate word alignment for synchronized highlighting
-                        try:
-                            alignment = word_alignment.generate_alignment(
-                                french_text,
-                                result['translated_text']
-                            )
-                            st.session_state.word_alignment = alignment
-                            st.session_state.en_highlight_indices = []
-                        except Exception as e:
-                            print(f"Warning: Failed to generate word alignment: {e}")
-                            st.session_state.word_alignment = None
+                        # (in the background while the translation is logged)
+                        alignment_future = word_alignment.generate_alignment_async(
+                            french_text,
+                            result['translated_text']
+                        )
 
                         # Log the translation
                         try:
@@ -757,6 +759,13 @@ def main():
                             'cost': result['cost']
                         })
 
+                        try:
+                            st.session_state.word_alignment = alignment_future.result()
+                            st.session_state.en_highlight_indices = []
+                        except Exception as e:
+                            print(f"Warning: Failed to generate word alignment: {e}")
+                            st.session_state.word_alignment = None
+
                         st.success(
                             f"✅ Translation complete! "
                             f"(Tokens: {result['input_tokens']} in / {result['output_tokens']} out, "
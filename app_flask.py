@@ -5,6 +5,7 @@ Replaces Streamlit with Flask + HTMX for environments that block WebSocket
 (e.g., Canadian Forces DWAN network).
 """
 
+import logging
 import os
 import re
 import json
@@ -21,6 +22,11 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Progress from the tools modules goes through logging; configure it at import
+# so it also reaches the console under gunicorn, which never runs __main__
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=os.getenv('LOG_LEVEL', 'INFO'))
+
 # Import backend tools (unchanged from Streamlit version)
 from tools import translate_text, fetch_glossary, scrape_termium, scrape_oqlf, scrape_canada
 from tools import log_action, add_to_glossary, parse_word, export_word
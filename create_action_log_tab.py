@@ -6,7 +6,7 @@ This script automatically creates the Action Log tab with proper headers and for
 
 import os
 from dotenv import load_dotenv
-from tools.google_sheets_client import get_client
+from tools.google_sheets_client import get_client, SheetRangeNotFound
 
 # Load environment variables
 load_dotenv()
@@ -46,38 +46,34 @@ def create_action_log_tab():
             else:
                 print("  No headers found, adding them now...")
 
-        except Exception as e:
+        except SheetRangeNotFound:
             # Tab doesn't exist, we need to create it
-            error_msg = str(e)
-            if "Unable to parse range" in error_msg or "not found" in error_msg.lower():
-                print("Creating new Action Log tab...")
-
-                # Create the new sheet using batchUpdate
-                request_body = {
-                    'requests': [
-                        {
-                            'addSheet': {
-                                'properties': {
-                                    'title': 'Action Log',
-                                    'gridProperties': {
-                                        'rowCount': 1000,
-                                        'columnCount': 5,
-                                        'frozenRowCount': 1
-                                    }
+            print("Creating new Action Log tab...")
+
+            # Create the new sheet using batchUpdate
+            request_body = {
+                'requests': [
+                    {
+                        'addSheet': {
+                            'properties': {
+                                'title': 'Action Log',
+                                'gridProperties': {
+                                    'rowCount': 1000,
+                                    'columnCount': 5,
+                                    'frozenRowCount': 1
                                 }
                             }
                         }
-                    ]
-                }
+                    }
+                ]
+            }
 
-                result = client.service.spreadsheets().batchUpdate(
-                    spreadsheetId=sheet_id,
-                    body=request_body
-                ).execute()
+            result = client.service.spreadsheets().batchUpdate(
+                spreadsheetId=sheet_id,
+                body=request_body
+            ).execute()
 
-                print("[OK] Action Log tab created")
-            else:
-                raise e
+            print("[OK] Action Log tab created")
 
         # Add headers
         print("\nAdding headers to Action Log...")
@@ -5,8 +5,7 @@ This script helps you set up and verify the Action Log in Google Sheets.
 """
 
 import sys
-from tools.google_sheets_client import get_client
-from tools.log_action import log, get_action_stats
+from tools.google_sheets_client import get_client, SheetRangeNotFound
 from datetime import datetime
 
 
@@ -58,25 +57,24 @@ def check_action_log_structure(client, sheet_id):
             print(f"  Expected: {expected}")
             return False
 
+    except SheetRangeNotFound:
+        print("[ERROR] Action Log tab not found")
+        print("\nManual Setup Required:")
+        print("  1. Open your Google Sheet:")
+        print(f"     https://docs.google.com/spreadsheets/d/{sheet_id}/edit")
+        print("  2. Create a new tab called 'Action Log'")
+        print("  3. Add these headers in Row 1:")
+        print("     A1: Timestamp")
+        print("     B1: French Term")
+        print("     C1: English Term")
+        print("     D1: Source")
+        print("     E1: Added to Glossary")
+        print("  4. Run this script again")
+        return False
+
     except Exception as e:
-        error_msg = str(e)
-        if "Unable to parse range" in error_msg or "not found" in error_msg.lower():
-            print("[ERROR] Action Log tab not found")
-            print("\nManual Setup Required:")
-            print("  1. Open your Google Sheet:")
-            print(f"     https://docs.google.com/spreadsheets/d/{sheet_id}/edit")
-            print("  2. Create a new tab called 'Action Log'")
-            print("  3. Add these headers in Row 1:")
-            print("     A1: Timestamp")
-            print("     B1: French Term")
-            print("     C1: English Term")
-            print("     D1: Source")
-            print("     E1: Added to Glossary")
-            print("  4. Run this script again")
-            return False
-        else:
-            print(f"[ERROR] Error checking structure: {e}")
-            return False
+        print(f"[ERROR] Error checking structure: {e}")
+        return False
 
 
 def test_logging(client, sheet_id):
@@ -84,6 +82,8 @@ def test_logging(client, sheet_id):
     print("\nStep 3: Testing action logging...")
     print("-" * 60)
 
+    from tools.log_action import log
+
     try:
         # Log a test action
         test_term = f"test_{datetime.now().strftime('%H%M%S')}"
@@ -111,6 +111,8 @@ def display_stats():
     print("\nStep 4: Retrieving action log statistics...")
     print("-" * 60)
 
+    from tools.log_action import get_action_stats
+
     try:
         stats = get_action_stats()
 
@@ -12,4 +12,11 @@ Following the WAT framework, these tools handle:
 
 __version__ = "1.0.0"
 
-from tools import export_word
+
+def __getattr__(name):
+    # Submodules are imported on first access so that callers only pay for
+    # the subsystems they actually use (e.g. docx for export_word).
+    if name == 'export_word':
+        import importlib
+        return importlib.import_module('tools.export_word')
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -17,6 +17,9 @@ load_dotenv()
 # Configuration
 GLOSSARY_SHEET_NAME = os.getenv('GLOSSARY_SHEET_NAME', 'Glossary')
 
+# Column A header values that mark the first row as a header row
+_HEADER_SYNONYMS = frozenset({'french term', 'terme français', 'french'})
+
 
 def add(
     french_term: str,
@@ -68,7 +71,7 @@ def add(
         from tools.sharepoint_client import is_sharepoint_enabled, download_glossary, upload_glossary
         if is_sharepoint_enabled():
             print("Downloading latest glossary from SharePoint before edit...")
-            download_glossary(str(glossary_path))
+            download_glossary(str(glossary_path), bypass_ttl=True)
 
         # Ensure file exists
         ensure_glossary_exists()
@@ -99,6 +102,7 @@ def add(
             sheet_name=GLOSSARY_SHEET_NAME,
             values=row_data
         )
+        client.flush(glossary_path)
 
         # Invalidate cache to force refresh
         invalidate_cache()
@@ -148,10 +152,10 @@ def update(
 
     try:
         # Always download latest from SharePoint before modifying
-        from tools.sharepoint_client import is_sharepoint_enabled, download_glossary, upload_glossary
+        from tools.sharepoint_client import is_sharepoint_enabled, download_glossary, upload_glossary_async
         if is_sharepoint_enabled():
             print("Downloading latest glossary from SharePoint before update...")
-            download_glossary(str(glossary_path))
+            download_glossary(str(glossary_path), bypass_ttl=True)
 
         # Ensure file exists
         ensure_glossary_exists()
@@ -165,18 +169,20 @@ def update(
         if not values:
             return False, "Glossary is empty"
 
-        # Find the term (skip header row)
+        # Skip header row once, outside the search loop
+        first_row = 1  # Excel rows are 1-indexed
+        if values[0] and values[0][0].lower() in _HEADER_SYNONYMS:
+            values = values[1:]
+            first_row = 2
+
+        # Find the term
         found = False
         row_index = -1
 
-        for i, row in enumerate(values):
-            # Skip header row
-            if i == 0 and len(row) > 0 and row[0].lower() in ['french term', 'terme français', 'french']:
-                continue
-
-            if len(row) > 0 and row[0].strip() == french_term:
+        for i, row in enumerate(values, start=first_row):
+            if row and row[0].strip() == french_term:
                 found = True
-                row_index = i + 1  # +1 because Excel rows are 1-indexed
+                row_index = i
                 break
 
         if not found:
@@ -195,9 +201,10 @@ def update(
         # Invalidate cache
         invalidate_cache()
 
-        # Upload updated file back to SharePoint (if configured)
+        # Upload updated file back to SharePoint (if configured) in the
+        # background; the next download waits for it
         if is_sharepoint_enabled():
-            upload_glossary(str(glossary_path))
+            upload_glossary_async(str(glossary_path))
 
         print(f"[OK] Updated glossary: {french_term} -> {new_english_term}")
         return True, f"Successfully updated: {french_term} -> {new_english_term}"
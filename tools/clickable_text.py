@@ -8,7 +8,13 @@ to communicate selections back to the app.
 
 import streamlit as st
 import streamlit.components.v1 as components
+import base64
+import hashlib
+import html
 import json
+import re
+from functools import lru_cache
+from html.parser import HTMLParser
 from pathlib import Path
 
 
@@ -16,93 +22,15 @@ from pathlib import Path
 _COMPONENT_DIR = Path(__file__).parent / "clickable_text_component"
 _clickable_component = components.declare_component("clickable_text", path=str(_COMPONENT_DIR))
 
+# HTML/JS templates for the read-only renderers. They are built once at
+# import; each render only fills in the placeholders via str.format_map().
+# Their shared CSS lives in static/clickable_text.css (served by Streamlit's
+# static file serving) so the browser caches it instead of every rerun
+# re-sending it inside a fresh iframe.
 
-def render_clickable(html_content: str, key: str, highlight_indices: list = None, height: int = 750):
-    """
-    Render text with clickable words and context menu.
-
-    When user clicks words and selects a tool, the component returns a dict
-    with the selected term, tool, and word indices.
-
-    Args:
-        html_content: HTML content to display (from markdown_to_html())
-        key: Unique key for this component instance
-        highlight_indices: List of word indices to highlight initially
-        height: Height of the component in pixels
-
-    Returns:
-        dict or None: If user selected a tool, returns:
-            {'term': str, 'tool': str, 'indices': str, 'ts': int}
-            Otherwise returns None.
-    """
-    result = _clickable_component(
-        html_content=html_content,
-        highlight_indices=highlight_indices or [],
-        key=key,
-        height=height,
-        default=None
-    )
-    return result
-
-
-def render_editable_preview(html_content: str, key: str, highlight_indices: list = None, height: int = 750):
-    """
-    Render English text with inline editing support.
-    Double-click any word to edit it directly in the text.
-    Select multiple words (Shift+click) then double-click to edit a phrase.
-
-    Returns:
-        dict or None: If user edited a word, returns:
-            {'action': 'edit', 'oldText': str, 'newText': str, 'wordIndex': int, 'ts': int}
-            Otherwise returns None.
-    """
-    result = _clickable_component(
-        html_content=html_content,
-        highlight_indices=highlight_indices or [],
-        editable=True,
-        key=key,
-        height=height,
-        default=None
-    )
-    return result
-
-
-def render_with_highlights(html_content: str, highlight_indices: list, key: str, height: int = 750):
-    """
-    Render text with highlighted words (read-only, for English side).
-
-    Args:
-        html_content: HTML content to display
-        highlight_indices: List of word indices to highlight
-        key: Unique key for this component
-        height: Height of the component in pixels
-    """
-
-    highlight_json = json.dumps(highlight_indices or [])
-
-    html_code = f"""
-    <style>
-        .highlight-container {{
-            font-family: 'Times New Roman', Times, serif;
-            font-size: 12pt;
-            line-height: 1.6;
-            padding: 15px;
-            background-color: #f8f9fa;
-            border: 1px solid #ddd;
-            border-radius: 4px;
-            min-height: 100px;
-        }}
-
-        .highlight-word {{
-            padding: 1px 2px;
-            border-radius: 2px;
-        }}
-
-        .highlight-word.synced {{
-            background-color: #c8e6c9;
-            box-shadow: 0 0 0 1px #4caf50;
-        }}
-    </style>
+# Static page skeleton for render_with_highlights()
+_HIGHLIGHT_TMPL = """
+    <link rel="stylesheet" href="app/static/clickable_text.css">
 
     <div id="highlight-{key}" class="highlight-container">
     </div>
@@ -112,118 +40,42 @@ def render_with_highlights(html_content: str, highlight_indices: list, key: str,
             const container = document.getElementById('highlight-{key}');
             const highlightIndices = {highlight_json};
 
-            function wrapWords(html) {{
-                const temp = document.createElement('div');
-                temp.innerHTML = html;
-
-                let wordIndex = 0;
-
-                function processNode(node) {{
-                    if (node.nodeType === Node.TEXT_NODE) {{
-                        const text = node.textContent;
-                        if (!text.trim()) return node;
-
-                        const parts = text.split(/(\\s+)/);
-                        const fragment = document.createDocumentFragment();
-
-                        parts.forEach(part => {{
-                            if (/^\\s+$/.test(part)) {{
-                                fragment.appendChild(document.createTextNode(part));
-                            }} else if (part.length > 0) {{
-                                const span = document.createElement('span');
-                                span.className = 'highlight-word';
-                                if (highlightIndices.includes(wordIndex)) {{
-                                    span.classList.add('synced');
-                                }}
-                                span.textContent = part;
-                                fragment.appendChild(span);
-                                wordIndex++;
-                            }}
-                        }});
-
-                        return fragment;
-                    }} else if (node.nodeType === Node.ELEMENT_NODE) {{
-                        const children = Array.from(node.childNodes);
-                        children.forEach(child => {{
-                            const processed = processNode(child);
-                            if (processed !== child) {{
-                                node.replaceChild(processed, child);
-                            }}
-                        }});
-                        return node;
-                    }}
-                    return node;
-                }}
+            // Words arrive pre-wrapped in spans (see _wrap_words_html)
+            container.innerHTML = new TextDecoder().decode(
+                Uint8Array.from(atob('{html_b64}'), c => c.charCodeAt(0)));
 
-                processNode(temp);
-                return temp.innerHTML;
-            }}
-
-            const originalHtml = `{html_content.replace('`', '\\`').replace('${', '\\${')}`;
-            container.innerHTML = wrapWords(originalHtml);
+            const allWords = container.querySelectorAll('.highlight-word');
+            highlightIndices.forEach(idx => {{
+                if (idx < allWords.length) {{
+                    allWords[idx].classList.add('synced');
+                }}
+            }});
 
             // Auto-resize iframe to fit content
+            // Post the height at most once per frame, and only when it changed
+            let lastHeight = -1;
+            let resizePending = false;
             function resizeFrame() {{
+                resizePending = false;
                 const h = document.documentElement.scrollHeight;
+                if (h === lastHeight) return;
+                lastHeight = h;
                 window.parent.postMessage({{type: 'streamlit:setFrameHeight', height: h}}, '*');
             }}
             resizeFrame();
-            new ResizeObserver(resizeFrame).observe(container);
+            new ResizeObserver(() => {{
+                if (!resizePending) {{
+                    resizePending = true;
+                    requestAnimationFrame(resizeFrame);
+                }}
+            }}).observe(container);
         }})();
     </script>
-    """
-
-    components.html(html_code, height=height, scrolling=True)
-
-
-def render_replacement_highlight(html_content: str, target_term: str, occurrence_idx: int, total_occurrences: int, key: str, height: int = 750):
-    """
-    Render text with a specific occurrence of a term highlighted in orange for replacement.
-    Auto-scrolls to the highlighted occurrence.
-
-    Args:
-        html_content: HTML content to display (from markdown_to_html())
-        target_term: The term to find and highlight (e.g., "program")
-        occurrence_idx: Which occurrence to highlight (0-based)
-        total_occurrences: Total number of occurrences (for display)
-        key: Unique key for this component
-        height: Height of the component in pixels
-    """
+"""
 
-    target_json = json.dumps(target_term.lower())
-    target_words = target_term.lower().split()
-    target_words_json = json.dumps(target_words)
-
-    html_code = f"""
-    <style>
-        .replace-container {{
-            font-family: 'Times New Roman', Times, serif;
-            font-size: 12pt;
-            line-height: 1.6;
-            padding: 15px;
-            background-color: #f8f9fa;
-            border: 1px solid #ddd;
-            border-radius: 4px;
-            min-height: 100px;
-        }}
-
-        .replace-word {{
-            padding: 1px 2px;
-            border-radius: 2px;
-        }}
-
-        .replace-word.target {{
-            background-color: #FF9800;
-            box-shadow: 0 0 0 2px #E65100;
-            color: #000;
-            animation: pulse-orange 1.5s ease-in-out infinite;
-        }}
-
-        @keyframes pulse-orange {{
-            0%, 100% {{ box-shadow: 0 0 0 2px #E65100; }}
-            50% {{ box-shadow: 0 0 8px 3px #FF9800; }}
-        }}
-    </style>
+# Static page skeleton for render_replacement_highlight()
+_REPLACE_TMPL = """
+    <link rel="stylesheet" href="app/static/clickable_text.css">
 
     <div id="replace-{key}" class="replace-container">
     </div>
@@ -234,61 +86,14 @@ def render_replacement_highlight(html_content: str, target_term: str, occurrence
             const targetWords = {target_words_json};
             const occurrenceIdx = {occurrence_idx};
 
-            // Strip punctuation from edges for matching
-            function cleanWord(w) {{
-                return w.replace(/^[^\\w]+/, '').replace(/[^\\w]+$/, '').toLowerCase();
-            }}
-
-            function wrapWords(html) {{
-                const temp = document.createElement('div');
-                temp.innerHTML = html;
-                let wordIndex = 0;
-
-                function processNode(node) {{
-                    if (node.nodeType === Node.TEXT_NODE) {{
-                        const text = node.textContent;
-                        if (!text.trim()) return node;
-
-                        const parts = text.split(/(\\s+)/);
-                        const fragment = document.createDocumentFragment();
-
-                        parts.forEach(part => {{
-                            if (/^\\s+$/.test(part)) {{
-                                fragment.appendChild(document.createTextNode(part));
-                            }} else if (part.length > 0) {{
-                                const span = document.createElement('span');
-                                span.className = 'replace-word';
-                                span.dataset.wordIndex = wordIndex;
-                                span.textContent = part;
-                                fragment.appendChild(span);
-                                wordIndex++;
-                            }}
-                        }});
-
-                        return fragment;
-                    }} else if (node.nodeType === Node.ELEMENT_NODE) {{
-                        const children = Array.from(node.childNodes);
-                        children.forEach(child => {{
-                            const processed = processNode(child);
-                            if (processed !== child) {{
-                                node.replaceChild(processed, child);
-                            }}
-                        }});
-                        return node;
-                    }}
-                    return node;
-                }}
-
-                processNode(temp);
-                return temp.innerHTML;
-            }}
-
-            const originalHtml = `{html_content.replace('`', '\\`').replace('${', '\\${')}`;
-            container.innerHTML = wrapWords(originalHtml);
+            // Words arrive pre-wrapped in spans (see _wrap_words_html);
+            // wordTexts holds each word's cleaned, lowercased text for matching
+            container.innerHTML = new TextDecoder().decode(
+                Uint8Array.from(atob('{html_b64}'), c => c.charCodeAt(0)));
 
             // Find and highlight the Nth occurrence of the target term
             const allWords = container.querySelectorAll('.replace-word');
-            const wordTexts = Array.from(allWords).map(w => cleanWord(w.textContent));
+            const wordTexts = {words_json};
             let matchCount = 0;
 
             for (let i = 0; i <= wordTexts.length - targetWords.length; i++) {{
@@ -318,72 +123,30 @@ def render_replacement_highlight(html_content: str, target_term: str, occurrence
             }}
 
             // Auto-resize iframe
+            // Post the height at most once per frame, and only when it changed
+            let lastHeight = -1;
+            let resizePending = false;
             function resizeFrame() {{
+                resizePending = false;
                 const h = document.documentElement.scrollHeight;
+                if (h === lastHeight) return;
+                lastHeight = h;
                 window.parent.postMessage({{type: 'streamlit:setFrameHeight', height: h}}, '*');
             }}
             resizeFrame();
-            new ResizeObserver(resizeFrame).observe(container);
+            new ResizeObserver(() => {{
+                if (!resizePending) {{
+                    resizePending = true;
+                    requestAnimationFrame(resizeFrame);
+                }}
+            }}).observe(container);
         }})();
     </script>
-    """
-
-    components.html(html_code, height=height, scrolling=True)
-
-
-def render_change_highlight(html_content: str, target_term: str, key: str, height: int = 750):
-    """
-    Render text with all occurrences of a newly-replaced term highlighted in green
-    with zoom-in animation and auto-scroll. Used after a replacement is applied
-    to show the user exactly what changed.
-
-    Args:
-        html_content: HTML content to display (from markdown_to_html())
-        target_term: The new term that was just inserted
-        key: Unique key for this component
-        height: Height of the component in pixels
-    """
+"""
 
-    target_words = target_term.lower().split()
-    target_words_json = json.dumps(target_words)
-
-    html_code = f"""
-    <style>
-        .change-container {{
-            font-family: 'Times New Roman', Times, serif;
-            font-size: 12pt;
-            line-height: 1.6;
-            padding: 15px;
-            background-color: #f8f9fa;
-            border: 1px solid #ddd;
-            border-radius: 4px;
-            min-height: 100px;
-        }}
-
-        .change-word {{
-            padding: 1px 2px;
-            border-radius: 2px;
-            transition: all 0.3s ease;
-        }}
-
-        .change-word.changed {{
-            background-color: #A5D6A7;
-            box-shadow: 0 0 0 2px #2E7D32;
-            color: #000;
-            font-weight: bold;
-            animation: zoom-pulse 2s ease-in-out;
-            position: relative;
-            z-index: 1;
-        }}
-
-        @keyframes zoom-pulse {{
-            0% {{ transform: scale(1); box-shadow: 0 0 0 2px #2E7D32; }}
-            15% {{ transform: scale(1.35); box-shadow: 0 0 12px 4px #66BB6A; }}
-            40% {{ transform: scale(1.2); box-shadow: 0 0 8px 3px #66BB6A; }}
-            70% {{ transform: scale(1.1); box-shadow: 0 0 4px 2px #43A047; }}
-            100% {{ transform: scale(1); box-shadow: 0 0 0 2px #2E7D32; }}
-        }}
-    </style>
+# Static page skeleton for render_change_highlight()
+_CHANGE_TMPL = """
+    <link rel="stylesheet" href="app/static/clickable_text.css">
 
     <div id="change-{key}" class="change-container">
     </div>
@@ -393,60 +156,14 @@ def render_change_highlight(html_content: str, target_term: str, key: str, heigh
             const container = document.getElementById('change-{key}');
             const targetWords = {target_words_json};
 
-            function cleanWord(w) {{
-                return w.replace(/^[^\\w]+/, '').replace(/[^\\w]+$/, '').toLowerCase();
-            }}
-
-            function wrapWords(html) {{
-                const temp = document.createElement('div');
-                temp.innerHTML = html;
-                let wordIndex = 0;
-
-                function processNode(node) {{
-                    if (node.nodeType === Node.TEXT_NODE) {{
-                        const text = node.textContent;
-                        if (!text.trim()) return node;
-
-                        const parts = text.split(/(\\s+)/);
-                        const fragment = document.createDocumentFragment();
-
-                        parts.forEach(part => {{
-                            if (/^\\s+$/.test(part)) {{
-                                fragment.appendChild(document.createTextNode(part));
-                            }} else if (part.length > 0) {{
-                                const span = document.createElement('span');
-                                span.className = 'change-word';
-                                span.dataset.wordIndex = wordIndex;
-                                span.textContent = part;
-                                fragment.appendChild(span);
-                                wordIndex++;
-                            }}
-                        }});
-
-                        return fragment;
-                    }} else if (node.nodeType === Node.ELEMENT_NODE) {{
-                        const children = Array.from(node.childNodes);
-                        children.forEach(child => {{
-                            const processed = processNode(child);
-                            if (processed !== child) {{
-                                node.replaceChild(processed, child);
-                            }}
-                        }});
-                        return node;
-                    }}
-                    return node;
-                }}
-
-                processNode(temp);
-                return temp.innerHTML;
-            }}
-
-            const originalHtml = `{html_content.replace('`', '\\`').replace('${', '\\${')}`;
-            container.innerHTML = wrapWords(originalHtml);
+            // Words arrive pre-wrapped in spans (see _wrap_words_html);
+            // wordTexts holds each word's cleaned, lowercased text for matching
+            container.innerHTML = new TextDecoder().decode(
+                Uint8Array.from(atob('{html_b64}'), c => c.charCodeAt(0)));
 
             // Find ALL occurrences of the target term and highlight them
             const allWords = container.querySelectorAll('.change-word');
-            const wordTexts = Array.from(allWords).map(w => cleanWord(w.textContent));
+            const wordTexts = {words_json};
             let firstMatch = null;
 
             for (let i = 0; i <= wordTexts.length - targetWords.length; i++) {{
@@ -474,122 +191,62 @@ def render_change_highlight(html_content: str, target_term: str, key: str, heigh
             }}
 
             // Auto-resize iframe
+            // Post the height at most once per frame, and only when it changed
+            let lastHeight = -1;
+            let resizePending = false;
             function resizeFrame() {{
+                resizePending = false;
                 const h = document.documentElement.scrollHeight;
+                if (h === lastHeight) return;
+                lastHeight = h;
                 window.parent.postMessage({{type: 'streamlit:setFrameHeight', height: h}}, '*');
             }}
             resizeFrame();
-            new ResizeObserver(resizeFrame).observe(container);
+            new ResizeObserver(() => {{
+                if (!resizePending) {{
+                    resizePending = true;
+                    requestAnimationFrame(resizeFrame);
+                }}
+            }}).observe(container);
         }})();
     </script>
-    """
-
-    components.html(html_code, height=height, scrolling=True)
-
-
-def render_change_highlight_multi(html_content: str, target_terms: list, key: str, height: int = 750):
-    """
-    Render text highlighting multiple different replacement terms in green.
-    Used when the user manually edited different occurrences to different values.
-    """
+"""
 
-    all_targets = [term.lower().split() for term in target_terms]
-    all_targets_json = json.dumps(all_targets)
-
-    html_code = f"""
-    <style>
-        .mchange-container {{
-            font-family: 'Times New Roman', Times, serif;
-            font-size: 12pt;
-            line-height: 1.6;
-            padding: 15px;
-            background-color: #f8f9fa;
-            border: 1px solid #ddd;
-            border-radius: 4px;
-            min-height: 100px;
-        }}
-        .mchange-word {{
-            padding: 1px 2px;
-            border-radius: 2px;
-            transition: all 0.3s ease;
-        }}
-        .mchange-word.changed {{
-            background-color: #A5D6A7;
-            box-shadow: 0 0 0 2px #2E7D32;
-            color: #000;
-            font-weight: bold;
-            animation: mzoom-pulse 2s ease-in-out;
-            position: relative;
-            z-index: 1;
-        }}
-        @keyframes mzoom-pulse {{
-            0% {{ transform: scale(1); box-shadow: 0 0 0 2px #2E7D32; }}
-            15% {{ transform: scale(1.35); box-shadow: 0 0 12px 4px #66BB6A; }}
-            40% {{ transform: scale(1.2); box-shadow: 0 0 8px 3px #66BB6A; }}
-            70% {{ transform: scale(1.1); box-shadow: 0 0 4px 2px #43A047; }}
-            100% {{ transform: scale(1); box-shadow: 0 0 0 2px #2E7D32; }}
-        }}
-    </style>
+# Static page skeleton for render_change_highlight_multi()
+_MCHANGE_TMPL = """
+    <link rel="stylesheet" href="app/static/clickable_text.css">
     <div id="mchange-{key}" class="mchange-container"></div>
     <script>
         (function() {{
             const container = document.getElementById('mchange-{key}');
             const allTargets = {all_targets_json};
 
-            function cleanWord(w) {{
-                return w.replace(/^[^\\w]+/, '').replace(/[^\\w]+$/, '').toLowerCase();
-            }}
-
-            function wrapWords(html) {{
-                const temp = document.createElement('div');
-                temp.innerHTML = html;
-                let wordIndex = 0;
-                function processNode(node) {{
-                    if (node.nodeType === Node.TEXT_NODE) {{
-                        const text = node.textContent;
-                        if (!text.trim()) return node;
-                        const parts = text.split(/(\\s+)/);
-                        const fragment = document.createDocumentFragment();
-                        parts.forEach(part => {{
-                            if (/^\\s+$/.test(part)) {{
-                                fragment.appendChild(document.createTextNode(part));
-                            }} else if (part.length > 0) {{
-                                const span = document.createElement('span');
-                                span.className = 'mchange-word';
-                                span.dataset.wordIndex = wordIndex;
-                                span.textContent = part;
-                                fragment.appendChild(span);
-                                wordIndex++;
-                            }}
-                        }});
-                        return fragment;
-                    }} else if (node.nodeType === Node.ELEMENT_NODE) {{
-                        const children = Array.from(node.childNodes);
-                        children.forEach(child => {{
-                            const processed = processNode(child);
-                            if (processed !== child) {{
-                                node.replaceChild(processed, child);
-                            }}
-                        }});
-                        return node;
-                    }}
-                    return node;
-                }}
-                processNode(temp);
-                return temp.innerHTML;
-            }}
-
-            const originalHtml = `{html_content.replace('`', '\\`').replace('${', '\\${')}`;
-            container.innerHTML = wrapWords(originalHtml);
+            // Words arrive pre-wrapped in spans (see _wrap_words_html);
+            // wordTexts holds each word's cleaned, lowercased text for matching
+            container.innerHTML = new TextDecoder().decode(
+                Uint8Array.from(atob('{html_b64}'), c => c.charCodeAt(0)));
 
             const allWords = container.querySelectorAll('.mchange-word');
-            const wordTexts = Array.from(allWords).map(w => cleanWord(w.textContent));
+            const wordTexts = {words_json};
             let firstMatch = null;
 
+            // Index targets by first word so each position only tests
+            // the phrases that can start there (one pass over the text)
+            const targetsByFirstWord = new Map();
             for (const targetWords of allTargets) {{
-                for (let i = 0; i <= wordTexts.length - targetWords.length; i++) {{
+                if (targetWords.length === 0) continue;
+                const first = targetWords[0];
+                if (!targetsByFirstWord.has(first)) targetsByFirstWord.set(first, []);
+                targetsByFirstWord.get(first).push(targetWords);
+            }}
+
+            for (let i = 0; i < wordTexts.length; i++) {{
+                const candidates = targetsByFirstWord.get(wordTexts[i]);
+                if (!candidates) continue;
+                for (const targetWords of candidates) {{
+                    if (i + targetWords.length > wordTexts.length) continue;
                     let match = true;
-                    for (let j = 0; j < targetWords.length; j++) {{
+                    for (let j = 1; j < targetWords.length; j++) {{
                         if (wordTexts[i + j] !== targetWords[j]) {{
                             match = false;
                             break;
@@ -610,14 +267,283 @@ def render_change_highlight_multi(html_content: str, target_terms: list, key: st
                 }}, 200);
             }}
 
+            // Post the height at most once per frame, and only when it changed
+            let lastHeight = -1;
+            let resizePending = false;
             function resizeFrame() {{
+                resizePending = false;
                 const h = document.documentElement.scrollHeight;
+                if (h === lastHeight) return;
+                lastHeight = h;
                 window.parent.postMessage({{type: 'streamlit:setFrameHeight', height: h}}, '*');
             }}
             resizeFrame();
-            new ResizeObserver(resizeFrame).observe(container);
+            new ResizeObserver(() => {{
+                if (!resizePending) {{
+                    resizePending = true;
+                    requestAnimationFrame(resizeFrame);
+                }}
+            }}).observe(container);
         }})();
     </script>
+"""
+
+
+_WHITESPACE_SPLIT = re.compile(r'(\s+)')
+_EDGE_NON_WORD = re.compile(r'^\W+|\W+$')
+
+
+class _WordWrapper(HTMLParser):
+    """
+    Re-emit HTML with every whitespace-separated word wrapped in a span.
+
+    Mirrors the browser-side wrapWords() the renderers used to run on every
+    rerun, and also collects each word's cleaned, lowercased text.
+    """
+
+    def __init__(self, word_class: str):
+        super().__init__(convert_charrefs=True)
+        self.word_class = word_class
+        self.parts = []
+        self.words = []
+
+    def handle_starttag(self, tag, attrs):
+        self.parts.append(self.get_starttag_text())
+
+    def handle_startendtag(self, tag, attrs):
+        self.parts.append(self.get_starttag_text())
+
+    def handle_endtag(self, tag):
+        self.parts.append(f"</{tag}>")
+
+    def handle_comment(self, data):
+        self.parts.append(f"<!--{data}-->")
+
+    def handle_data(self, data):
+        # Leave <script>/<style> bodies and whitespace-only text untouched
+        if self.cdata_elem is not None or not data.strip():
+            self.parts.append(data)
+            return
+
+        # Lowercase the whole text run once; lower() never adds or removes
+        # whitespace, so both splits line up token for token
+        parts = _WHITESPACE_SPLIT.split(data)
+        lowered = _WHITESPACE_SPLIT.split(data.lower())
+
+        for part, lower_part in zip(parts, lowered):
+            if not part:
+                continue
+            if part.isspace():
+                self.parts.append(part)
+                continue
+            self.parts.append(
+                f'<span class="{self.word_class}" data-word-index="{len(self.words)}">'
+                f'{html.escape(part, quote=False)}</span>'
+            )
+            self.words.append(_EDGE_NON_WORD.sub('', lower_part))
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _wrap_words_html(html_content: str, word_class: str) -> tuple:
+    """
+    Wrap each word of html_content in a span of class word_class.
+
+    Returns:
+        Tuple of (wrapped_html, words_json) where words_json is a JSON array
+        whose item i is the cleaned, lowercased text of the span with
+        data-word-index i
+    """
+    wrapper = _WordWrapper(word_class)
+    wrapper.feed(html_content)
+    wrapper.close()
+    return ''.join(wrapper.parts), json.dumps(wrapper.words)
+
+
+@lru_cache(maxsize=256)
+def _dumps_tuple(items: tuple) -> str:
+    """json.dumps for small, frequently repeated lists (passed as tuples)."""
+    return json.dumps(list(items))
+
+
+@lru_cache(maxsize=256)
+def _normalize_target(term: str) -> tuple:
+    """Split a target term into the lowercase words the renderers match against."""
+    return tuple(term.lower().split())
+
+
+def _b64(html_content: str) -> str:
+    """
+    Encode HTML as base64 for embedding in a <script> block.
+
+    Base64 needs no escaping (backticks, ${, </script>), and the browser
+    decodes it natively with atob() + TextDecoder.
+    """
+    return base64.b64encode(html_content.encode('utf-8')).decode('ascii')
+
+
+def _render_signature(html_content: str, highlight_indices: list) -> str:
+    """Short digest of the component args, so the frontend can skip identical reruns."""
+    digest = hashlib.blake2b(html_content.encode('utf-8'), digest_size=8)
+    digest.update(str(highlight_indices).encode('ascii'))
+    return digest.hexdigest()
+
+
+def render_clickable(html_content: str, key: str, highlight_indices: list = None, height: int = 750):
+    """
+    Render text with clickable words and context menu.
+
+    When user clicks words and selects a tool, the component returns a dict
+    with the selected term, tool, and word indices.
+
+    Args:
+        html_content: HTML content to display (from markdown_to_html())
+        key: Unique key for this component instance
+        highlight_indices: List of word indices to highlight initially
+        height: Height of the component in pixels
+
+    Returns:
+        dict or None: If user selected a tool, returns:
+            {'term': str, 'tool': str, 'indices': str, 'ts': int}
+            Otherwise returns None.
+    """
+    highlight_indices = highlight_indices or []
+    result = _clickable_component(
+        html_content=html_content,
+        highlight_indices=highlight_indices,
+        render_sig=_render_signature(html_content, highlight_indices),
+        key=key,
+        height=height,
+        default=None
+    )
+    return result
+
+
+def render_editable_preview(html_content: str, key: str, highlight_indices: list = None, height: int = 750):
+    """
+    Render English text with inline editing support.
+    Double-click any word to edit it directly in the text.
+    Select multiple words (Shift+click) then double-click to edit a phrase.
+
+    Returns:
+        dict or None: If user edited a word, returns:
+            {'action': 'edit', 'oldText': str, 'newText': str, 'wordIndex': int, 'ts': int}
+            Otherwise returns None.
+    """
+    highlight_indices = highlight_indices or []
+    result = _clickable_component(
+        html_content=html_content,
+        highlight_indices=highlight_indices,
+        editable=True,
+        render_sig=_render_signature(html_content, highlight_indices),
+        key=key,
+        height=height,
+        default=None
+    )
+    return result
+
+
+def render_with_highlights(html_content: str, highlight_indices: list, key: str, height: int = 750):
+    """
+    Render text with highlighted words (read-only, for English side).
+
+    Args:
+        html_content: HTML content to display
+        highlight_indices: List of word indices to highlight
+        key: Unique key for this component
+        height: Height of the component in pixels
+    """
+
+    html_code = _build_highlight_html(html_content, tuple(highlight_indices or ()), key)
+    components.html(html_code, height=height, scrolling=True)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _build_highlight_html(html_content: str, highlight_indices: tuple, key: str) -> str:
+    """Assemble the render_with_highlights page (cached across reruns)."""
+    wrapped_html, _ = _wrap_words_html(html_content, 'highlight-word')
+    return _HIGHLIGHT_TMPL.format_map({
+        'key': key,
+        'highlight_json': _dumps_tuple(highlight_indices),
+        'html_b64': _b64(wrapped_html),
+    })
+
+
+def render_replacement_highlight(html_content: str, target_term: str, occurrence_idx: int, total_occurrences: int, key: str, height: int = 750):
+    """
+    Render text with a specific occurrence of a term highlighted in orange for replacement.
+    Auto-scrolls to the highlighted occurrence.
+
+    Args:
+        html_content: HTML content to display (from markdown_to_html())
+        target_term: The term to find and highlight (e.g., "program")
+        occurrence_idx: Which occurrence to highlight (0-based)
+        total_occurrences: Total number of occurrences (for display)
+        key: Unique key for this component
+        height: Height of the component in pixels
+    """
+
+    target_words_json = _dumps_tuple(_normalize_target(target_term))
+
+    wrapped_html, words_json = _wrap_words_html(html_content, 'replace-word')
+
+    html_code = _REPLACE_TMPL.format_map({
+        'key': key,
+        'target_words_json': target_words_json,
+        'occurrence_idx': occurrence_idx,
+        'html_b64': _b64(wrapped_html),
+        'words_json': words_json,
+    })
+
+    components.html(html_code, height=height, scrolling=True)
+
+
+def render_change_highlight(html_content: str, target_term: str, key: str, height: int = 750):
+    """
+    Render text with all occurrences of a newly-replaced term highlighted in green
+    with zoom-in animation and auto-scroll. Used after a replacement is applied
+    to show the user exactly what changed.
+
+    Args:
+        html_content: HTML content to display (from markdown_to_html())
+        target_term: The new term that was just inserted
+        key: Unique key for this component
+        height: Height of the component in pixels
     """
 
+    target_words_json = _dumps_tuple(_normalize_target(target_term))
+
+    wrapped_html, words_json = _wrap_words_html(html_content, 'change-word')
+
+    html_code = _CHANGE_TMPL.format_map({
+        'key': key,
+        'target_words_json': target_words_json,
+        'html_b64': _b64(wrapped_html),
+        'words_json': words_json,
+    })
+
+    components.html(html_code, height=height, scrolling=True)
+
+
+def render_change_highlight_multi(html_content: str, target_terms: list, key: str, height: int = 750):
+    """
+    Render text highlighting multiple different replacement terms in green.
+    Used when the user manually edited different occurrences to different values.
+    """
+
+    # Distinct, non-empty phrases only: duplicates would just be re-tested
+    # at every position where their first word occurs
+    all_targets = tuple(dict.fromkeys(
+        phrase for phrase in map(_normalize_target, target_terms) if phrase
+    ))
+    all_targets_json = _dumps_tuple(all_targets)
+
+    wrapped_html, words_json = _wrap_words_html(html_content, 'mchange-word')
+
+    html_code = _MCHANGE_TMPL.format_map({
+        'key': key,
+        'all_targets_json': all_targets_json,
+        'html_b64': _b64(wrapped_html),
+        'words_json': words_json,
+    })
+
     components.html(html_code, height=height, scrolling=True)
@@ -5,8 +5,36 @@ Reads HTML content from clipboard and converts to markdown.
 """
 
 import re
+from functools import lru_cache
 from markdownify import markdownify as md
 
+# Windows HTML clipboard fragment markers
+_START_FRAGMENT = b'<!--StartFragment-->'
+_END_FRAGMENT = b'<!--EndFragment-->'
+
+_MULTI_BLANK = re.compile(r'\n{3,}')
+
+# Registered clipboard format id for "HTML Format" (resolved on first use)
+_html_format_id = None
+
+
+def _get_html_format(win32clipboard) -> int:
+    """Register the "HTML Format" clipboard format once and reuse its id."""
+    global _html_format_id
+    if _html_format_id is None:
+        _html_format_id = win32clipboard.RegisterClipboardFormat("HTML Format")
+    return _html_format_id
+
+
+def _available_formats(win32clipboard) -> set:
+    """Collect every format on the (already opened) clipboard in one pass."""
+    formats = set()
+    fmt = win32clipboard.EnumClipboardFormats(0)
+    while fmt:
+        formats.add(fmt)
+        fmt = win32clipboard.EnumClipboardFormats(fmt)
+    return formats
+
 
 def get_html_from_clipboard():
     """
@@ -19,56 +47,25 @@ def get_html_from_clipboard():
     try:
         import win32clipboard
 
+        html_format = _get_html_format(win32clipboard)
+
         win32clipboard.OpenClipboard()
         try:
-            # Try to get HTML format first
-            html_format = win32clipboard.RegisterClipboardFormat("HTML Format")
+            formats = _available_formats(win32clipboard)
 
-            if win32clipboard.IsClipboardFormatAvailable(html_format):
+            # Try to get HTML format first
+            if html_format in formats:
                 data = win32clipboard.GetClipboardData(html_format)
 
-                # Windows clipboard HTML has metadata headers, extract just the HTML part
-                if isinstance(data, bytes):
-                    data = data.decode('utf-8', errors='ignore')
-
-                # Extract HTML content between fragment markers
-                # Windows HTML clipboard format includes metadata headers
-                # We want only the actual content between StartFragment and EndFragment
-                start_marker = '<!--StartFragment-->'
-                end_marker = '<!--EndFragment-->'
-
-                start_idx = data.find(start_marker)
-                end_idx = data.find(end_marker)
-
-                if start_idx != -1 and end_idx != -1:
-                    # Extract only the fragment content
-                    html_content = data[start_idx + len(start_marker):end_idx]
-                    return html_content.strip(), None
-                elif start_idx != -1:
-                    # Has start marker but no end
-                    html_content = data[start_idx + len(start_marker):]
-                    return html_content.strip(), None
-                else:
-                    # No markers, try to find body content
-                    body_start = data.find('<body')
-                    if body_start != -1:
-                        body_end = data.find('</body>')
-                        if body_end != -1:
-                            # Extract body tag and find its content
-                            body_tag_end = data.find('>', body_start) + 1
-                            html_content = data[body_tag_end:body_end]
-                            return html_content.strip(), None
-
-                    # Fallback: return all data
-                    return data, None
+                if isinstance(data, str):
+                    data = data.encode('utf-8')
+
+                return _extract_html_fragment(data), None
 
             # If no HTML format, try plain text and inform user
-            if win32clipboard.IsClipboardFormatAvailable(win32clipboard.CF_UNICODETEXT):
-                return None, "Only plain text found in clipboard. Copy from Word to preserve formatting."
-            elif win32clipboard.IsClipboardFormatAvailable(win32clipboard.CF_TEXT):
+            if formats & {win32clipboard.CF_UNICODETEXT, win32clipboard.CF_TEXT}:
                 return None, "Only plain text found in clipboard. Copy from Word to preserve formatting."
-            else:
-                return None, "No text found in clipboard. Please copy text from Word first."
+            return None, "No text found in clipboard. Please copy text from Word first."
 
         finally:
             win32clipboard.CloseClipboard()
@@ -79,10 +76,52 @@ def get_html_from_clipboard():
         return None, f"Error reading clipboard: {str(e)}"
 
 
+def _extract_html_fragment(data: bytes) -> str:
+    """
+    Extract the HTML content from a Windows "HTML Format" clipboard payload.
+
+    The payload has metadata headers; we want only the content between
+    StartFragment and EndFragment. Markers are located on the raw bytes
+    and only the extracted slice is decoded, which avoids decoding and
+    scanning the (often much larger) full payload.
+
+    Args:
+        data: Raw clipboard bytes (UTF-8)
+
+    Returns:
+        str: The HTML fragment
+    """
+    view = memoryview(data)
+
+    start_idx = data.find(_START_FRAGMENT)
+    if start_idx != -1:
+        content_start = start_idx + len(_START_FRAGMENT)
+        end_idx = data.find(_END_FRAGMENT, content_start)
+        if end_idx == -1:
+            # Has start marker but no end
+            end_idx = len(data)
+        return str(view[content_start:end_idx], 'utf-8', 'ignore').strip()
+
+    # No markers, try to find body content
+    body_start = data.find(b'<body')
+    if body_start != -1:
+        body_end = data.find(b'</body>', body_start)
+        if body_end != -1:
+            # Skip past the body tag itself
+            body_tag_end = data.find(b'>', body_start) + 1
+            return str(view[body_tag_end:body_end], 'utf-8', 'ignore').strip()
+
+    # Fallback: return all data
+    return data.decode('utf-8', errors='ignore')
+
+
+@lru_cache(maxsize=16)
 def html_to_markdown(html_content):
     """
     Convert HTML to markdown format.
 
+    Results are memoized so re-converting the same paste skips the parse.
+
     Args:
         html_content: HTML string to convert
 
@@ -98,12 +137,13 @@ def html_to_markdown(html_content):
         heading_style="ATX",
         bullets="-",
         strong_em_symbol="*",
-        strip=['style', 'script']
+        strip=['style', 'script'],
+        bs4_options='lxml'  # C parser; much faster than html.parser on Word HTML
     )
 
     # Clean up the output
     # Remove excessive blank lines
-    markdown = re.sub(r'\n{3,}', '\n\n', markdown)
+    markdown = _MULTI_BLANK.sub('\n\n', markdown)
 
     # Trim whitespace
     markdown = markdown.strip()
@@ -5,17 +5,154 @@ Handles read/write operations for Excel files stored in OneDrive/SharePoint.
 Replacement for Google Sheets client - provides the same interface but works with local Excel files.
 """
 
+import atexit
+import logging
 import os
+import random
+import re
+import sys
+import threading
 import time
+import zipfile
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Optional
-from dotenv import load_dotenv
+from typing import Iterator, List, Optional
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape as xml_escape
 
-from openpyxl import Workbook, load_workbook
-from openpyxl.utils import get_column_letter
+logger = logging.getLogger(__name__)
 
-# Load environment variables
-load_dotenv()
+# openpyxl (which pulls in lxml) and dotenv are imported where they're used,
+# so importing this module doesn't pay for them up front
+
+_DOTENV_LOADED = False
+
+
+def _ensure_env():
+    """Load .env once, the first time a setting is read."""
+    global _DOTENV_LOADED
+    if _DOTENV_LOADED:
+        return
+    from dotenv import load_dotenv
+    load_dotenv()
+    _DOTENV_LOADED = True
+
+# Writable workbooks kept open across calls: {path: [workbook, dirty, disk_signature]}
+# Appends (and unflushed updates) mutate the cached workbook in memory;
+# flush() writes dirty ones to disk.
+_WB_CACHE = {}
+_WB_LOCK = threading.RLock()
+
+# Number of (file, sheet) read results kept in memory by read_sheet()
+READ_CACHE_SIZE = 8
+
+
+def _as_path(file_path) -> Path:
+    """Return file_path as a Path, without re-parsing one that already is."""
+    return file_path if isinstance(file_path, Path) else Path(file_path)
+
+
+def _cell_to_str(value) -> str:
+    """Convert a cell value to a string ("" for empty cells)."""
+    if value is None:
+        return ""
+    if type(value) is str:
+        return value
+    return str(value)
+
+
+class _FastAppendUnsupported(Exception):
+    """Raised when a sheet can't be appended to by patching its XML directly."""
+    pass
+
+
+_NS_MAIN = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_NS_DOC_REL = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+_NS_PKG_REL = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+_LAST_ROW_RE = re.compile(rb'<row [^>]*?\br="(\d+)"')
+_DIMENSION_RE = re.compile(rb'<dimension ref="([A-Z]+)(\d+)(?::([A-Z]+)(\d+))?"')
+
+
+def _sheet_member(zf: zipfile.ZipFile, sheet_name: str) -> str:
+    """Return the zip member name holding a sheet's XML."""
+    workbook = ElementTree.fromstring(zf.read('xl/workbook.xml'))
+    rel_id = None
+    for sheet in workbook.iter(f'{_NS_MAIN}sheet'):
+        if sheet.get('name') == sheet_name:
+            rel_id = sheet.get(f'{_NS_DOC_REL}id')
+            break
+    if rel_id is None:
+        raise _FastAppendUnsupported(f"Sheet not found: {sheet_name}")
+
+    rels = ElementTree.fromstring(zf.read('xl/_rels/workbook.xml.rels'))
+    for rel in rels.iter(f'{_NS_PKG_REL}Relationship'):
+        if rel.get('Id') == rel_id:
+            target = rel.get('Target', '')
+            return target.lstrip('/') if target.startswith('/') else f'xl/{target}'
+    raise _FastAppendUnsupported(f"No relationship for sheet: {sheet_name}")
+
+
+def _splice_rows(src_path: Path, dest_path: Path, sheet_name: str, values: List[List[str]]):
+    """
+    Write a copy of src_path to dest_path with rows appended to one sheet.
+
+    The new rows are inserted as inline-string cells just before
+    </sheetData>; every other zip member is copied unchanged.
+
+    Raises:
+        _FastAppendUnsupported: If the sheet can't be patched safely
+    """
+    from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+    from openpyxl.utils import column_index_from_string, get_column_letter
+
+    with zipfile.ZipFile(src_path) as zf:
+        member = _sheet_member(zf, sheet_name)
+        xml = zf.read(member)
+
+        end = xml.rfind(b'</sheetData>')
+        if end == -1 or b'<mergeCells' in xml or b'<tableParts' in xml:
+            raise _FastAppendUnsupported(f"Sheet layout not supported: {sheet_name}")
+
+        last = None
+        for last in _LAST_ROW_RE.finditer(xml, 0, end):
+            pass
+        if last is None and b'<row' in xml[:end]:
+            raise _FastAppendUnsupported("Rows without explicit row numbers")
+        row_num = int(last.group(1)) if last else 0
+
+        parts = []
+        max_col = 0
+        for row in values:
+            row_num += 1
+            cells = []
+            for col, value in enumerate(row, start=1):
+                text = _cell_to_str(value)
+                if not text:
+                    continue
+                if ILLEGAL_CHARACTERS_RE.search(text):
+                    raise _FastAppendUnsupported("Value contains characters not allowed in XML")
+                cells.append(
+                    f'<c r="{get_column_letter(col)}{row_num}" t="inlineStr">'
+                    f'<is><t xml:space="preserve">{xml_escape(text)}</t></is></c>'
+                )
+                max_col = max(max_col, col)
+            parts.append(f'<row r="{row_num}">{"".join(cells)}</row>')
+
+        xml = xml[:end] + ''.join(parts).encode('utf-8') + xml[end:]
+
+        # Keep the dimension in sync, since read-only readers rely on it
+        dimension = _DIMENSION_RE.search(xml)
+        if dimension:
+            start_col, start_row, end_col, _ = dimension.groups()
+            end_col = end_col or start_col
+            if column_index_from_string(end_col.decode()) < max_col:
+                end_col = get_column_letter(max_col).encode()
+            ref = b'%s%s:%s%d' % (start_col, start_row, end_col, row_num)
+            xml = xml[:dimension.start(1)] + ref + xml[dimension.end() - 1:]
+
+        with zipfile.ZipFile(dest_path, 'w') as out:
+            for info in zf.infolist():
+                out.writestr(info, xml if info.filename == member else zf.read(info))
 
 
 class ExcelFileLockError(Exception):
@@ -36,8 +173,13 @@ class ExcelClient:
 
     def __init__(self):
         """Initialize the Excel client."""
+        _ensure_env()
         self.max_retries = int(os.getenv('EXCEL_MAX_RETRIES', '5'))
         self.retry_delay = float(os.getenv('EXCEL_RETRY_DELAY', '2'))
+        self.max_wait = float(os.getenv('EXCEL_MAX_WAIT', '30'))
+        self._rng = random.Random()
+        # Recent read_sheet results: {(path, sheet, data_only): (disk_signature, rows)}
+        self._read_cache = OrderedDict()
 
     def _is_file_locked(self, file_path: Path) -> bool:
         """
@@ -47,51 +189,151 @@ class ExcelClient:
         On Linux servers, skip the lock file check since no Excel is running locally
         (lock files may be synced from OneDrive and are not relevant).
         """
-        import sys
-
-        # On Linux, only check for OS-level locks (not Excel lock files)
-        if sys.platform != 'win32':
-            if file_path.exists():
-                try:
-                    with open(file_path, 'r+b'):
-                        pass
-                    return False
-                except PermissionError:
-                    return True
-            return False
-
         # Windows: check for Excel lock file
-        lock_file = file_path.parent / f"~${file_path.name}"
-        if lock_file.exists():
-            return True
-
-        # Try to open file exclusively to confirm it's not locked
-        if file_path.exists():
-            try:
-                with open(file_path, 'r+b'):
-                    pass
-                return False
-            except PermissionError:
+        if sys.platform == 'win32':
+            lock_file = file_path.parent / f"~${file_path.name}"
+            if lock_file.exists():
                 return True
 
+        # Try to open the file for writing to confirm it's not locked
+        # (a missing file is not locked)
+        try:
+            fd = os.open(file_path, os.O_RDWR)
+        except FileNotFoundError:
+            return False
+        except PermissionError:
+            return True
+        os.close(fd)
         return False
 
-    def _wait_for_unlock(self, file_path: Path) -> bool:
+    def _acquire(self, file_path: Path):
         """
-        Wait for file to become available with retries.
+        Wait for file to become available, retrying while it is locked.
 
-        Returns:
-            True if file became available, False if still locked after all retries
+        Uses capped exponential backoff with full jitter, so processes
+        contending for the same synced file don't retry in lockstep.
+
+        Raises:
+            ExcelFileLockError: If file is still locked after all retries
         """
+        if not self._is_file_locked(file_path):
+            return
+
         for attempt in range(self.max_retries):
+            base = min(self.retry_delay * (1 << attempt), self.max_wait)
+            wait_time = self._rng.uniform(0, base)
+            logger.debug("File locked, waiting %.1fs... (attempt %d/%d)",
+                         wait_time, attempt + 1, self.max_retries)
+            time.sleep(wait_time)
+
             if not self._is_file_locked(file_path):
-                return True
+                return
 
-            wait_time = self.retry_delay * (attempt + 1)
-            print(f"File locked, waiting {wait_time:.1f}s... (attempt {attempt + 1}/{self.max_retries})")
-            time.sleep(wait_time)
+        raise ExcelFileLockError(
+            f"The file '{file_path.name}' is currently open in Excel. "
+            f"Please close it and try again."
+        )
 
-        return False
+    @staticmethod
+    def _file_signature(file_path: Path) -> tuple:
+        """Return (mtime_ns, size) used to detect changes made outside this process."""
+        stat = file_path.stat()
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _get_workbook(self, file_path: Path):
+        """
+        Get a writable workbook, reusing the cached one if the file is unchanged.
+
+        The cached workbook is reloaded when the file changed on disk
+        (e.g. a SharePoint download) and has no unsaved changes.
+        """
+        key = str(file_path)
+        entry = _WB_CACHE.get(key)
+        if entry is not None:
+            wb, dirty, signature = entry
+            if dirty or signature == self._file_signature(file_path):
+                return wb
+
+        from openpyxl import load_workbook
+
+        wb = load_workbook(file_path)
+        _WB_CACHE[key] = [wb, False, self._file_signature(file_path)]
+        return wb
+
+    def _save_workbook(self, file_path: Path, wb):
+        """Save a cached workbook and record the new on-disk signature."""
+        self._atomic_save(file_path, wb.save)
+        _WB_CACHE[str(file_path)] = [wb, False, self._file_signature(file_path)]
+        self._invalidate_reads(file_path)
+
+    def _atomic_save(self, file_path: Path, write):
+        """
+        Write a file to a temp path next to file_path, then swap it in.
+
+        The destination is only touched by the final os.replace(), so it is
+        never held open (or left half-written) while the workbook serializes.
+
+        Args:
+            file_path: Destination path
+            write: Callable that writes the new file to the path it is given
+
+        Raises:
+            ExcelFileLockError: If the destination stays locked
+        """
+        tmp_path = file_path.with_name(f"{file_path.name}.tmp-{os.getpid()}")
+        try:
+            write(tmp_path)
+            # fsync needs a writable handle on Windows
+            with open(tmp_path, 'r+b') as f:
+                os.fsync(f.fileno())
+
+            try:
+                os.replace(tmp_path, file_path)
+            except PermissionError:
+                # Destination opened by someone else mid-save (Windows)
+                self._acquire(file_path)
+                try:
+                    os.replace(tmp_path, file_path)
+                except PermissionError:
+                    raise ExcelFileLockError(
+                        f"The file '{file_path.name}' is currently open in Excel. "
+                        f"Please close it and try again."
+                    )
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+    def _invalidate_reads(self, file_path: Path):
+        """Drop cached read_sheet results for a file."""
+        with _WB_LOCK:
+            for key in [k for k in self._read_cache if k[0] == str(file_path)]:
+                del self._read_cache[key]
+
+    def flush(self, file_path: Optional[Path] = None):
+        """
+        Write workbooks with pending appends to disk.
+
+        Args:
+            file_path: Only flush this file (flushes all dirty workbooks if None)
+
+        Raises:
+            ExcelFileLockError: If a file is locked and doesn't become available
+        """
+        with _WB_LOCK:
+            if file_path is not None:
+                keys = [str(_as_path(file_path))]
+            else:
+                keys = list(_WB_CACHE)
+
+            for key in keys:
+                entry = _WB_CACHE.get(key)
+                if entry is None or not entry[1]:
+                    continue
+
+                path = Path(key)
+                self._acquire(path)
+
+                self._save_workbook(path, entry[0])
 
     def _ensure_file_exists(self, file_path: Path, sheet_name: str, headers: List[str]):
         """
@@ -108,21 +350,25 @@ class ExcelClient:
         # Ensure parent directory exists
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Create new workbook with headers
-        wb = Workbook()
-        ws = wb.active
-        ws.title = sheet_name
+        from openpyxl import Workbook
+
+        # Create new workbook with headers (write-only: no cell objects needed)
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet(sheet_name)
         ws.append(headers)
         wb.save(file_path)
-        print(f"[OK] Created new Excel file: {file_path}")
+        logger.info("Created new Excel file: %s", file_path)
 
-    def read_sheet(self, file_path: Path, sheet_name: Optional[str] = None) -> List[List[str]]:
+    def read_sheet(self, file_path: Path, sheet_name: Optional[str] = None,
+                   data_only: bool = False) -> List[List[str]]:
         """
         Read all data from an Excel sheet.
 
         Args:
             file_path: Path to the Excel file
             sheet_name: Name of the sheet to read (uses active sheet if None)
+            data_only: Return cached formula results instead of formulas
+                       (the glossary and action log have no formulas)
 
         Returns:
             List of rows, where each row is a list of cell values (as strings)
@@ -131,53 +377,124 @@ class ExcelClient:
             ExcelFileLockError: If file is locked and doesn't become available
             ExcelFileNotFoundError: If file doesn't exist
         """
-        file_path = Path(file_path)
+        file_path = _as_path(file_path)
+
+        if not file_path.exists():
+            raise ExcelFileNotFoundError(f"Excel file not found: {file_path}")
+
+        # Make pending appends visible to the read
+        self.flush(file_path)
+
+        # Serve unchanged files from memory (keyed by on-disk signature)
+        key = (str(file_path), sheet_name, data_only)
+        signature = self._file_signature(file_path)
+        with _WB_LOCK:
+            cached = self._read_cache.get(key)
+            if cached is not None and cached[0] == signature:
+                self._read_cache.move_to_end(key)
+                return list(cached[1])
+
+        values = list(self._open_rows(file_path, sheet_name, data_only))
+
+        with _WB_LOCK:
+            self._read_cache[key] = (signature, tuple(values))
+            self._read_cache.move_to_end(key)
+            while len(self._read_cache) > READ_CACHE_SIZE:
+                self._read_cache.popitem(last=False)
+
+        return values
+
+    def iter_sheet(self, file_path: Path, sheet_name: Optional[str] = None,
+                   data_only: bool = False) -> Iterator[List[str]]:
+        """
+        Iterate over the non-empty rows of an Excel sheet without loading them all.
+
+        The file checks run immediately; rows are read lazily, and the
+        workbook is closed once the iterator is exhausted or discarded.
+
+        Args:
+            file_path: Path to the Excel file
+            sheet_name: Name of the sheet to read (uses active sheet if None)
+            data_only: Return cached formula results instead of formulas
+                       (the glossary and action log have no formulas)
+
+        Returns:
+            Iterator of rows, where each row is a list of cell values (as strings)
+
+        Raises:
+            ExcelFileLockError: If file is locked and doesn't become available
+            ExcelFileNotFoundError: If file doesn't exist
+        """
+        file_path = _as_path(file_path)
 
         if not file_path.exists():
             raise ExcelFileNotFoundError(f"Excel file not found: {file_path}")
 
+        # Make pending appends visible to the read
+        self.flush(file_path)
+
+        return self._open_rows(file_path, sheet_name, data_only)
+
+    def _open_rows(self, file_path: Path, sheet_name: Optional[str],
+                   data_only: bool) -> Iterator[List[str]]:
+        """Open a sheet read-only once the file is free (caller has flushed it)."""
         # Wait for file to be available
-        if self._is_file_locked(file_path):
-            if not self._wait_for_unlock(file_path):
-                raise ExcelFileLockError(
-                    f"The file '{file_path.name}' is currently open in Excel. "
-                    f"Please close it and try again."
-                )
+        self._acquire(file_path)
+
+        from openpyxl import load_workbook
 
         try:
-            wb = load_workbook(file_path, read_only=True, data_only=True)
+            wb = load_workbook(file_path, read_only=True, data_only=data_only)
+        except Exception as e:
+            raise Exception(f"Error reading Excel file: {e}")
 
+        return self._iter_rows(wb, sheet_name)
+
+    @staticmethod
+    def _iter_rows(wb, sheet_name: Optional[str]) -> Iterator[List[str]]:
+        """Yield a read-only workbook's non-empty rows as strings, then close it."""
+        try:
             if sheet_name:
                 if sheet_name not in wb.sheetnames:
-                    wb.close()
-                    return []
+                    return
                 ws = wb[sheet_name]
             else:
                 ws = wb.active
 
-            # Read all rows
-            values = []
-            for row in ws.iter_rows(values_only=True):
-                # Convert None to empty string and all values to strings
-                row_values = [str(cell) if cell is not None else "" for cell in row]
-                # Skip completely empty rows
-                if any(cell.strip() for cell in row_values):
-                    values.append(row_values)
-
-            wb.close()
-            return values
+            # Convert None to "" and non-strings to str, and skip
+            # completely empty rows
+            for row in ws.values:
+                row_values = list(map(_cell_to_str, row))
+                for cell in row_values:
+                    if cell and not cell.isspace():
+                        yield row_values
+                        break
 
         except Exception as e:
             raise Exception(f"Error reading Excel file: {e}")
+        finally:
+            # Read-only workbooks keep the zip archive open until closed
+            wb.close()
 
-    def append_row(self, file_path: Path, sheet_name: str, values: List[List[str]]) -> dict:
+    def append_row(self, file_path: Path, sheet_name: str, values: List[List[str]],
+                   fast_append: bool = False) -> dict:
         """
         Append rows to an Excel sheet.
 
+        Rows are appended to a workbook cached in memory; call flush() to
+        write them to disk (pending appends are also flushed at exit).
+
+        With fast_append=True the rows are instead spliced straight into the
+        sheet XML inside the .xlsx and written immediately, without loading
+        the workbook. This suits append-only files like the action log; it
+        falls back to the normal path when the sheet layout isn't simple
+        enough to patch (merged cells, tables, missing sheet, ...).
+
         Args:
             file_path: Path to the Excel file
             sheet_name: Name of the sheet to append to
             values: List of rows to append, where each row is a list of cell values
+            fast_append: Patch the file directly instead of using openpyxl
 
         Returns:
             Dictionary with update details (rows_added, etc.)
@@ -185,36 +502,51 @@ class ExcelClient:
         Raises:
             ExcelFileLockError: If file is locked
         """
-        file_path = Path(file_path)
+        file_path = _as_path(file_path)
 
         # Wait for file to be available
-        if self._is_file_locked(file_path):
-            if not self._wait_for_unlock(file_path):
-                raise ExcelFileLockError(
-                    f"The file '{file_path.name}' is currently open in Excel. "
-                    f"Please close it and try again."
-                )
+        self._acquire(file_path)
 
         try:
             if not file_path.exists():
                 raise ExcelFileNotFoundError(f"Excel file not found: {file_path}")
 
-            wb = load_workbook(file_path)
+            with _WB_LOCK:
+                entry = _WB_CACHE.get(str(file_path))
+                if fast_append and (entry is None or not entry[1]):
+                    try:
+                        self._atomic_save(
+                            file_path,
+                            lambda tmp_path: _splice_rows(file_path, tmp_path, sheet_name, values)
+                        )
+                    except _FastAppendUnsupported:
+                        pass
+                    else:
+                        # The cached workbook (if any) no longer matches the file
+                        _WB_CACHE.pop(str(file_path), None)
+                        self._invalidate_reads(file_path)
+                        return {
+                            'spreadsheetId': str(file_path),
+                            'updates': {
+                                'updatedRows': len(values)
+                            }
+                        }
+
+                wb = self._get_workbook(file_path)
 
-            if sheet_name not in wb.sheetnames:
-                # Create the sheet if it doesn't exist
-                wb.create_sheet(sheet_name)
+                if sheet_name not in wb.sheetnames:
+                    # Create the sheet if it doesn't exist
+                    wb.create_sheet(sheet_name)
 
-            ws = wb[sheet_name]
+                ws = wb[sheet_name]
 
-            # Append each row
-            rows_added = 0
-            for row in values:
-                ws.append(row)
-                rows_added += 1
+                # Append each row
+                rows_added = 0
+                for row in values:
+                    ws.append(row)
+                    rows_added += 1
 
-            wb.save(file_path)
-            wb.close()
+                _WB_CACHE[str(file_path)][1] = True
 
             return {
                 'spreadsheetId': str(file_path),
@@ -228,7 +560,8 @@ class ExcelClient:
         except Exception as e:
             raise Exception(f"Error appending to Excel file: {e}")
 
-    def update_cell(self, file_path: Path, sheet_name: str, row: int, col: int, value: str) -> dict:
+    def update_cell(self, file_path: Path, sheet_name: str, row: int, col: int, value: str,
+                    flush: bool = True) -> dict:
         """
         Update a specific cell in an Excel sheet.
 
@@ -238,71 +571,52 @@ class ExcelClient:
             row: Row number (1-indexed)
             col: Column number (1-indexed)
             value: New value for the cell
+            flush: Save the file now (False leaves it for the next flush())
 
         Returns:
             Dictionary with update details
         """
-        file_path = Path(file_path)
-
-        # Wait for file to be available
-        if self._is_file_locked(file_path):
-            if not self._wait_for_unlock(file_path):
-                raise ExcelFileLockError(
-                    f"The file '{file_path.name}' is currently open in Excel. "
-                    f"Please close it and try again."
-                )
-
-        try:
-            wb = load_workbook(file_path)
-            ws = wb[sheet_name]
-            ws.cell(row=row, column=col, value=value)
-            wb.save(file_path)
-            wb.close()
-
-            return {
-                'spreadsheetId': str(file_path),
-                'updatedCells': 1
-            }
-
-        except Exception as e:
-            raise Exception(f"Error updating cell: {e}")
+        return self.batch_update(
+            file_path, sheet_name, [{'row': row, 'col': col, 'value': value}], flush=flush
+        )
 
-    def batch_update(self, file_path: Path, sheet_name: str, updates: List[dict]) -> dict:
+    def batch_update(self, file_path: Path, sheet_name: str, updates: List[dict],
+                     flush: bool = True) -> dict:
         """
         Perform multiple update operations in a single file open/save.
 
+        Callers updating cells one at a time can pass flush=False and call
+        flush() once at the end, so the workbook is serialized only once.
+
         Args:
             file_path: Path to the Excel file
             sheet_name: Name of the sheet
             updates: List of update dictionaries with 'row', 'col', and 'value' keys
+            flush: Save the file now (False leaves it for the next flush())
 
         Returns:
             Dictionary with update details
         """
-        file_path = Path(file_path)
+        file_path = _as_path(file_path)
 
         # Wait for file to be available
-        if self._is_file_locked(file_path):
-            if not self._wait_for_unlock(file_path):
-                raise ExcelFileLockError(
-                    f"The file '{file_path.name}' is currently open in Excel. "
-                    f"Please close it and try again."
-                )
+        self._acquire(file_path)
 
         try:
-            wb = load_workbook(file_path)
-            ws = wb[sheet_name]
-
-            cells_updated = 0
-            for update in updates:
-                row = update['row']
-                col = update['col']
-                value = update['value']
-                ws.cell(row=row, column=col, value=value)
-                cells_updated += 1
-
-            wb.save(file_path)
-            wb.close()
+            with _WB_LOCK:
+                wb = self._get_workbook(file_path)
+                ws = wb[sheet_name]
+
+                cells_updated = 0
+                set_cell = ws.cell
+                for update in updates:
+                    set_cell(update['row'], update['col'], update['value'])
+                    cells_updated += 1
+
+                if flush:
+                    self._save_workbook(file_path, wb)
+                else:
+                    _WB_CACHE[str(file_path)][1] = True
 
             return {
                 'spreadsheetId': str(file_path),
@@ -330,9 +644,21 @@ def get_client() -> ExcelClient:
     return _client_instance
 
 
+@atexit.register
+def _flush_on_exit():
+    """Write any pending appends before the process exits."""
+    if not _WB_CACHE:
+        return
+    try:
+        get_client().flush()
+    except Exception as e:
+        logger.error("Failed to flush Excel workbooks: %s", e)
+
+
 # File path helpers
 def get_glossary_path() -> Path:
     """Get the glossary Excel file path from environment."""
+    _ensure_env()
     path = os.getenv('EXCEL_GLOSSARY_PATH', '')
     if not path:
         raise ValueError(
@@ -344,6 +670,7 @@ def get_glossary_path() -> Path:
 
 def get_action_log_path() -> Path:
     """Get the action log Excel file path from environment."""
+    _ensure_env()
     path = os.getenv('EXCEL_ACTION_LOG_PATH', '')
     if not path:
         raise ValueError(
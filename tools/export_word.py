@@ -6,170 +6,199 @@ This allows users to export translated text with formatting preserved.
 """
 
 import re
+from functools import lru_cache
 from io import BytesIO
-from typing import List, Tuple, Optional
-from docx import Document
-from docx.shared import Pt, RGBColor
-from docx.enum.text import WD_COLOR_INDEX
+from typing import TYPE_CHECKING, List, Tuple, Optional
 
+# python-docx (and the lxml it pulls in) is imported where a document is
+# built, so importing this module for parsing stays cheap
+if TYPE_CHECKING:
+    from docx.document import Document
 
-# Map CSS color codes to Word highlight colors
+
+# Document font, set once on the Normal style and inherited by every run
+_FONT_NAME = 'Times New Roman'
+_FONT_SIZE_PT = 12
+
+# Map CSS color codes to Word highlight colors (WD_COLOR_INDEX member names)
 CSS_TO_HIGHLIGHT = {
-    "#FFFF00": WD_COLOR_INDEX.YELLOW,
-    "#00FF00": WD_COLOR_INDEX.BRIGHT_GREEN,
-    "#00FFFF": WD_COLOR_INDEX.TURQUOISE,
-    "#FF00FF": WD_COLOR_INDEX.PINK,
-    "#0000FF": WD_COLOR_INDEX.BLUE,
-    "#FF0000": WD_COLOR_INDEX.RED,
-    "#000080": WD_COLOR_INDEX.DARK_BLUE,
-    "#008080": WD_COLOR_INDEX.TEAL,
-    "#008000": WD_COLOR_INDEX.GREEN,
-    "#800080": WD_COLOR_INDEX.VIOLET,
-    "#800000": WD_COLOR_INDEX.DARK_RED,
-    "#808000": WD_COLOR_INDEX.DARK_YELLOW,
-    "#808080": WD_COLOR_INDEX.GRAY_50,
-    "#C0C0C0": WD_COLOR_INDEX.GRAY_25,
+    "#FFFF00": "YELLOW",
+    "#00FF00": "BRIGHT_GREEN",
+    "#00FFFF": "TURQUOISE",
+    "#FF00FF": "PINK",
+    "#0000FF": "BLUE",
+    "#FF0000": "RED",
+    "#000080": "DARK_BLUE",
+    "#008080": "TEAL",
+    "#008000": "GREEN",
+    "#800080": "VIOLET",
+    "#800000": "DARK_RED",
+    "#808000": "DARK_YELLOW",
+    "#808080": "GRAY_50",
+    "#C0C0C0": "GRAY_25",
+}
+
+
+@lru_cache(maxsize=1)
+def _highlight_lookup() -> dict:
+    """
+    Resolve CSS_TO_HIGHLIGHT to WD_COLOR_INDEX values, also keyed by
+    lowercase codes so the usual spellings need no .upper().
+    """
+    from docx.enum.text import WD_COLOR_INDEX
+
+    lookup = {}
+    for css, name in CSS_TO_HIGHLIGHT.items():
+        lookup[css] = lookup[css.lower()] = getattr(WD_COLOR_INDEX, name)
+    return lookup
+
+# Segment formatting flags (combined into one int per segment)
+BOLD = 1
+ITALIC = 2
+UNDERLINE = 4
+STRIKE = 8
+
+# Flags set by the on/off format patterns in _FORMAT_PATTERNS
+_FORMAT_FLAGS = {
+    'strike': STRIKE,
+    'underline': UNDERLINE,
+    'bold_italic': BOLD | ITALIC,
+    'bold': BOLD,
+    'italic': ITALIC,
 }
 
 
+@lru_cache(maxsize=256)
 def _hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
     """Convert hex color string to RGB tuple."""
     hex_color = hex_color.lstrip('#')
     return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
 
 
+# Unmatched markdown markers left over after parsing, removed in this order
+_STRIP_PATTERNS = [
+    re.compile(r'\*+'),                   # bold/italic asterisks
+    re.compile(r'\+\+'),                  # underline
+    re.compile(r'~~'),                    # strikethrough
+    re.compile(r'=='),                    # highlight
+    re.compile(r'::#[A-Fa-f0-9]{6}:'),    # color opener (::COLOR:)
+    re.compile(r'::'),                    # color closer
+]
+
+# Formatting markers recognized by _parse_formatted_text(), with the literal
+# each one needs so patterns that cannot match are skipped without a search.
+# Order matters: process longer/more specific patterns first
+_FORMAT_PATTERNS = [
+    # Colored highlight: ==#COLOR:text==
+    (re.compile(r'==(#[A-Fa-f0-9]{6}):(.+?)==', re.DOTALL), 'highlight_color', '=='),
+    # Simple highlight: ==text==
+    (re.compile(r'==(.+?)==', re.DOTALL), 'highlight', '=='),
+    # Colored text: ::COLOR:text::
+    (re.compile(r'::(#[A-Fa-f0-9]{6}):(.+?)::', re.DOTALL), 'color', '::'),
+    # Strikethrough: ~~text~~
+    (re.compile(r'~~(.+?)~~', re.DOTALL), 'strike', '~~'),
+    # Underline: ++text++
+    (re.compile(r'\+\+(.+?)\+\+', re.DOTALL), 'underline', '++'),
+    # Bold and italic: ***text***
+    (re.compile(r'\*\*\*(.+?)\*\*\*', re.DOTALL), 'bold_italic', '***'),
+    # Bold: **text**
+    (re.compile(r'\*\*(.+?)\*\*', re.DOTALL), 'bold', '**'),
+    # Italic: *text* (not preceded/followed by *)
+    (re.compile(r'(?<!\*)\*(.+?)\*(?!\*)', re.DOTALL), 'italic', '*'),
+]
+
+
 def _strip_remaining_markers(text: str) -> str:
     """
     Strip any remaining unmatched markdown markers from text.
     This is a cleanup step for markers that weren't matched by the parser.
     """
-    # Remove sequences of asterisks (bold/italic markers)
-    text = re.sub(r'\*+', '', text)
-    # Remove underline markers
-    text = re.sub(r'\+\+', '', text)
-    # Remove strikethrough markers
-    text = re.sub(r'~~', '', text)
-    # Remove highlight markers
-    text = re.sub(r'==', '', text)
-    # Remove color markers (::COLOR: or just ::)
-    text = re.sub(r'::#[A-Fa-f0-9]{6}:', '', text)
-    text = re.sub(r'::', '', text)
+    # Most segments have no leftover markers; skip the substitutions for them
+    if not ('*' in text or '++' in text or '~~' in text or '==' in text or '::' in text):
+        return text
+
+    for pattern in _STRIP_PATTERNS:
+        text = pattern.sub('', text)
     return text
 
 
-def _parse_formatted_text(text: str) -> List[dict]:
+def _parse_formatted_text(text: str) -> List[Tuple[str, int, Optional[str], Optional[str]]]:
     """
     Parse markdown-formatted text into a list of text segments with formatting info.
 
-    Each segment is a dict with:
+    Each segment is a (text, flags, highlight, color) tuple:
     - text: The actual text content
-    - bold: bool
-    - italic: bool
-    - underline: bool
-    - strikethrough: bool
+    - flags: BOLD | ITALIC | UNDERLINE | STRIKE bitmask
     - highlight: Optional[str] - hex color or None
     - color: Optional[str] - hex color or None
     """
-    segments = []
-
-    # Pattern to match all formatting markers
-    # Order matters: process longer/more specific patterns first
-    patterns = [
-        # Colored highlight: ==#COLOR:text==
-        (r'==(#[A-Fa-f0-9]{6}):(.+?)==', 'highlight_color'),
-        # Simple highlight: ==text==
-        (r'==(.+?)==', 'highlight'),
-        # Colored text: ::COLOR:text::
-        (r'::(#[A-Fa-f0-9]{6}):(.+?)::', 'color'),
-        # Strikethrough: ~~text~~
-        (r'~~(.+?)~~', 'strike'),
-        # Underline: ++text++
-        (r'\+\+(.+?)\+\+', 'underline'),
-        # Bold and italic: ***text***
-        (r'\*\*\*(.+?)\*\*\*', 'bold_italic'),
-        # Bold: **text**
-        (r'\*\*(.+?)\*\*', 'bold'),
-        # Italic: *text* (not preceded/followed by *)
-        (r'(?<!\*)\*(.+?)\*(?!\*)', 'italic'),
-    ]
-
-    def parse_segment(text: str, inherited_format: dict = None) -> List[dict]:
+    def parse_segment(text: str, flags: int = 0, highlight: Optional[str] = None,
+                      color: Optional[str] = None) -> list:
         """Recursively parse text and extract formatted segments."""
-        if inherited_format is None:
-            inherited_format = {
-                'bold': False,
-                'italic': False,
-                'underline': False,
-                'strikethrough': False,
-                'highlight': None,
-                'color': None
-            }
-
         result = []
 
         # Try each pattern
-        for pattern, format_type in patterns:
-            match = re.search(pattern, text, re.DOTALL)
+        for pattern, format_type, literal in _FORMAT_PATTERNS:
+            if literal not in text:
+                continue
+            match = pattern.search(text)
             if match:
                 # Get text before the match
                 before = text[:match.start()]
                 if before:
-                    result.extend(parse_segment(before, inherited_format.copy()))
+                    result.extend(parse_segment(before, flags, highlight, color))
 
                 # Create format for matched content
-                new_format = inherited_format.copy()
+                new_flags, new_highlight, new_color = flags, highlight, color
 
                 if format_type == 'highlight_color':
-                    new_format['highlight'] = match.group(1)
+                    new_highlight = match.group(1)
                     inner_text = match.group(2)
                 elif format_type == 'highlight':
-                    new_format['highlight'] = '#FFFF00'  # Default yellow
+                    new_highlight = '#FFFF00'  # Default yellow
                     inner_text = match.group(1)
                 elif format_type == 'color':
-                    new_format['color'] = match.group(1)
+                    new_color = match.group(1)
                     inner_text = match.group(2)
-                elif format_type == 'strike':
-                    new_format['strikethrough'] = True
-                    inner_text = match.group(1)
-                elif format_type == 'underline':
-                    new_format['underline'] = True
-                    inner_text = match.group(1)
-                elif format_type == 'bold_italic':
-                    new_format['bold'] = True
-                    new_format['italic'] = True
-                    inner_text = match.group(1)
-                elif format_type == 'bold':
-                    new_format['bold'] = True
-                    inner_text = match.group(1)
-                elif format_type == 'italic':
-                    new_format['italic'] = True
-                    inner_text = match.group(1)
                 else:
+                    new_flags |= _FORMAT_FLAGS[format_type]
                     inner_text = match.group(1)
 
                 # Recursively parse inner text (for nested formatting)
-                result.extend(parse_segment(inner_text, new_format))
+                result.extend(parse_segment(inner_text, new_flags, new_highlight, new_color))
 
                 # Get text after the match
                 after = text[match.end():]
                 if after:
-                    result.extend(parse_segment(after, inherited_format.copy()))
+                    result.extend(parse_segment(after, flags, highlight, color))
 
                 return result
 
         # No patterns matched - return plain text segment
         if text:
-            result.append({
-                'text': text,
-                **inherited_format
-            })
+            result.append((text, flags, highlight, color))
 
         return result
 
     return parse_segment(text)
 
 
-def _add_formatted_text_to_doc(doc: Document, text: str) -> None:
+def _iter_paragraphs(text: str):
+    """
+    Yield the blank-line separated paragraphs of text, like text.split('\\n\\n'),
+    without building the whole list of paragraph strings up front.
+    """
+    start = 0
+    while True:
+        end = text.find('\n\n', start)
+        if end == -1:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 2
+
+
+def _add_formatted_text_to_doc(doc: 'Document', text: str) -> None:
     """
     Add markdown-formatted text to a Word document.
 
@@ -177,10 +206,12 @@ def _add_formatted_text_to_doc(doc: Document, text: str) -> None:
         doc: The Document object to add text to
         text: Markdown-formatted text
     """
-    # Split text into paragraphs
-    paragraphs = text.split('\n\n')
+    from docx.enum.text import WD_COLOR_INDEX
+    from docx.shared import RGBColor
+
+    highlights = _highlight_lookup()
 
-    for para_text in paragraphs:
+    for para_text in _iter_paragraphs(text):
         if not para_text.strip():
             doc.add_paragraph()
             continue
@@ -194,42 +225,38 @@ def _add_formatted_text_to_doc(doc: Document, text: str) -> None:
             # Parse the line into formatted segments
             segments = _parse_formatted_text(line)
 
-            for segment in segments:
+            for seg_text, flags, highlight, color in segments:
                 # Clean any remaining unmatched markers from the text
-                clean_text = _strip_remaining_markers(segment['text'])
+                clean_text = _strip_remaining_markers(seg_text)
                 if not clean_text:
                     continue  # Skip empty segments
+                # Font (Times New Roman 12pt) is inherited from the Normal style
                 run = para.add_run(clean_text)
 
-                # Set font for this run (Times New Roman 12pt)
-                run.font.name = 'Times New Roman'
-                run.font.size = Pt(12)
-
                 # Apply formatting
-                if segment.get('bold'):
+                if flags & BOLD:
                     run.bold = True
 
-                if segment.get('italic'):
+                if flags & ITALIC:
                     run.italic = True
 
-                if segment.get('underline'):
+                if flags & UNDERLINE:
                     run.underline = True
 
-                if segment.get('strikethrough'):
+                if flags & STRIKE:
                     run.font.strike = True
 
-                if segment.get('highlight'):
-                    hex_color = segment['highlight'].upper()
+                if highlight:
                     # Try to use Word's built-in highlight colors
-                    if hex_color in CSS_TO_HIGHLIGHT:
-                        run.font.highlight_color = CSS_TO_HIGHLIGHT[hex_color]
-                    else:
-                        # For non-standard colors, use yellow as fallback
-                        run.font.highlight_color = WD_COLOR_INDEX.YELLOW
+                    highlight_color = highlights.get(highlight)
+                    if highlight_color is None:
+                        # Mixed case, or a non-standard color (yellow fallback)
+                        highlight_color = highlights.get(highlight.upper(), WD_COLOR_INDEX.YELLOW)
+                    run.font.highlight_color = highlight_color
 
-                if segment.get('color'):
+                if color:
                     try:
-                        r, g, b = _hex_to_rgb(segment['color'])
+                        r, g, b = _hex_to_rgb(color)
                         run.font.color.rgb = RGBColor(r, g, b)
                     except:
                         pass  # Keep default color if conversion fails
@@ -257,12 +284,16 @@ def export_to_word(french_text: str, english_text: str = None, filename: str = "
     Returns:
         BytesIO object containing the Word document in Times New Roman 12pt
     """
+    from docx import Document
+    from docx.enum.text import WD_COLOR_INDEX
+    from docx.shared import Pt
+
     doc = Document()
 
     # Set default font for the document
     style = doc.styles['Normal']
-    style.font.name = 'Times New Roman'
-    style.font.size = Pt(12)
+    style.font.name = _FONT_NAME
+    style.font.size = Pt(_FONT_SIZE_PT)
 
     # Add French text section
     _add_formatted_text_to_doc(doc, french_text)
@@ -275,8 +306,6 @@ def export_to_word(french_text: str, english_text: str = None, filename: str = "
         # Add purple-highlighted asterisk separator
         separator_para = doc.add_paragraph()
         separator_run = separator_para.add_run('*' * 50)
-        separator_run.font.name = 'Times New Roman'
-        separator_run.font.size = Pt(12)
         separator_run.font.highlight_color = WD_COLOR_INDEX.VIOLET
 
         # Add empty paragraph after separator
@@ -301,18 +330,18 @@ def get_formatted_text_preview(text: str) -> str:
     segments = _parse_formatted_text(text)
 
     formats_found = set()
-    for seg in segments:
-        if seg.get('bold'):
+    for _, flags, highlight, color in segments:
+        if flags & BOLD:
             formats_found.add('bold')
-        if seg.get('italic'):
+        if flags & ITALIC:
             formats_found.add('italic')
-        if seg.get('underline'):
+        if flags & UNDERLINE:
             formats_found.add('underline')
-        if seg.get('strikethrough'):
+        if flags & STRIKE:
             formats_found.add('strikethrough')
-        if seg.get('highlight'):
+        if highlight:
             formats_found.add('highlight')
-        if seg.get('color'):
+        if color:
             formats_found.add('colored text')
 
     if formats_found:
@@ -335,23 +364,23 @@ This has ::FF0000:red text:: and ==#00FF00:green highlight==."""
 
     segments = _parse_formatted_text(test_text)
     print("\nParsed segments:")
-    for seg in segments:
+    for seg_text, flags, highlight, color in segments:
         formatting = []
-        if seg.get('bold'):
+        if flags & BOLD:
             formatting.append('B')
-        if seg.get('italic'):
+        if flags & ITALIC:
             formatting.append('I')
-        if seg.get('underline'):
+        if flags & UNDERLINE:
             formatting.append('U')
-        if seg.get('strikethrough'):
+        if flags & STRIKE:
             formatting.append('S')
-        if seg.get('highlight'):
-            formatting.append(f'H:{seg["highlight"]}')
-        if seg.get('color'):
-            formatting.append(f'C:{seg["color"]}')
+        if highlight:
+            formatting.append(f'H:{highlight}')
+        if color:
+            formatting.append(f'C:{color}')
 
         format_str = ','.join(formatting) if formatting else 'plain'
-        print(f"  [{format_str}] '{seg['text']}'")
+        print(f"  [{format_str}] '{seg_text}'")
 
     print("\n" + "-" * 50)
     print(get_formatted_text_preview(test_text))
@@ -7,11 +7,19 @@ and caches results for performance.
 
 import os
 import json
-from datetime import datetime, timedelta
+import mmap
+import tempfile
+import time
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json is used when orjson isn't installed
+    orjson = None
+
 from tools.excel_client import get_client, get_glossary_path, ensure_glossary_exists
 
 # Load environment variables
@@ -21,6 +29,22 @@ load_dotenv()
 CACHE_FILE = Path(__file__).parent.parent / '.tmp' / 'cached_glossary.json'
 CACHE_TTL_MINUTES = int(os.getenv('CACHE_TTL_MINUTES', '5'))
 GLOSSARY_SHEET_NAME = os.getenv('GLOSSARY_SHEET_NAME', 'Glossary')
+MMAP_MIN_BYTES = 256 * 1024  # Smaller cache files are cheaper to read() than to map
+
+# Column A header values that mark the first row as a header row
+_HEADER_SYNONYMS = frozenset({'french term', 'terme français', 'french'})
+
+# In-process copy of the last loaded glossary, reused within the TTL as long
+# as the disk cache file hasn't been rewritten or removed since
+_MEM_CACHE_DATA: Optional[Dict[str, str]] = None
+_MEM_CACHE_TS: float = 0.0
+_MEM_CACHE_MTIME: Optional[float] = None
+
+_glossary_ensured = False  # Reset if a fetch fails, e.g. the file was removed
+
+# After a failed fetch, serve the stale cache for this long instead of retrying
+FAIL_BACKOFF_SECONDS = 30.0
+_last_fail_ts: Optional[float] = None
 
 
 def fetch_glossary(force_refresh: bool = False) -> Dict[str, str]:
@@ -42,6 +66,8 @@ def fetch_glossary(force_refresh: bool = False) -> Dict[str, str]:
         ValueError: If EXCEL_GLOSSARY_PATH is not set in .env
         Exception: If Excel file read fails
     """
+    global _glossary_ensured, _last_fail_ts
+
     # Check if glossary path is configured
     try:
         glossary_path = get_glossary_path()
@@ -50,11 +76,23 @@ def fetch_glossary(force_refresh: bool = False) -> Dict[str, str]:
 
     # Try to load from cache first (if not force refreshing)
     if not force_refresh:
+        if (_MEM_CACHE_DATA is not None
+                and time.monotonic() - _MEM_CACHE_TS < CACHE_TTL_MINUTES * 60
+                and _cache_mtime() == _MEM_CACHE_MTIME):
+            return _MEM_CACHE_DATA
+
         cached_glossary, cache_valid = _load_from_cache()
         if cache_valid and cached_glossary is not None:
             print(f"[OK] Loaded glossary from cache ({len(cached_glossary)} terms)")
+            _remember(cached_glossary)
             return cached_glossary
 
+        # A fetch failed moments ago: don't wait on the same failure again
+        if _last_fail_ts is not None and time.monotonic() - _last_fail_ts < FAIL_BACKOFF_SECONDS:
+            cached_glossary, _ = _load_from_cache(allow_expired=True)
+            if cached_glossary:
+                return cached_glossary
+
     # Fetch fresh data from Excel file
     print("Fetching glossary from Excel file...")
     try:
@@ -66,8 +104,10 @@ def fetch_glossary(force_refresh: bool = False) -> Dict[str, str]:
                 print("Syncing glossary from SharePoint...")
                 download_glossary(str(glossary_path))
 
-        # Ensure file exists (creates with headers if not)
-        ensure_glossary_exists()
+        # Ensure file exists (creates with headers if not), once per process
+        if not _glossary_ensured:
+            ensure_glossary_exists()
+            _glossary_ensured = True
 
         client = get_client()
         values = client.read_sheet(glossary_path, GLOSSARY_SHEET_NAME)
@@ -76,13 +116,13 @@ def fetch_glossary(force_refresh: bool = False) -> Dict[str, str]:
             print("Warning: No data found in glossary file")
             return {}
 
-        # Parse into dictionary (skip header row)
-        glossary = {}
-        for i, row in enumerate(values):
-            # Skip header row
-            if i == 0 and len(row) > 0 and row[0].lower() in ['french term', 'terme français', 'french']:
-                continue
+        # Skip header row once, outside the parse loop
+        if values[0] and values[0][0].lower() in _HEADER_SYNONYMS:
+            values = values[1:]
 
+        # Parse into dictionary
+        glossary = {}
+        for row in values:
             # Skip if row is empty or has less than 2 columns
             if len(row) < 2:
                 continue
@@ -99,15 +139,19 @@ def fetch_glossary(force_refresh: bool = False) -> Dict[str, str]:
 
         # Save to cache
         _save_to_cache(glossary)
+        _remember(glossary)
 
+        _last_fail_ts = None
         print(f"[OK] Fetched {len(glossary)} terms from Excel file")
         return glossary
 
     except Exception as e:
+        _glossary_ensured = False
+        _last_fail_ts = time.monotonic()
         print(f"[ERROR] Error fetching glossary: {e}")
 
         # Try to fall back to cached data even if expired
-        cached_glossary, _ = _load_from_cache()
+        cached_glossary, _ = _load_from_cache(allow_expired=True)
         if cached_glossary:
             print(f"[WARNING] Using expired cache ({len(cached_glossary)} terms)")
             return cached_glossary
@@ -115,27 +159,48 @@ def fetch_glossary(force_refresh: bool = False) -> Dict[str, str]:
         raise
 
 
-def _load_from_cache() -> Tuple[Optional[Dict[str, str]], bool]:
+def _cache_mtime() -> Optional[float]:
+    """Return the disk cache file's mtime, or None if it doesn't exist."""
+    try:
+        return CACHE_FILE.stat().st_mtime
+    except FileNotFoundError:
+        return None
+
+
+def _remember(glossary: Dict[str, str]):
+    """Keep a loaded glossary in memory, tied to the current disk cache file."""
+    global _MEM_CACHE_DATA, _MEM_CACHE_TS, _MEM_CACHE_MTIME
+    _MEM_CACHE_DATA = glossary
+    _MEM_CACHE_TS = time.monotonic()
+    _MEM_CACHE_MTIME = _cache_mtime()
+
+
+def _load_from_cache(allow_expired: bool = False) -> Tuple[Optional[Dict[str, str]], bool]:
     """
     Load glossary from cache file.
 
+    The cache age comes from the file's mtime, so an expired cache is
+    detected with a single stat() and isn't parsed unless allow_expired.
+
+    Args:
+        allow_expired: Also return the glossary when the cache has expired
+
     Returns:
         Tuple of (glossary_dict, is_valid)
         - glossary_dict: The cached glossary or None if cache doesn't exist
         - is_valid: True if cache exists and is not expired
     """
-    if not CACHE_FILE.exists():
-        return None, False
-
     try:
-        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
-            cache_data = json.load(f)
+        cache_age = time.time() - CACHE_FILE.stat().st_mtime
+    except FileNotFoundError:
+        return None, False
 
-        # Check if cache is expired
-        cached_time = datetime.fromisoformat(cache_data['timestamp'])
-        cache_age = datetime.now() - cached_time
+    is_valid = cache_age < CACHE_TTL_MINUTES * 60
+    if not is_valid and not allow_expired:
+        return None, False
 
-        is_valid = cache_age < timedelta(minutes=CACHE_TTL_MINUTES)
+    try:
+        cache_data = _read_cache_file()
 
         return cache_data['glossary'], is_valid
 
@@ -144,6 +209,34 @@ def _load_from_cache() -> Tuple[Optional[Dict[str, str]], bool]:
         return None, False
 
 
+def _read_cache_file() -> dict:
+    """
+    Parse the cache file.
+
+    Large files are memory-mapped and handed to orjson as a buffer, so the
+    raw JSON isn't first copied onto the Python heap.
+    """
+    with open(CACHE_FILE, 'rb') as f:
+        if orjson is None or os.fstat(f.fileno()).st_size <= MMAP_MIN_BYTES:
+            return _json_loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as buf:
+            return orjson.loads(buf)
+
+
+def _json_loads(data: bytes):
+    """Parse JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to UTF-8 JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
 def _save_to_cache(glossary: Dict[str, str]):
     """
     Save glossary to cache file.
@@ -161,8 +254,20 @@ def _save_to_cache(glossary: Dict[str, str]):
             'term_count': len(glossary)
         }
 
-        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(cache_data, f, ensure_ascii=False, indent=2)
+        # One write to a temp file, then an atomic rename, so concurrent
+        # readers never see a partially written cache. mkstemp gives every
+        # writer its own file (Streamlit sessions are threads of one process)
+        fd, tmp_name = tempfile.mkstemp(dir=CACHE_FILE.parent, prefix=f"{CACHE_FILE.name}.tmp-")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_json_dumps(cache_data))
+            os.replace(tmp_name, CACHE_FILE)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
 
         print(f"[OK] Saved glossary to cache")
 
@@ -175,6 +280,9 @@ def invalidate_cache():
     Delete the cache file to force a fresh fetch on next request.
     Used when glossary is updated.
     """
+    global _MEM_CACHE_DATA, _MEM_CACHE_TS, _MEM_CACHE_MTIME
+    _MEM_CACHE_DATA, _MEM_CACHE_TS, _MEM_CACHE_MTIME = None, 0.0, None
+
     if CACHE_FILE.exists():
         CACHE_FILE.unlink()
         print("[OK] Cache invalidated")
@@ -196,19 +304,18 @@ def get_glossary_stats() -> dict:
         }
 
     try:
-        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
-            cache_data = json.load(f)
+        mtime = CACHE_FILE.stat().st_mtime
+        cache_data = _read_cache_file()
 
-        cached_time = datetime.fromisoformat(cache_data['timestamp'])
-        cache_age = datetime.now() - cached_time
-        is_valid = cache_age < timedelta(minutes=CACHE_TTL_MINUTES)
+        cache_age = time.time() - mtime
+        is_valid = cache_age < CACHE_TTL_MINUTES * 60
 
         return {
             'cached': True,
             'term_count': cache_data['term_count'],
-            'last_updated': cached_time.strftime('%Y-%m-%d %H:%M:%S'),
+            'last_updated': datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M:%S'),
             'cache_valid': is_valid,
-            'cache_age_minutes': int(cache_age.total_seconds() / 60)
+            'cache_age_minutes': int(cache_age / 60)
         }
 
     except Exception as e:
@@ -5,71 +5,116 @@ Handles authentication and CRUD operations for Google Sheets.
 Used for glossary retrieval, action logging, and glossary updates.
 """
 
+import json
 import os
 import pickle
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import List, Optional
 
+import google_auth_httplib2
+import httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json is used when orjson isn't installed
+    orjson = None
+
 # If modifying these scopes, delete token.json
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
+HTTP_TIMEOUT_SECONDS = 30
+
+
+class SheetRangeNotFound(Exception):
+    """Raised when a requested range (or tab) does not exist in the spreadsheet."""
+    pass
+
+
+def _is_range_error(error: HttpError) -> bool:
+    """Return True if the API rejected the request because the range is invalid."""
+    if error.resp.status != 400:
+        return False
+    try:
+        status = json.loads(error.content)['error']['status']
+    except (ValueError, KeyError, TypeError):
+        return False
+    return status == 'INVALID_ARGUMENT'
+
+
+@lru_cache(maxsize=1)
+def _load_creds() -> Credentials:
+    """
+    Load OAuth 2.0 credentials once per process.
+
+    Uses credentials.json for OAuth flow and stores token in token.json.
+    Token is automatically refreshed when expired.
+    """
+    project_root = Path(__file__).parent.parent
+    token_path = project_root / 'token.json'
+    credentials_path = project_root / 'credentials.json'
+
+    creds = None
+
+    # Load existing token if available
+    if token_path.exists():
+        raw = token_path.read_bytes()
+        info = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        creds = Credentials.from_authorized_user_info(info, SCOPES)
+
+    # If no valid credentials, authenticate
+    if not creds or not creds.valid:
+        if creds and creds.expired and creds.refresh_token:
+            # Refresh expired token
+            creds.refresh(Request())
+        else:
+            # Run OAuth flow
+            if not credentials_path.exists():
+                raise FileNotFoundError(
+                    f"credentials.json not found at {credentials_path}. "
+                    "Please download it from Google Cloud Console."
+                )
+
+            flow = InstalledAppFlow.from_client_secrets_file(
+                str(credentials_path), SCOPES
+            )
+            creds = flow.run_local_server(port=0)
+
+        # Save the credentials for next run
+        with open(token_path, 'w') as token:
+            token.write(creds.to_json())
+
+    return creds
 
 
 class GoogleSheetsClient:
     """
     Google Sheets API client with authentication and basic operations.
+
+    Authentication is deferred until the first API call.
     """
 
-    def __init__(self):
-        """Initialize the Google Sheets client with authentication."""
-        self.creds = None
-        self.service = None
-        self._authenticate()
+    @property
+    def creds(self) -> Credentials:
+        """OAuth credentials, loaded on first use."""
+        return _load_creds()
 
-    def _authenticate(self):
+    @cached_property
+    def service(self):
         """
-        Authenticate with Google Sheets API using OAuth 2.0.
+        Sheets API resource, built on first use.
 
-        Uses credentials.json for OAuth flow and stores token in token.json.
-        Token is automatically refreshed when expired.
+        All requests go through one authorized keep-alive connection, and the
+        bundled discovery document is used instead of fetching it per process.
         """
-        project_root = Path(__file__).parent.parent
-        token_path = project_root / 'token.json'
-        credentials_path = project_root / 'credentials.json'
-
-        # Load existing token if available
-        if token_path.exists():
-            self.creds = Credentials.from_authorized_user_file(str(token_path), SCOPES)
-
-        # If no valid credentials, authenticate
-        if not self.creds or not self.creds.valid:
-            if self.creds and self.creds.expired and self.creds.refresh_token:
-                # Refresh expired token
-                self.creds.refresh(Request())
-            else:
-                # Run OAuth flow
-                if not credentials_path.exists():
-                    raise FileNotFoundError(
-                        f"credentials.json not found at {credentials_path}. "
-                        "Please download it from Google Cloud Console."
-                    )
-
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    str(credentials_path), SCOPES
-                )
-                self.creds = flow.run_local_server(port=0)
-
-            # Save the credentials for next run
-            with open(token_path, 'w') as token:
-                token.write(self.creds.to_json())
-
-        # Build the service
-        self.service = build('sheets', 'v4', credentials=self.creds)
+        http = google_auth_httplib2.AuthorizedHttp(
+            self.creds, http=httplib2.Http(timeout=HTTP_TIMEOUT_SECONDS)
+        )
+        return build('sheets', 'v4', http=http, cache_discovery=False, static_discovery=True)
 
     def read_sheet(self, sheet_id: str, range_name: str) -> List[List[str]]:
         """
@@ -83,7 +128,8 @@ class GoogleSheetsClient:
             List of rows, where each row is a list of cell values
 
         Raises:
-            HttpError: If the API request fails
+            SheetRangeNotFound: If the range or tab doesn't exist
+            HttpError: If the API request fails for any other reason
         """
         try:
             result = self.service.spreadsheets().values().get(
@@ -95,6 +141,8 @@ class GoogleSheetsClient:
             return values
 
         except HttpError as error:
+            if _is_range_error(error):
+                raise SheetRangeNotFound(f"Range not found: {range_name}") from error
             print(f"Error reading sheet: {error}")
             raise
 
@@ -225,6 +273,7 @@ if __name__ == "__main__":
     print("Testing Google Sheets Client...")
     try:
         client = get_client()
+        client.service  # Authenticates on first access
         print("[OK] Authentication successful!")
         print("[OK] Google Sheets client ready to use")
     except Exception as e:
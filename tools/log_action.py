@@ -2,11 +2,20 @@
 Action Logger
 
 Logs term-checking actions to an Excel file for tracking and analysis.
+
+Actions are first written to a local SQLite database (fast, no file locks),
+then a background thread drains unsynced rows to the Excel Action Log in
+chunks so callers never wait on OneDrive/SharePoint file I/O.
 """
 
+import atexit
 import os
+import sqlite3
+import threading
+import time
 from datetime import datetime
-from typing import Optional
+from pathlib import Path
+from typing import List, Optional
 from dotenv import load_dotenv
 
 from tools.excel_client import get_client, get_action_log_path, ensure_action_log_exists
@@ -16,6 +25,203 @@ load_dotenv()
 
 # Configuration
 ACTION_LOG_SHEET_NAME = os.getenv('ACTION_LOG_SHEET_NAME', 'Action Log')
+ACTION_LOG_DB_PATH = Path(os.getenv(
+    'ACTION_LOG_DB_PATH',
+    str(Path.home() / '.psp_translator' / 'actions.db')
+))
+SYNC_BATCH_SIZE = 100
+SYNC_INTERVAL_SECONDS = 5
+# A batch claimed for syncing longer ago than this (e.g. its worker was
+# killed mid-write) is handed out again
+SYNC_CLAIM_TIMEOUT_SECONDS = 300
+
+_db_conn = None
+_db_lock = threading.Lock()
+_sync_lock = threading.Lock()
+_sync_thread = None
+_sync_event = threading.Event()
+_unsynced_since_wake = 0
+_action_log_ensured = False  # Reset if a sync fails, e.g. the file was removed
+
+
+def _get_db() -> sqlite3.Connection:
+    """Open (once) the local action database and create the schema."""
+    global _db_conn
+    if _db_conn is None:
+        ACTION_LOG_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(ACTION_LOG_DB_PATH), check_same_thread=False)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS actions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                ts TEXT NOT NULL,
+                fr TEXT NOT NULL,
+                en TEXT NOT NULL,
+                src TEXT NOT NULL,
+                added TEXT NOT NULL,
+                synced INTEGER NOT NULL DEFAULT 0,
+                claimed_at REAL
+            )
+        """)
+        # Databases created before batches were claimed lack the column
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(actions)")}
+        if 'claimed_at' not in columns:
+            conn.execute("ALTER TABLE actions ADD COLUMN claimed_at REAL")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_actions_synced ON actions (synced)")
+        conn.commit()
+        _db_conn = conn
+    return _db_conn
+
+
+def _record(row: List[str]) -> None:
+    """
+    Insert one Action Log row locally.
+
+    The sync thread picks rows up on its SYNC_INTERVAL_SECONDS timer, so a
+    burst of actions is written to Excel in one append; it is only woken
+    early once a full SYNC_BATCH_SIZE chunk is waiting.
+    """
+    global _unsynced_since_wake
+    with _db_lock:
+        conn = _get_db()
+        conn.execute(
+            "INSERT INTO actions (ts, fr, en, src, added) VALUES (?, ?, ?, ?, ?)",
+            row
+        )
+        conn.commit()
+        _unsynced_since_wake += 1
+        batch_full = _unsynced_since_wake >= SYNC_BATCH_SIZE
+
+    _start_sync_thread()
+    if batch_full:
+        _sync_event.set()
+
+
+def sync_pending() -> int:
+    """
+    Push unsynced local actions to the Excel Action Log.
+
+    Rows are appended in chunks of SYNC_BATCH_SIZE and marked as synced only
+    after the Excel write succeeds, so a failed sync is retried later.
+
+    Returns:
+        Number of rows synced
+    """
+    action_log_path = get_action_log_path()
+
+    with _sync_lock:
+        return _drain(action_log_path)
+
+
+def _drain(action_log_path: Path) -> int:
+    """
+    Sync pending rows in chunks (caller holds _sync_lock).
+
+    _sync_lock only covers this process, and every gunicorn worker shares
+    the database, so each chunk is first claimed (synced = 2) in one write
+    transaction; a row is only ever appended by the worker that claimed it.
+    """
+    global _action_log_ensured
+    synced = 0
+
+    while True:
+        with _db_lock:
+            pending = _claim_batch(_get_db())
+
+        if not pending:
+            return synced
+
+        try:
+            if not _action_log_ensured:
+                ensure_action_log_exists()
+                _action_log_ensured = True
+            client = get_client()
+            client.append_row(
+                file_path=action_log_path,
+                sheet_name=ACTION_LOG_SHEET_NAME,
+                values=[list(row[1:]) for row in pending],
+                fast_append=True
+            )
+            # No-op unless the fast append fell back to the cached workbook
+            client.flush(action_log_path)
+        except Exception:
+            _action_log_ensured = False
+            # Release the claim so the rows are retried
+            with _db_lock:
+                conn = _get_db()
+                conn.executemany(
+                    "UPDATE actions SET synced = 0, claimed_at = NULL WHERE id = ?",
+                    [(row[0],) for row in pending]
+                )
+                conn.commit()
+            raise
+
+        with _db_lock:
+            conn = _get_db()
+            conn.executemany(
+                "UPDATE actions SET synced = 1, claimed_at = NULL WHERE id = ?",
+                [(row[0],) for row in pending]
+            )
+            conn.commit()
+
+        synced += len(pending)
+
+
+def _claim_batch(conn: sqlite3.Connection) -> list:
+    """Claim up to SYNC_BATCH_SIZE unsynced rows for this process (caller holds _db_lock)."""
+    now = time.time()
+    # IMMEDIATE takes the write lock up front, so no other process can
+    # select the same rows between the SELECT and the UPDATE
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        pending = conn.execute(
+            "SELECT id, ts, fr, en, src, added FROM actions "
+            "WHERE synced = 0 OR (synced = 2 AND claimed_at < ?) ORDER BY id LIMIT ?",
+            (now - SYNC_CLAIM_TIMEOUT_SECONDS, SYNC_BATCH_SIZE)
+        ).fetchall()
+        conn.executemany(
+            "UPDATE actions SET synced = 2, claimed_at = ? WHERE id = ?",
+            [(now, row[0]) for row in pending]
+        )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return pending
+
+
+def _sync_loop():
+    """Background loop that drains the local database to Excel."""
+    global _unsynced_since_wake
+    while True:
+        _sync_event.wait(SYNC_INTERVAL_SECONDS)
+        _sync_event.clear()
+        with _db_lock:
+            _unsynced_since_wake = 0
+        try:
+            synced = sync_pending()
+            if synced:
+                print(f"[OK] Synced {synced} action(s) to Action Log")
+        except Exception as e:
+            print(f"[ERROR] Failed to sync action log: {e}")
+
+
+def _start_sync_thread():
+    """Start the background sync thread if it is not already running."""
+    global _sync_thread
+    if _sync_thread is None or not _sync_thread.is_alive():
+        _sync_thread = threading.Thread(target=_sync_loop, name="action-log-sync", daemon=True)
+        _sync_thread.start()
+
+
+@atexit.register
+def _flush_on_exit():
+    """Best-effort final sync so short-lived processes don't leave rows behind."""
+    if _db_conn is None:
+        return
+    try:
+        sync_pending()
+    except Exception as e:
+        print(f"[ERROR] Failed to sync action log on exit: {e}")
 
 
 def log(
@@ -28,6 +234,8 @@ def log(
     """
     Log a term-checking action to Excel file.
 
+    The row is stored locally right away and synced to Excel in the background.
+
     Expected Excel structure (Action Log sheet):
     Column A: Timestamp
     Column B: French Term
@@ -65,27 +273,16 @@ def log(
     added_str = "YES" if added_to_glossary else "NO"
 
     # Prepare row data
-    row_data = [[
+    row_data = [
         timestamp_str,
         french_term,
         english_term,
         source,
         added_str
-    ]]
+    ]
 
     try:
-        # Ensure file exists
-        ensure_action_log_exists()
-
-        # Get Excel client
-        client = get_client()
-
-        # Append row to Action Log file
-        result = client.append_row(
-            file_path=action_log_path,
-            sheet_name=ACTION_LOG_SHEET_NAME,
-            values=row_data
-        )
+        _record(row_data)
 
         print(f"[OK] Action logged: {french_term} -> {english_term} (from {source})")
         return True
@@ -122,23 +319,16 @@ def log_translation(
     timestamp_str = timestamp.strftime('%Y-%m-%d %H:%M:%S')
     glossary_str = "YES" if glossary_used else "NO"
 
-    row_data = [[
+    row_data = [
         timestamp_str,
         "TRANSLATION",
         "",
         "TRANSLATION",
         glossary_str
-    ]]
+    ]
 
     try:
-        ensure_action_log_exists()
-        client = get_client()
-
-        client.append_row(
-            file_path=action_log_path,
-            sheet_name=ACTION_LOG_SHEET_NAME,
-            values=row_data
-        )
+        _record(row_data)
 
         print(f"[OK] Translation logged (glossary used: {glossary_str})")
         return True
@@ -152,6 +342,8 @@ def get_action_stats(limit: int = 100) -> dict:
     """
     Retrieve statistics about logged actions.
 
+    Computed from the local action database with SQL aggregates.
+
     Args:
         limit: Maximum number of recent actions to analyze
 
@@ -164,7 +356,7 @@ def get_action_stats(limit: int = 100) -> dict:
         - most_checked_terms: List of most frequently checked terms
     """
     try:
-        action_log_path = get_action_log_path()
+        get_action_log_path()
     except ValueError:
         return {
             'error': 'EXCEL_ACTION_LOG_PATH not configured',
@@ -172,43 +364,23 @@ def get_action_stats(limit: int = 100) -> dict:
         }
 
     try:
-        # Ensure file exists
-        ensure_action_log_exists()
-
-        # Get Excel client
-        client = get_client()
-
-        # Read action log
-        values = client.read_sheet(action_log_path, ACTION_LOG_SHEET_NAME)
-
-        if not values:
-            return {
-                'total_actions': 0,
-                'termium_count': 0,
-                'oqlf_count': 0,
-                'added_to_glossary_count': 0,
-                'most_checked_terms': []
-            }
-
-        # Skip header row if present
-        if values[0][0].lower() in ['timestamp', 'date', 'time']:
-            values = values[1:]
-
-        # Analyze data
-        total_actions = len(values)
-        termium_count = sum(1 for row in values if len(row) > 3 and row[3] == 'TERMIUM')
-        oqlf_count = sum(1 for row in values if len(row) > 3 and row[3] == 'OQLF')
-        added_count = sum(1 for row in values if len(row) > 4 and row[4] == 'YES')
-
-        # Count term frequencies
-        term_counts = {}
-        for row in values:
-            if len(row) > 1:
-                french_term = row[1]
-                term_counts[french_term] = term_counts.get(french_term, 0) + 1
-
-        # Get top terms
-        most_checked = sorted(term_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        with _db_lock:
+            conn = _get_db()
+
+            # Aggregate directly in SQLite (includes rows not yet synced to Excel)
+            total_actions, termium_count, oqlf_count, added_count = conn.execute(
+                "SELECT COUNT(*), "
+                "COALESCE(SUM(src = 'TERMIUM'), 0), "
+                "COALESCE(SUM(src = 'OQLF'), 0), "
+                "COALESCE(SUM(added = 'YES'), 0) "
+                "FROM actions"
+            ).fetchone()
+
+            # Get top terms
+            most_checked = conn.execute(
+                "SELECT fr, COUNT(*) AS c FROM actions "
+                "GROUP BY fr ORDER BY c DESC LIMIT 10"
+            ).fetchall()
 
         return {
             'total_actions': total_actions,
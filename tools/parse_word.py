@@ -5,52 +5,134 @@ Extracts text from Word documents (.docx) while preserving formatting
 as markdown (bold, italic, line breaks, etc.).
 """
 
+import re
+import zipfile
 from io import BytesIO
-from typing import Union
-from docx import Document
-from docx.shared import Pt, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_COLOR_INDEX
-
+from typing import Iterator, Union
+
+from lxml import etree
+
+
+# WordprocessingML names used by the streaming parser
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_BODY = f'{_W}body'
+_W_P = f'{_W}p'
+_W_R = f'{_W}r'
+_W_HYPERLINK = f'{_W}hyperlink'
+_W_RPR = f'{_W}rPr'
+_W_T = f'{_W}t'
+_W_BR = f'{_W}br'
+_W_VAL = f'{_W}val'
+_W_TYPE = f'{_W}type'
+_W_B = f'{_W}b'
+_W_I = f'{_W}i'
+_W_U = f'{_W}u'
+_W_STRIKE = f'{_W}strike'
+_W_HIGHLIGHT = f'{_W}highlight'
+_W_COLOR = f'{_W}color'
+_W_R_RPR = f'{_W_R}/{_W_RPR}'
+
+# w:val values that switch an on/off run property (w:b, w:i, w:strike) on
+_ON_VALUES = frozenset({'1', 'true', 'on'})
+
+# Text equivalents of the other run content, as python-docx's Run.text maps them
+_RUN_CHARS = {
+    f'{_W}tab': '\t',
+    f'{_W}ptab': '\t',
+    f'{_W}cr': '\n',
+    f'{_W}noBreakHyphen': '-',
+}
 
-# Map Word highlight colors to CSS colors
+_OFFICE_DOCUMENT_REL = (
+    'http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument'
+)
+_HEX_COLOR = re.compile(r'[0-9A-Fa-f]{6}')
+
+# Cleanup patterns for _clean_formatting() / _clean_whitespace()
+_RE_STARS6 = re.compile(r'\*{6,}')
+_RE_STARS5 = re.compile(r'\*{5}')
+_RE_STARS4 = re.compile(r'\*{4}')
+_RE_PLUS4 = re.compile(r'\+{4,}')
+_RE_TILDE4 = re.compile(r'~{4,}')
+_RE_EQ4 = re.compile(r'={4,}')
+_RE_COLON4 = re.compile(r':{4,}')
+_RE_NL3 = re.compile(r'\n{3,}')
+_RE_TRAIL = re.compile(r'[ \t]+$', re.MULTILINE)
+
+# Map Word highlight colors (w:highlight values) to CSS colors
 HIGHLIGHT_COLORS = {
-    WD_COLOR_INDEX.YELLOW: "#FFFF00",
-    WD_COLOR_INDEX.BRIGHT_GREEN: "#00FF00",
-    WD_COLOR_INDEX.TURQUOISE: "#00FFFF",
-    WD_COLOR_INDEX.PINK: "#FF00FF",
-    WD_COLOR_INDEX.BLUE: "#0000FF",
-    WD_COLOR_INDEX.RED: "#FF0000",
-    WD_COLOR_INDEX.DARK_BLUE: "#000080",
-    WD_COLOR_INDEX.TEAL: "#008080",
-    WD_COLOR_INDEX.GREEN: "#008000",
-    WD_COLOR_INDEX.VIOLET: "#800080",
-    WD_COLOR_INDEX.DARK_RED: "#800000",
-    WD_COLOR_INDEX.DARK_YELLOW: "#808000",
-    WD_COLOR_INDEX.GRAY_50: "#808080",
-    WD_COLOR_INDEX.GRAY_25: "#C0C0C0",
-    WD_COLOR_INDEX.BLACK: "#000000",
+    'yellow': "#FFFF00",
+    'green': "#00FF00",
+    'cyan': "#00FFFF",
+    'magenta': "#FF00FF",
+    'blue': "#0000FF",
+    'red': "#FF0000",
+    'darkBlue': "#000080",
+    'darkCyan': "#008080",
+    'darkGreen': "#008000",
+    'darkMagenta': "#800080",
+    'darkRed': "#800000",
+    'darkYellow': "#808000",
+    'darkGray': "#808080",
+    'lightGray': "#C0C0C0",
+    'black': "#000000",
 }
 
 
-def _get_highlight_color(run) -> str:
-    """Get the highlight color from a run, if any."""
-    try:
-        if run.font.highlight_color and run.font.highlight_color != WD_COLOR_INDEX.AUTO:
-            return HIGHLIGHT_COLORS.get(run.font.highlight_color, "#FFFF00")
-    except:
-        pass
-    return None
+def _main_document_part(z: zipfile.ZipFile) -> str:
+    """Return the zip member holding the main document XML."""
+    rels = etree.fromstring(z.read('_rels/.rels'))
+    for rel in rels:
+        if rel.get('Type') == _OFFICE_DOCUMENT_REL:
+            return rel.get('Target').lstrip('/')
+    return 'word/document.xml'
 
 
-def _get_font_color(run) -> str:
-    """Get the font color from a run, if any."""
-    try:
-        if run.font.color and run.font.color.rgb:
-            rgb = run.font.color.rgb
-            return f"#{rgb}"
-    except:
-        pass
-    return None
+def _iter_body_paragraphs(file: Union[str, BytesIO]) -> Iterator[etree._Element]:
+    """
+    Stream the top-level <w:p> elements of a .docx body (like Document.paragraphs).
+
+    Each paragraph is cleared once the caller is done with it, and the
+    elements before it are dropped, so only one paragraph is held at a time.
+    """
+    with zipfile.ZipFile(file) as z, z.open(_main_document_part(z)) as xml:
+        for _, para in etree.iterparse(xml, events=('end',), tag=_W_P,
+                                       remove_blank_text=True, resolve_entities=False):
+            parent = para.getparent()
+            if parent is None or parent.tag != _W_BODY:
+                continue
+
+            yield para
+
+            para.clear()
+            while para.getprevious() is not None:
+                del parent[0]
+
+
+def _run_text(run: etree._Element) -> str:
+    """Text of a <w:r>, with tabs and line breaks mapped like python-docx."""
+    parts = []
+    for child in run:
+        tag = child.tag
+        if tag == _W_T:
+            parts.append(child.text or "")
+        elif tag == _W_BR:
+            if child.get(_W_TYPE, 'textWrapping') == 'textWrapping':
+                parts.append("\n")
+        elif tag in _RUN_CHARS:
+            parts.append(_RUN_CHARS[tag])
+    return "".join(parts)
+
+
+def _paragraph_text(para: etree._Element) -> str:
+    """Text of a paragraph, including the visible text of hyperlinks."""
+    parts = []
+    for child in para:
+        if child.tag == _W_R:
+            parts.append(_run_text(child))
+        elif child.tag == _W_HYPERLINK:
+            parts.extend(_run_text(r) for r in child.iterchildren(_W_R))
+    return "".join(parts)
 
 
 def parse_word_document(file: Union[str, BytesIO]) -> str:
@@ -74,36 +156,65 @@ def parse_word_document(file: Union[str, BytesIO]) -> str:
         Exception: If the document cannot be parsed
     """
     try:
-        doc = Document(file)
         result_paragraphs = []
+        append_paragraph = result_paragraphs.append
+
+        for para in _iter_body_paragraphs(file):
+            plain_text = _paragraph_text(para)
 
-        for para in doc.paragraphs:
             # Skip empty paragraphs
-            if not para.text.strip():
-                result_paragraphs.append("")
+            if not plain_text.strip():
+                append_paragraph("")
+                continue
+
+            # No run carries formatting (and no hyperlink runs to drop): the
+            # markdown is just the plain text
+            if para.find(_W_R_RPR) is None and para.find(_W_HYPERLINK) is None:
+                append_paragraph(_clean_formatting(plain_text))
                 continue
 
             # Process each run (text segment with consistent formatting) in the paragraph
-            paragraph_text = ""
+            run_parts = []
 
-            for run in para.runs:
-                text = run.text
+            for run in para.iterchildren(_W_R):
+                text = _run_text(run)
 
                 if not text:
                     continue
 
-                # Get additional formatting
-                is_underline = run.underline is not None and run.underline != False
-                is_strike = run.font.strike if run.font.strike else False
-                highlight_color = _get_highlight_color(run)
-                font_color = _get_font_color(run)
+                rpr = run.find(_W_RPR)
+                if rpr is None:
+                    run_parts.append(text)
+                    continue
+
+                # Read all run properties in one pass over <w:rPr>; walking it
+                # backwards lets the first of any repeated property win, as find() did
+                is_bold = is_italic = is_underline = is_strike = False
+                highlight_color = font_color = None
+                for prop in reversed(rpr):
+                    tag = prop.tag
+                    if tag == _W_B:
+                        is_bold = prop.get(_W_VAL, 'true') in _ON_VALUES
+                    elif tag == _W_I:
+                        is_italic = prop.get(_W_VAL, 'true') in _ON_VALUES
+                    elif tag == _W_U:
+                        is_underline = prop.get(_W_VAL) not in (None, 'none')
+                    elif tag == _W_STRIKE:
+                        is_strike = prop.get(_W_VAL, 'true') in _ON_VALUES
+                    elif tag == _W_HIGHLIGHT:
+                        value = prop.get(_W_VAL)
+                        # 'white' has no CSS mapping; shown as the default yellow
+                        highlight_color = "#FFFF00" if value == 'white' else HIGHLIGHT_COLORS.get(value)
+                    elif tag == _W_COLOR:
+                        match = _HEX_COLOR.match(prop.get(_W_VAL) or '')
+                        font_color = f"#{match.group().upper()}" if match else None
 
                 # Apply basic formatting as markdown
-                if run.bold and run.italic:
+                if is_bold and is_italic:
                     text = f"***{text}***"
-                elif run.bold:
+                elif is_bold:
                     text = f"**{text}**"
-                elif run.italic:
+                elif is_italic:
                     text = f"*{text}*"
 
                 # Apply underline
@@ -125,12 +236,12 @@ def parse_word_document(file: Union[str, BytesIO]) -> str:
                 if font_color and font_color.upper() != "#000000":
                     text = f"::{font_color}:{text}::"
 
-                paragraph_text += text
+                run_parts.append(text)
 
             # Clean up formatting markers that might have been split across runs
-            paragraph_text = _clean_formatting(paragraph_text)
+            paragraph_text = _clean_formatting("".join(run_parts))
 
-            result_paragraphs.append(paragraph_text)
+            append_paragraph(paragraph_text)
 
         # Join paragraphs with double newlines (standard markdown paragraph separator)
         result = "\n\n".join(result_paragraphs)
@@ -151,27 +262,30 @@ def _clean_formatting(text: str) -> str:
     When Word splits formatted text into multiple runs, we may get adjacent markers
     like **text****more** which should become **textmore**.
     """
-    import re
+    # Most paragraphs have no 4+ marker run, so none of the merges below can fire
+    if not ('****' in text or '++++' in text or '~~~~' in text
+            or '====' in text or '::::' in text):
+        return text
 
     # Simplify asterisk sequences by removing adjacent end+start markers
     # 6+ asterisks → reduce to manageable (likely malformed)
-    text = re.sub(r'\*{6,}', '***', text)
+    text = _RE_STARS6.sub('***', text)
     # 5 asterisks (bold end + bold+italic start) → 3 asterisks
-    text = re.sub(r'\*{5}', '***', text)
+    text = _RE_STARS5.sub('***', text)
     # 4 asterisks (bold end + bold start) → nothing (merge)
-    text = re.sub(r'\*{4}', '', text)
+    text = _RE_STARS4.sub('', text)
 
     # Merge adjacent underline markers: ++text++++more++ → ++textmore++
-    text = re.sub(r'\+{4,}', '', text)
+    text = _RE_PLUS4.sub('', text)
 
     # Merge adjacent strikethrough markers: ~~text~~~~more~~ → ~~textmore~~
-    text = re.sub(r'~{4,}', '', text)
+    text = _RE_TILDE4.sub('', text)
 
     # Merge adjacent highlight markers: ==text====more== → ==textmore==
-    text = re.sub(r'={4,}', '', text)
+    text = _RE_EQ4.sub('', text)
 
     # Merge adjacent color markers: ::color:text::::color:more:: → ::color:textmore::
-    text = re.sub(r':{4,}', '', text)
+    text = _RE_COLON4.sub('', text)
 
     return text
 
@@ -180,13 +294,11 @@ def _clean_whitespace(text: str) -> str:
     """
     Clean up excessive whitespace while preserving intentional line breaks.
     """
-    import re
-
     # Replace 3+ newlines with 2 (paragraph break)
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = _RE_NL3.sub('\n\n', text)
 
     # Remove trailing whitespace from lines
-    text = re.sub(r'[ \t]+$', '', text, flags=re.MULTILINE)
+    text = _RE_TRAIL.sub('', text)
 
     # Remove leading/trailing whitespace from entire text
     text = text.strip()
@@ -208,9 +320,8 @@ def get_document_info(file: Union[str, BytesIO]) -> dict:
         - character_count: Character count
     """
     try:
-        doc = Document(file)
-
-        paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
+        paragraphs = [text for text in map(_paragraph_text, _iter_body_paragraphs(file))
+                      if text.strip()]
         full_text = " ".join(paragraphs)
 
         return {
@@ -74,53 +74,74 @@ def rich_text_area(label, height=400, key=None, placeholder="", value=""):
     <script>
         const editor = document.getElementById('editor');
 
-        // Convert HTML to Markdown
-        function htmlToMarkdown(html) {{
-            // Create a temporary div to parse HTML
-            const temp = document.createElement('div');
-            temp.innerHTML = html;
-
-            // Convert basic formatting
-            let markdown = temp.innerHTML;
-
-            // Bold: <b>, <strong> → **text**
-            markdown = markdown.replace(/<(b|strong)>(.*?)<\/(b|strong)>/gi, '**$2**');
-
-            // Italic: <i>, <em> → *text*
-            markdown = markdown.replace(/<(i|em)>(.*?)<\/(i|em)>/gi, '*$2*');
-
-            // Underline: keep as is or convert to bold
-            markdown = markdown.replace(/<u>(.*?)<\/u>/gi, '**$1**');
+        // Convert HTML to Markdown in one walk over the parsed DOM
+        // (DOMParser is inert: nothing in the pasted HTML loads or runs)
+        const SKIP_TAGS = new Set(['STYLE', 'SCRIPT', 'XML', 'HEAD', 'TITLE', 'META']);
 
-            // Remove spans but keep content
-            markdown = markdown.replace(/<span[^>]*>(.*?)<\/span>/gi, '$1');
-
-            // Paragraphs: <p> → double newline
-            markdown = markdown.replace(/<p[^>]*>/gi, '\\n\\n');
-            markdown = markdown.replace(/<\/p>/gi, '');
-
-            // Line breaks: <br> → newline
-            markdown = markdown.replace(/<br[^>]*>/gi, '\\n');
+        function htmlToMarkdown(html) {{
+            const doc = new DOMParser().parseFromString(html, 'text/html');
+            const out = [];
 
-            // Lists: <ul><li> → - item
-            markdown = markdown.replace(/<ul[^>]*>/gi, '');
-            markdown = markdown.replace(/<\/ul>/gi, '\\n');
-            markdown = markdown.replace(/<li[^>]*>/gi, '- ');
-            markdown = markdown.replace(/<\/li>/gi, '\\n');
+            function walkChildren(node) {{
+                for (const child of node.childNodes) walk(child);
+            }}
 
-            // Remove remaining HTML tags
-            markdown = markdown.replace(/<[^>]+>/g, '');
+            function walk(node) {{
+                if (node.nodeType === Node.TEXT_NODE) {{
+                    out.push(node.nodeValue);
+                    return;
+                }}
+                // Comments (Word's <!--[if ...]> blocks) and other non-elements
+                if (node.nodeType !== Node.ELEMENT_NODE) return;
+
+                const tag = node.tagName;
+                if (SKIP_TAGS.has(tag)) return;
+
+                switch (tag) {{
+                    // Bold: <b>, <strong> → **text**; underline is shown as bold too
+                    case 'B':
+                    case 'STRONG':
+                    case 'U':
+                        out.push('**');
+                        walkChildren(node);
+                        out.push('**');
+                        return;
+                    // Italic: <i>, <em> → *text*
+                    case 'I':
+                    case 'EM':
+                        out.push('*');
+                        walkChildren(node);
+                        out.push('*');
+                        return;
+                    // Paragraphs: <p> → double newline
+                    case 'P':
+                        out.push('\\n\\n');
+                        walkChildren(node);
+                        return;
+                    // Line breaks: <br> → newline
+                    case 'BR':
+                        out.push('\\n');
+                        return;
+                    // Lists: <ul><li> → - item
+                    case 'UL':
+                        walkChildren(node);
+                        out.push('\\n');
+                        return;
+                    case 'LI':
+                        out.push('- ');
+                        walkChildren(node);
+                        out.push('\\n');
+                        return;
+                    // Anything else (spans, divs, ...): keep the content only
+                    default:
+                        walkChildren(node);
+                }}
+            }}
 
-            // Decode HTML entities
-            const txt = document.createElement('textarea');
-            txt.innerHTML = markdown;
-            markdown = txt.value;
+            walk(doc.body);
 
             // Clean up extra whitespace
-            markdown = markdown.replace(/\\n{{3,}}/g, '\\n\\n');
-            markdown = markdown.trim();
-
-            return markdown;
+            return out.join('').replace(/\\n{{3,}}/g, '\\n\\n').trim();
         }}
 
         // Handle paste events
@@ -158,13 +179,30 @@ def rich_text_area(label, height=400, key=None, placeholder="", value=""):
             editor.dispatchEvent(new Event('input', {{ bubbles: true }}));
         }});
 
-        // Send content to Streamlit on every change
-        editor.addEventListener('input', () => {{
+        // Send content to Streamlit once typing pauses (each value triggers a
+        // script rerun), and right away when the editor loses focus
+        const SEND_DELAY_MS = 150;
+        let sendTimer = null;
+
+        function sendValue() {{
+            if (sendTimer) {{
+                clearTimeout(sendTimer);
+                sendTimer = null;
+            }}
             // Use Streamlit's setComponentValue to send data back
             window.parent.postMessage({{
                 type: 'streamlit:setComponentValue',
                 value: editor.value
             }}, '*');
+        }}
+
+        editor.addEventListener('input', () => {{
+            if (sendTimer) clearTimeout(sendTimer);
+            sendTimer = setTimeout(sendValue, SEND_DELAY_MS);
+        }});
+
+        editor.addEventListener('blur', () => {{
+            if (sendTimer) sendValue();
         }});
 
         // Also send initial value
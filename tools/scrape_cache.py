@@ -0,0 +1,113 @@
+"""
+Scrape Result Cache
+
+Keeps successful scraper results on disk (SQLite) so repeated lookups of
+the same term return instantly instead of hitting the network again.
+Terminology changes slowly, so entries are kept for a week by default.
+"""
+
+import functools
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+# Configuration
+SCRAPE_CACHE_DB_PATH = Path(__file__).parent.parent / '.tmp' / 'scrape_cache.db'
+SCRAPE_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+# Placeholder results (manual-search links, errors) that must not be cached,
+# so a transient failure isn't served again for the whole TTL
+_FALLBACK_TERMS = frozenset({"[Recherche manuelle]", "[Voir la page]", "[Erreur]"})
+
+_conn = None
+_lock = threading.Lock()
+
+
+def cached(source: str, ttl: float = SCRAPE_CACHE_TTL_SECONDS) -> Callable:
+    """
+    Cache a scraper's scrape(search_term, ...) results on disk.
+
+    Entries are keyed by (source, normalized search term, other arguments).
+    Only real results are stored: empty lists and fallback placeholders
+    are returned but never cached.
+
+    Args:
+        source: Name of the scraped site (e.g. 'oqlf')
+        ttl: Seconds a cached result stays valid
+    """
+    def decorator(scrape: Callable) -> Callable:
+        @functools.wraps(scrape)
+        def wrapper(search_term: str, *args, **kwargs) -> List[Dict[str, str]]:
+            term = "|".join([
+                search_term.strip().lower(),
+                *map(repr, args),
+                *(f"{k}={v!r}" for k, v in sorted(kwargs.items())),
+            ])
+
+            results = _get(source, term, ttl)
+            if results is not None:
+                print(f"[OK] Loaded {len(results)} {source} result(s) from cache")
+                return results
+
+            results = scrape(search_term, *args, **kwargs)
+            if results and not any(r.get('english_term') in _FALLBACK_TERMS for r in results):
+                _put(source, term, results)
+            return results
+
+        return wrapper
+
+    return decorator
+
+
+def _get_db() -> sqlite3.Connection:
+    """Open (once) the cache database and create the schema."""
+    global _conn
+    if _conn is None:
+        SCRAPE_CACHE_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(SCRAPE_CACHE_DB_PATH), check_same_thread=False)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS scrape_results (
+                source TEXT NOT NULL,
+                term TEXT NOT NULL,
+                ts REAL NOT NULL,
+                results TEXT NOT NULL,
+                PRIMARY KEY (source, term)
+            )
+        """)
+        conn.commit()
+        _conn = conn
+    return _conn
+
+
+def _get(source: str, term: str, ttl: float) -> Optional[List[Dict[str, str]]]:
+    """Return cached results, or None if missing or expired."""
+    try:
+        with _lock:
+            row = _get_db().execute(
+                "SELECT ts, results FROM scrape_results WHERE source = ? AND term = ?",
+                (source, term)
+            ).fetchone()
+    except sqlite3.Error as e:
+        print(f"Warning: Failed to read scrape cache: {e}")
+        return None
+
+    if row is None or time.time() - row[0] >= ttl:
+        return None
+    return json.loads(row[1])
+
+
+def _put(source: str, term: str, results: List[Dict[str, str]]) -> None:
+    """Store results for (source, term)."""
+    try:
+        with _lock:
+            conn = _get_db()
+            conn.execute(
+                "INSERT OR REPLACE INTO scrape_results (source, term, ts, results) VALUES (?, ?, ?, ?)",
+                (source, term, time.time(), json.dumps(results, ensure_ascii=False))
+            )
+            conn.commit()
+    except sqlite3.Error as e:
+        print(f"Warning: Failed to write scrape cache: {e}")
@@ -5,27 +5,117 @@ Searches canada.ca for French terms and extracts English equivalents
 by navigating to parallel English pages and using Claude AI analysis.
 """
 
+import atexit
+import json
 import os
-import time
+import queue
 import re
-from typing import List, Dict, Optional
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from html import unescape
+from typing import List, Dict, Optional, Tuple
 from urllib.parse import quote_plus
 
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
+from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 from dotenv import load_dotenv
 import anthropic
+import requests
+
+from tools.scrape_cache import cached
 
 load_dotenv()
 
 ANTHROPIC_API_KEY = os.getenv('ANTHROPIC_API_KEY')
+MODEL = "claude-haiku-4-5-20251001"  # Finding an aligned term is well within Haiku's reach
+FALLBACK_MODEL = "claude-sonnet-4-20250514"  # Second look when Haiku answers NOT_FOUND
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+HTTP_TIMEOUT_SECONDS = 10
+DDG_HTML_URL = "https://html.duckduckgo.com/html/"
+
+# Elements that mark a canada.ca page as ready for content extraction (pages
+# without one are read after the timeout warning, as loaded so far)
+PAGE_READY_SELECTOR = "main, article"
+DDG_READY_SELECTOR = "a.result__a, .no-results"
+
+# Parse only what's read from a page. The class is matched as a whole word
+# because strainers don't split multi-valued attributes the way find_all does.
+_RESULT_LINKS = SoupStrainer('a', class_=re.compile(r'(^|\s)result__a(\s|$)'))
+_MAIN_OPEN_RE = re.compile(r'<main[\s>]', re.I)
+_TITLE_RE = re.compile(r'<title[^>]*>(.*?)</title>', re.I | re.S)
+
+# Page content lookups, in order of preference, skipping inert <template>
+# copies (see _extract_page_content)
+_HTML_PARSER = etree.HTMLParser(encoding='utf-8')
+_CONTENT_ROOT_XPS = [
+    etree.XPath("(//main[not(ancestor::template)])[1]"),
+    etree.XPath("(//article[not(ancestor::template)])[1]"),
+    etree.XPath("(//div[contains(concat(' ', normalize-space(@class), ' '), ' container ')]"
+                "[not(ancestor::template)])[1]"),
+]
+_BODY_XP = etree.XPath("(//body[not(ancestor::template)])[1]")
+
+# Characters of each page's content included in Claude prompts
+PROMPT_CONTENT_CHARS = 1500
+
+# DuckDuckGo's HTML endpoint and canada.ca pages are server-rendered, so they
+# are fetched with plain keep-alive HTTP; the browser is only started when that fails
+_SESSION = requests.Session()
+_SESSION.headers['User-Agent'] = USER_AGENT
+
+# Headless Chromium flags; images, fonts and CSS are dropped at the network
+# layer instead (_BLOCKED_ASSETS)
+BROWSER_ARGS = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-features=TranslateUI,MediaRouter,OptimizationHints",
+]
+_BLOCKED_ASSETS = "**/*.{png,jpg,jpeg,gif,svg,webp,ico,woff,woff2,ttf,css}"
+
+# One headless Chromium reused across scrape() calls. Playwright's sync API
+# only works on the thread that started it, so every browser call is handed
+# to a single worker thread; scrapes take turns as they share the browser.
+_PLAYWRIGHT = None
+_BROWSER = None
+_browser_jobs: "queue.Queue" = queue.Queue()
+_browser_thread: Optional[threading.Thread] = None
+_browser_thread_lock = threading.Lock()
+
+# One Anthropic client for every call, so its keep-alive connections are reused
+_client: Optional[anthropic.Anthropic] = None
+_client_lock = threading.Lock()
+
+# Instructions shared by every term lookup, sent as a cached system block so
+# repeated lookups only pay for the page content
+TERM_SYSTEM_PROMPT = """You are a terminology expert. Given a French term and parallel
+French/English content from canada.ca pages (each English page is the official
+translation of the French page), identify the exact English equivalent term.
+
+INSTRUCTIONS:
+1. Find where the French term appears in the French content
+2. Identify the corresponding section in the English content of the same page
+3. Extract the exact English equivalent term
+4. If multiple equivalents exist, choose the most official/formal one"""
+_TERM_SYSTEM = [{"type": "text", "text": TERM_SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}]
 
+# Claude answers per (term, French content, English content), so a page
+# already analysed for a term isn't sent again
+TERM_MEMO_SIZE = 256
+_term_memo: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+_term_memo_lock = threading.Lock()
 
+_UDDG_RE = re.compile(r'uddg=([^&]+)')
+_ENGLISH_RE = re.compile(r'English', re.I)
+_WS_RE = re.compile(r'\s+')
+
+
+@cached('canada')
 def scrape(search_term: str, max_results: int = 3) -> List[Dict[str, str]]:
     """
     Search canada.ca for a French term and find its English equivalent.
@@ -43,15 +133,11 @@ def scrape(search_term: str, max_results: int = 3) -> List[Dict[str, str]]:
     """
     print(f"Searching Canada.ca for: '{search_term}'")
 
-    chrome_options = _get_chrome_options()
-    driver = None
     results = []
 
     try:
-        driver = webdriver.Chrome(options=chrome_options)
-
         # Step 1: Search for French pages on canada.ca
-        french_urls = _search_canada_ca(driver, search_term)
+        french_urls = _search_canada_ca(search_term)
 
         if not french_urls:
             print(f"No French pages found for '{search_term}'")
@@ -64,73 +150,102 @@ def scrape(search_term: str, max_results: int = 3) -> List[Dict[str, str]]:
 
         print(f"Found {len(french_urls)} French page(s)")
 
-        # Step 2: Process each French URL
-        for i, french_url in enumerate(french_urls[:max_results]):
-            print(f"Processing page {i+1}: {french_url}")
+        # Step 2: Process each French URL. All French pages and their guessed
+        # /en/ twins are requested up front; browser fallbacks run in turn.
+        page_urls = french_urls[:max_results]
+        with ThreadPoolExecutor(max_workers=2 * max(1, max_results)) as executor:
+            prefetch = {}
+            for french_url in page_urls:
+                for url in (french_url, french_url.replace('/fr/', '/en/')):
+                    if url not in prefetch:
+                        prefetch[url] = executor.submit(_http_get, url)
+
+            pages = []
+
+            for i, french_url in enumerate(page_urls):
+                print(f"Processing page {i+1}: {french_url}")
+
+                try:
+                    # Fetch French page
+                    french_html, from_browser = _fetch_page(
+                        french_url, PAGE_READY_SELECTOR, 10, prefetch.get(french_url)
+                    )
+
+                    # Extract French page content
+                    french_content = _page_content(french_html)
+
+                    # The term may only appear once scripts have run
+                    if not from_browser and search_term.lower() not in french_content.lower():
+                        french_html = _browser_page_source(french_url, PAGE_READY_SELECTOR, 10)
+                        french_content = _page_content(french_html)
+
+                    # Verify term appears on page
+                    if search_term.lower() not in french_content.lower():
+                        print(f"  Term not found on page, skipping")
+                        continue
+
+                    # canada.ca pages usually mirror /fr/ as /en/: when that guess
+                    # loaded, use it without searching the French page for links
+                    guess = None
+                    if '/fr/' in french_url:
+                        guess = prefetch[french_url.replace('/fr/', '/en/')].result()
+
+                    if guess is not None:
+                        english_url, english_html = guess.url, guess.text
+                        print(f"  English URL: {english_url}")
+                    else:
+                        # Find English URL (needs the whole French page: <head> links
+                        # and the language toggle)
+                        english_url = _get_english_url(french_url, BeautifulSoup(french_html, 'lxml'))
+
+                        if not english_url:
+                            print(f"  No English version found, skipping")
+                            continue
+
+                        print(f"  English URL: {english_url}")
+
+                        # Fetch English page
+                        english_html, _ = _fetch_page(
+                            english_url, PAGE_READY_SELECTOR, 10, prefetch.get(english_url)
+                        )
+
+                    # Extract English page content
+                    english_content = _page_content(english_html)
 
-            try:
-                # Navigate to French page
-                driver.get(french_url)
-                time.sleep(2)
-
-                # Extract French page content
-                french_soup = BeautifulSoup(driver.page_source, 'html.parser')
-                french_content = _extract_page_content(french_soup)
-
-                # Verify term appears on page
-                if search_term.lower() not in french_content.lower():
-                    print(f"  Term not found on page, skipping")
-                    continue
+                    # Get page title for description
+                    title_match = _TITLE_RE.search(english_html)
+                    page_title = unescape(title_match.group(1)).strip() if title_match else "Canada.ca"
 
-                # Find English URL
-                english_url = _get_english_url(driver, french_url, french_soup)
+                    pages.append((french_content, english_content, english_url, page_title))
 
-                if not english_url:
-                    print(f"  No English version found, skipping")
+                except Exception as e:
+                    print(f"  Error processing page: {e}")
                     continue
 
-                print(f"  English URL: {english_url}")
-
-                # Navigate to English page
-                driver.get(english_url)
-                time.sleep(2)
-
-                # Extract English page content
-                english_soup = BeautifulSoup(driver.page_source, 'html.parser')
-                english_content = _extract_page_content(english_soup)
-
-                # Use Claude to find English equivalent
-                english_term = _extract_english_term(
-                    search_term,
-                    french_content,
-                    english_content
-                )
+        # Use Claude to find the English equivalent on every page at once
+        english_terms = _extract_english_terms_batch(
+            search_term,
+            [(french_content, english_content) for french_content, english_content, _, _ in pages]
+        )
 
-                if english_term and english_term != "NOT_FOUND":
-                    # Get page title for description
-                    title_tag = english_soup.find('title')
-                    page_title = title_tag.get_text(strip=True) if title_tag else "Canada.ca"
-
-                    results.append({
-                        'english_term': english_term,
-                        'description': f"Source: {page_title}",
-                        'domain': "",
-                        'source_url': english_url
-                    })
-                    print(f"  Found: '{english_term}'")
-                else:
-                    # Couldn't extract term but page exists
-                    results.append({
-                        'english_term': "[Voir la page]",
-                        'description': f"Terme trouve mais extraction automatique impossible",
-                        'domain': "",
-                        'source_url': english_url
-                    })
-                    print(f"  Could not extract term automatically")
-
-            except Exception as e:
-                print(f"  Error processing page: {e}")
-                continue
+        for (_, _, english_url, page_title), english_term in zip(pages, english_terms):
+            if english_term and english_term != "NOT_FOUND":
+                results.append({
+                    'english_term': english_term,
+                    'description': f"Source: {page_title}",
+                    'domain': "",
+                    'source_url': english_url
+                })
+                print(f"  Found: '{english_term}'")
+            else:
+                # Couldn't extract term but page exists
+                results.append({
+                    'english_term': "[Voir la page]",
+                    'description': f"Terme trouve mais extraction automatique impossible",
+                    'domain': "",
+                    'source_url': english_url
+                })
+                print(f"  Could not extract term automatically")
 
         if not results:
             return [{
@@ -145,6 +260,7 @@ def scrape(search_term: str, max_results: int = 3) -> List[Dict[str, str]]:
 
     except Exception as e:
         print(f"[ERROR] Error scraping Canada.ca: {e}")
+        _close_browser()  # Don't reuse a browser that may be broken
         return [{
             'english_term': "[Erreur]",
             'description': str(e),
@@ -152,28 +268,145 @@ def scrape(search_term: str, max_results: int = 3) -> List[Dict[str, str]]:
             'source_url': get_manual_search_url(search_term)
         }]
 
+
+def _browser_worker():
+    """Run queued browser jobs, in order, on the thread that owns Playwright."""
+    while True:
+        fn, args, future = _browser_jobs.get()
+        if not future.set_running_or_notify_cancel():
+            continue
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+
+def _run_in_browser_thread(fn, *args):
+    """Call fn(*args) on the browser thread, starting it on first use, and wait."""
+    global _browser_thread
+    with _browser_thread_lock:
+        if _browser_thread is None:
+            _browser_thread = threading.Thread(
+                target=_browser_worker, name="canada-browser", daemon=True
+            )
+            _browser_thread.start()
+    future = Future()
+    _browser_jobs.put((fn, args, future))
+    return future.result()
+
+
+def _get_browser():
+    """Return the shared Chromium browser, launching it on first use (browser thread only)."""
+    global _PLAYWRIGHT, _BROWSER
+    if _BROWSER is None:
+        _PLAYWRIGHT = sync_playwright().start()
+        try:
+            _BROWSER = _PLAYWRIGHT.chromium.launch(
+                headless=True,
+                args=BROWSER_ARGS,
+                executable_path=os.environ.get("CHROME_BIN") or None,
+            )
+        except Exception:
+            _PLAYWRIGHT.stop()
+            _PLAYWRIGHT = None
+            raise
+    return _BROWSER
+
+
+def _shutdown_browser():
+    """Close the browser and stop Playwright (browser thread only)."""
+    global _PLAYWRIGHT, _BROWSER
+    try:
+        if _BROWSER is not None:
+            _BROWSER.close()
+        if _PLAYWRIGHT is not None:
+            _PLAYWRIGHT.stop()
+    except Exception:
+        pass
+    _PLAYWRIGHT = _BROWSER = None
+
+
+@atexit.register
+def _close_browser():
+    """Shut down the shared browser, if running."""
+    if _browser_thread is not None:
+        _run_in_browser_thread(_shutdown_browser)
+
+
+def _load_page(url: str, ready_selector: str, timeout: float) -> str:
+    """
+    Load a page in a fresh browser context and return its rendered HTML (browser thread only).
+
+    Returns at DOMContentLoaded once ready_selector is present; on timeout,
+    carries on with whatever has loaded so far.
+    """
+    context = _get_browser().new_context(
+        user_agent=USER_AGENT,
+        viewport={"width": 1920, "height": 1080},
+        java_script_enabled=True,
+    )
+    try:
+        context.route(_BLOCKED_ASSETS, lambda route: route.abort())
+        page = context.new_page()
+        try:
+            page.goto(url, wait_until="domcontentloaded", timeout=timeout * 1000)
+            page.wait_for_selector(ready_selector, state="attached", timeout=timeout * 1000)
+        except PlaywrightTimeoutError:
+            print(f"  Warning: Timeout waiting for '{ready_selector}'")
+        return page.content()
     finally:
-        if driver:
-            driver.quit()
-
-
-def _get_chrome_options() -> Options:
-    """Configure Chrome for headless scraping."""
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--disable-extensions")
-    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
-    chrome_options.add_argument("--window-size=1920,1080")
-    chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
-    if os.environ.get("CHROME_BIN"):
-        chrome_options.binary_location = os.environ["CHROME_BIN"]
-    return chrome_options
-
-
-def _search_canada_ca(driver, search_term: str) -> List[str]:
+        context.close()
+
+
+def _http_get(url: str) -> Optional[requests.Response]:
+    """Plain HTTP GET through the shared session; None if it fails."""
+    try:
+        resp = _SESSION.get(url, timeout=HTTP_TIMEOUT_SECONDS)
+        resp.raise_for_status()
+        return resp
+    except requests.RequestException as e:
+        print(f"  HTTP fetch failed for {url} ({e})")
+        return None
+
+
+def _http_post(url: str, data: Dict[str, str]) -> Optional[requests.Response]:
+    """Form POST through the shared session; None if it fails."""
+    try:
+        resp = _SESSION.post(url, data=data, timeout=HTTP_TIMEOUT_SECONDS)
+        resp.raise_for_status()
+        return resp
+    except requests.RequestException as e:
+        print(f"  HTTP POST failed for {url} ({e})")
+        return None
+
+
+def _fetch_page(
+    url: str,
+    ready_selector: str,
+    timeout: float,
+    prefetched: Optional[Future] = None
+) -> Tuple[str, bool]:
+    """
+    Fetch a page's HTML with a plain HTTP GET, falling back to the browser.
+
+    Args:
+        prefetched: A pending _http_get(url) to use instead of a new request
+
+    Returns:
+        Tuple of (html, from_browser)
+    """
+    resp = prefetched.result() if prefetched is not None else _http_get(url)
+    if resp is not None:
+        return resp.text, False
+    return _browser_page_source(url, ready_selector, timeout), True
+
+
+def _browser_page_source(url: str, ready_selector: str, timeout: float) -> str:
+    """Load a page in the shared browser and return its rendered HTML."""
+    return _run_in_browser_thread(_load_page, url, ready_selector, timeout)
+
+
+def _search_canada_ca(search_term: str) -> List[str]:
     """
     Search DuckDuckGo for canada.ca/fr pages containing the term.
 
@@ -183,24 +416,31 @@ def _search_canada_ca(driver, search_term: str) -> List[str]:
     from urllib.parse import unquote
 
     query = f"site:canada.ca/fr {search_term}"
-    url = f"https://html.duckduckgo.com/html/?q={quote_plus(query)}"
 
+    # Submit the search form the way the HTML page does
     print(f"Searching DuckDuckGo: {query}")
-    driver.get(url)
-    time.sleep(3)
+    resp = _http_post(DDG_HTML_URL, {'q': query})
+    html = resp.text if resp is not None else ""
 
-    soup = BeautifulSoup(driver.page_source, 'html.parser')
+    soup = BeautifulSoup(html, 'lxml', parse_only=_RESULT_LINKS)
     urls = []
 
     # DuckDuckGo HTML results are in <a class="result__a"> tags
     result_links = soup.find_all('a', class_='result__a')
 
+    # Neither results nor a "no results" notice: likely a bot check page
+    if not result_links and 'no-results' not in html:
+        url = f"{DDG_HTML_URL}?q={quote_plus(query)}"
+        html = _browser_page_source(url, DDG_READY_SELECTOR, 8)
+        soup = BeautifulSoup(html, 'lxml', parse_only=_RESULT_LINKS)
+        result_links = soup.find_all('a', class_='result__a')
+
     for link in result_links:
         href = link.get('href', '')
 
         # DuckDuckGo wraps URLs in redirects, extract the actual URL
         if 'uddg=' in href:
-            match = re.search(r'uddg=([^&]+)', href)
+            match = _UDDG_RE.search(href)
             if match:
                 actual_url = unquote(match.group(1))
                 if 'canada.ca/fr' in actual_url:
@@ -219,7 +459,7 @@ def _search_canada_ca(driver, search_term: str) -> List[str]:
     return unique_urls[:5]  # Return top 5 URLs
 
 
-def _get_english_url(driver, french_url: str, soup: BeautifulSoup) -> Optional[str]:
+def _get_english_url(french_url: str, soup: BeautifulSoup) -> Optional[str]:
     """
     Find the English equivalent URL from a French canada.ca page.
 
@@ -238,7 +478,7 @@ def _get_english_url(driver, french_url: str, soup: BeautifulSoup) -> Optional[s
 
     # Strategy 2: Look for language toggle link
     # Canada.ca typically has a link with "English" text
-    english_links = soup.find_all('a', string=re.compile(r'English', re.I))
+    english_links = soup.find_all('a', string=_ENGLISH_RE)
     for link in english_links:
         href = link.get('href', '')
         if '/en/' in href:
@@ -263,33 +503,53 @@ def _get_english_url(driver, french_url: str, soup: BeautifulSoup) -> Optional[s
     return None
 
 
-def _extract_page_content(soup: BeautifulSoup) -> str:
+def _page_content(html: str) -> str:
+    """
+    Extract main content from a canada.ca page's HTML.
+
+    Only the <main> element is parsed when the page has one; everything
+    else would be discarded by _extract_page_content anyway.
+    """
+    match = _MAIN_OPEN_RE.search(html)
+    if match:
+        end = html.find('</main>', match.start())
+        if end >= 0:
+            html = html[match.start():end + len('</main>')]
+    return _extract_page_content(html)
+
+
+def _extract_page_content(html: str) -> str:
     """
     Extract main content from a canada.ca page.
 
     Focuses on the <main> element and removes navigation/footer.
     """
-    # Try to find main content area
-    main = soup.find('main') or soup.find('article') or soup.find('div', class_='container')
+    root = etree.fromstring(html.encode('utf-8'), _HTML_PARSER) if html else None
+    if root is None:
+        return ""
 
-    if main:
-        # Remove script and style elements
-        for element in main.find_all(['script', 'style', 'nav', 'footer', 'aside']):
-            element.decompose()
+    # Try to find main content area
+    container = next((found[0] for found in (xpath(root) for xpath in _CONTENT_ROOT_XPS) if found), None)
+    drop_tags = ('script', 'style', 'nav', 'footer', 'aside', 'template')
 
-        text = main.get_text(separator=' ', strip=True)
-    else:
+    if container is None:
         # Fallback to body
-        body = soup.find('body')
+        body = _BODY_XP(root)
         if body:
-            for element in body.find_all(['script', 'style', 'nav', 'footer', 'aside', 'header']):
-                element.decompose()
-            text = body.get_text(separator=' ', strip=True)
+            container = body[0]
+            drop_tags += ('header',)
         else:
-            text = soup.get_text(separator=' ', strip=True)
+            container = root
+            drop_tags = ('script', 'style', 'template')
+
+    # Empty script, style and navigation elements; text after them stays
+    for element in list(container.iter(*drop_tags)):
+        element.clear(keep_tail=True)
+
+    text = ' '.join(filter(None, (t.strip() for t in container.itertext())))
 
     # Clean up whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _WS_RE.sub(' ', text)
 
     return text[:3000]  # Limit to 3000 chars
 
@@ -303,41 +563,31 @@ def _extract_english_term(
     Use Claude to find the English equivalent of a French term
     by comparing parallel French and English page content.
     """
+    memo_key = (french_term, french_content, english_content)
+    remembered = _recall_term(memo_key)
+    if remembered is not None:
+        return remembered
+
     if not ANTHROPIC_API_KEY:
         print("Warning: ANTHROPIC_API_KEY not set")
         return None
 
-    prompt = f"""You are a terminology expert. Given a French term and parallel
-French/English content from the same canada.ca page, identify the exact
-English equivalent term.
-
-FRENCH TERM TO FIND: {french_term}
+    prompt = f"""FRENCH TERM TO FIND: {french_term}
 
 FRENCH PAGE CONTENT:
-{french_content[:2000]}
+{french_content[:PROMPT_CONTENT_CHARS]}
 
 ENGLISH PAGE CONTENT:
-{english_content[:2000]}
-
-INSTRUCTIONS:
-1. Find where "{french_term}" appears in the French content
-2. Identify the corresponding section in the English content
-3. Extract the exact English equivalent term
-4. If multiple equivalents exist, choose the most official/formal one
+{english_content[:PROMPT_CONTENT_CHARS]}
 
 Return ONLY the English term, nothing else. If you cannot find an equivalent,
 respond with "NOT_FOUND"."""
 
     try:
-        client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
-        response = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=100,
-            temperature=0,  # Deterministic for terminology
-            messages=[{"role": "user", "content": prompt}]
-        )
-
-        result = response.content[0].text.strip()
+        result = _ask_claude(MODEL, prompt, max_tokens=100)
+        if result == "NOT_FOUND":
+            result = _ask_claude(FALLBACK_MODEL, prompt, max_tokens=100)
+        _remember_term(memo_key, result)
         return result
 
     except Exception as e:
@@ -345,6 +595,148 @@ respond with "NOT_FOUND"."""
         return None
 
 
+def _get_client() -> anthropic.Anthropic:
+    """Return the shared Anthropic client (one connection pool), creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
+    return _client
+
+
+@atexit.register
+def _close_client():
+    """Close the shared Anthropic client's connections."""
+    if _client is not None:
+        _client.close()
+
+
+def _ask_claude(model: str, prompt: str, max_tokens: int) -> str:
+    """Send one term-lookup prompt (with the shared system block) and return the reply text."""
+    client = _get_client()
+    response = client.messages.create(
+        model=model,
+        max_tokens=max_tokens,
+        temperature=0,  # Deterministic for terminology
+        system=_TERM_SYSTEM,
+        messages=[{"role": "user", "content": prompt}]
+    )
+    return response.content[0].text.strip()
+
+
+def _recall_term(memo_key: Tuple[str, str, str]) -> Optional[str]:
+    """Return the remembered Claude answer for a page pair, or None."""
+    with _term_memo_lock:
+        english_term = _term_memo.get(memo_key)
+        if english_term is not None:
+            _term_memo.move_to_end(memo_key)
+        return english_term
+
+
+def _remember_term(memo_key: Tuple[str, str, str], english_term: str) -> None:
+    """Keep a Claude answer for a page pair, evicting the oldest past TERM_MEMO_SIZE."""
+    with _term_memo_lock:
+        _term_memo[memo_key] = english_term
+        _term_memo.move_to_end(memo_key)
+        while len(_term_memo) > TERM_MEMO_SIZE:
+            _term_memo.popitem(last=False)
+
+
+def _extract_english_terms_batch(
+    french_term: str,
+    pairs: List[Tuple[str, str]]
+) -> List[Optional[str]]:
+    """
+    Find the English equivalent on several parallel page pairs in one Claude call.
+
+    Args:
+        french_term: The French term to find
+        pairs: (french_content, english_content) for each page
+
+    Returns:
+        One English term (or "NOT_FOUND" / None) per pair, in order
+    """
+    # Pages already analysed for this term are answered from the memo
+    answers = {}
+    for pair in pairs:
+        remembered = _recall_term((french_term, *pair))
+        if remembered is not None:
+            answers[pair] = remembered
+    unseen = list(dict.fromkeys(pair for pair in pairs if pair not in answers))
+    if len(unseen) <= 1:
+        return [_extract_english_term(french_term, fr, en) for fr, en in pairs]
+
+    if not ANTHROPIC_API_KEY:
+        print("Warning: ANTHROPIC_API_KEY not set")
+        return [None] * len(pairs)
+
+    try:
+        for pair, term in _ask_claude_batch(MODEL, french_term, unseen).items():
+            answers[pair] = term
+            if term != "NOT_FOUND":
+                _remember_term((french_term, *pair), term)
+
+        # Pages Haiku couldn't align get a second look from the larger model
+        retry = [pair for pair in unseen if answers.get(pair) == "NOT_FOUND"]
+        if retry:
+            for pair, term in _ask_claude_batch(FALLBACK_MODEL, french_term, retry).items():
+                answers[pair] = term
+                _remember_term((french_term, *pair), term)
+        return [answers.get(pair) for pair in pairs]
+
+    except Exception as e:
+        # Fall back to one call per page rather than losing every answer
+        print(f"Error in batched Claude lookup ({e}), asking per page")
+        return [_extract_english_term(french_term, fr, en) for fr, en in pairs]
+
+
+def _ask_claude_batch(
+    model: str,
+    french_term: str,
+    pairs: List[Tuple[str, str]]
+) -> Dict[Tuple[str, str], str]:
+    """
+    Ask for the English equivalent on several page pairs in one call.
+
+    Returns:
+        The answer for each pair the reply covered
+
+    Raises:
+        Exception: If the call fails or the reply holds no JSON
+    """
+    sections = "\n\n".join(
+        f"""PAGE {i}
+FRENCH PAGE CONTENT:
+{french_content[:PROMPT_CONTENT_CHARS]}
+
+ENGLISH PAGE CONTENT:
+{english_content[:PROMPT_CONTENT_CHARS]}"""
+        for i, (french_content, english_content) in enumerate(pairs, 1)
+    )
+
+    prompt = f"""FRENCH TERM TO FIND: {french_term}
+
+{sections}
+
+Answer for each of the {len(pairs)} pages above.
+Reply with ONLY valid JSON, one entry per page:
+{{"results": [{{"index": 1, "term": "English term"}}]}}
+Use "NOT_FOUND" as the term for a page where you cannot find an equivalent."""
+
+    # Extract JSON from response (handle potential extra text)
+    json_match = re.search(r'\{[\s\S]*\}', _ask_claude(model, prompt, max_tokens=300))
+    if not json_match:
+        raise ValueError("no JSON object in response")
+
+    found = {}
+    for item in json.loads(json_match.group())['results']:
+        index = int(item['index'])
+        if 1 <= index <= len(pairs):
+            found[pairs[index - 1]] = str(item['term']).strip()
+    return found
+
+
 def get_manual_search_url(search_term: str) -> str:
     """
     Get the manual search URL for canada.ca.
@@ -3,15 +3,18 @@ OQLF Web Scraper
 
 Scrapes terminology from Office québécois de la langue française (OQLF)
 Vitrine linguistique / Grand dictionnaire terminologique (GDT).
-Uses requests + BeautifulSoup (no Selenium needed - results are in static HTML).
+Uses requests + lxml (no Selenium needed - results are in static HTML).
 """
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 from urllib.parse import quote_plus
 
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+
+from tools.scrape_cache import cached
 
 
 _SESSION = requests.Session()
@@ -19,7 +22,24 @@ _SESSION.headers.update({
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
 })
 
+# Patterns used for every search result article
+_DOMAIN_CLASS_RE = re.compile(r'domain|category|breadcrumb|tag', re.I)
+_DOMAIN_LINE_RE = re.compile(r'[Dd]omaine\s*[:\s]\s*([^\n.]+)')
+_DESC_CLASS_RE = re.compile(r'result.*desc|snippet|excerpt', re.I)
+_WS_RE = re.compile(r'\s+')
+_DOMAIN_TAGS = frozenset({'span', 'a'})
+_DESC_TAGS = frozenset({'p', 'div'})
+_CLASSED_TAGS = _DOMAIN_TAGS | _DESC_TAGS
+_TEXT_BLOCK_TAGS = frozenset({'p', 'span', 'div'})
+
+# Result page lookups, evaluated by lxml in C
+_HTML_PARSER = etree.HTMLParser(encoding='utf-8')
+_RESULT_ARTICLES_XP = etree.XPath("//article[contains(concat(' ', normalize-space(@class), ' '), ' result ')]")
+# Never-visible subtrees, emptied once per page so text lookups skip them
+_HIDDEN_TAGS = ('script', 'style', 'noscript', 'svg', 'template')
+
 
+@cached('oqlf')
 def scrape(search_term: str) -> List[Dict[str, str]]:
     """
     Scrape OQLF Vitrine Linguistique / GDT for terminology.
@@ -67,7 +87,7 @@ def scrape(search_term: str) -> List[Dict[str, str]]:
             'english_term': "[Recherche manuelle]",
             'description': f"Impossible d'extraire les resultats. Veuillez rechercher manuellement.",
             'domain': "",
-            'source_url': get_manual_search_url(search_term)
+            'source_url': search_url
         }]
 
 
@@ -83,10 +103,16 @@ def _find_and_parse_gdt_results(html: str, search_term: str) -> List[Dict[str, s
     results = []
 
     try:
-        soup = BeautifulSoup(html, 'html.parser')
+        root = etree.fromstring(html.encode('utf-8'), _HTML_PARSER) if html else None
+        if root is None:
+            return results
+
+        # Empty script, style and other hidden elements; text after them stays
+        for element in list(root.iter(*_HIDDEN_TAGS)):
+            element.clear(keep_tail=True)
 
         # Find all result articles with GDT fiches
-        articles = soup.find_all('article', class_='result')
+        articles = _RESULT_ARTICLES_XP(root)
 
         gdt_articles = []
         for article in articles:
@@ -112,7 +138,7 @@ def _find_and_parse_gdt_results(html: str, search_term: str) -> List[Dict[str, s
     return results
 
 
-def _extract_from_search_result(article) -> Optional[Dict[str, str]]:
+def _extract_from_search_result(article: etree._Element) -> Optional[Dict[str, str]]:
     """
     Extract terminology data directly from a search result article.
 
@@ -143,39 +169,52 @@ def _extract_from_search_result(article) -> Optional[Dict[str, str]]:
     else:
         full_url = url
 
-    # Try to extract domain from breadcrumb or category info
-    domain_elem = article.find(['span', 'a'], class_=re.compile(r'domain|category|breadcrumb|tag', re.I))
-    if domain_elem:
-        domain = domain_elem.get_text(strip=True)
-
-    # Also look for domain in any element containing "Domaine"
+    # One walk over the article reads the first domain-like span/link and
+    # the first description-like block, and collects the text blocks the
+    # fallbacks below scan
+    domain_elem = None
+    desc_elem = None
+    text_blocks = []
+    for elem in article.iterdescendants():
+        tag = elem.tag
+        if tag in _TEXT_BLOCK_TAGS:
+            text_blocks.append(elem)
+        css_class = elem.get('class') if tag in _CLASSED_TAGS else None
+        if css_class is None:
+            continue
+        css_class = _ws(css_class)
+
+        # Domain from breadcrumb or category info
+        if domain_elem is None and tag in _DOMAIN_TAGS and _DOMAIN_CLASS_RE.search(css_class):
+            domain_elem = elem
+            domain = _text(elem)
+
+        # Definition from a description-like paragraph or block
+        if desc_elem is None and tag in _DESC_TAGS and _DESC_CLASS_RE.search(css_class):
+            desc_elem = elem
+            # Use separator=' ' to ensure spaces between nested elements,
+            # then collapse multiple spaces into one
+            description = _ws(_text(elem, ' '))
+
+        if domain and description:
+            # Neither fallback below will run
+            break
+
+    # Also look for a "Domaine : ..." label anywhere in the article text
+    # (one text node per line, so the value stops at the end of its node)
     if not domain:
-        for elem in article.find_all(['span', 'div', 'p']):
-            text = elem.get_text(strip=True)
-            if 'Domaine' in text or 'domaine' in text:
-                # Extract the domain value after the label
-                domain_match = re.search(r'[Dd]omaine\s*[:\s]\s*(.+?)(?:\.|$)', text)
-                if domain_match:
-                    domain = domain_match.group(1).strip()[:100]
-                    break
-
-    # Try to get definition from the article text
-    # Look for paragraph or description elements
-    desc_elem = article.find(['p', 'div'], class_=re.compile(r'result.*desc|snippet|excerpt', re.I))
-    if desc_elem:
-        # Use separator=' ' to ensure spaces between nested elements
-        raw_text = desc_elem.get_text(separator=' ', strip=True)
-        # Normalize whitespace (collapse multiple spaces into one)
-        description = ' '.join(raw_text.split())
+        domain_match = _DOMAIN_LINE_RE.search(_text(article, '\n'))
+        if domain_match:
+            domain = domain_match.group(1).strip()[:100]
 
     # If no description found, try to get any text content
     if not description:
         # Get all text from the article, excluding the title
         text_parts = []
-        for elem in article.find_all(['p', 'span', 'div']):
+        for elem in text_blocks:
             # Use separator=' ' to ensure spaces between nested elements
-            raw_text = elem.get_text(separator=' ', strip=True)
-            text = ' '.join(raw_text.split())  # Normalize whitespace
+            raw_text = _text(elem, ' ')
+            text = _ws(raw_text)  # Normalize whitespace
             if text and text != data_title and len(text) > 20:
                 text_parts.append(text)
         if text_parts:
@@ -192,6 +231,34 @@ def _extract_from_search_result(article) -> Optional[Dict[str, str]]:
     return None
 
 
+def _text(element: etree._Element, separator: str = '') -> str:
+    """An element's visible text, each piece stripped and joined with separator."""
+    return separator.join(filter(None, (t.strip() for t in element.itertext())))
+
+
+def _ws(text: str) -> str:
+    """Collapse every whitespace run to a single space and trim the ends."""
+    return _WS_RE.sub(' ', text).strip()
+
+
+def scrape_many(terms: List[str], concurrency: int = 8) -> Dict[str, List[Dict[str, str]]]:
+    """
+    Scrape several terms concurrently.
+
+    Lookups are I/O-bound, so up to `concurrency` run at once.
+
+    Args:
+        terms: Terms to search for
+        concurrency: Maximum number of lookups in flight
+
+    Returns:
+        Dictionary mapping each term to its scrape() results
+    """
+    unique_terms = list(dict.fromkeys(terms))
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(unique_terms)))) as executor:
+        return dict(zip(unique_terms, executor.map(scrape, unique_terms)))
+
+
 def get_manual_search_url(search_term: str) -> str:
     """
     Get the manual search URL for OQLF Vitrine Linguistique (GDT).
@@ -217,12 +284,15 @@ if __name__ == "__main__":
     if len(sys.argv) > 1:
         test_terms = [sys.argv[1]]
 
+    # Look up every test term at once, then report them in order
+    results_by_term = scrape_many(test_terms)
+
     for term in test_terms:
-        print(f"\nSearching for: {term}")
+        print(f"\nResults for: {term}")
         print("=" * 50)
 
         try:
-            results = scrape(term)
+            results = results_by_term[term]
 
             if results:
                 print(f"\nFound {len(results)} result(s):")
@@ -2,16 +2,22 @@
 TERMIUM Plus Web Scraper
 
 Scrapes terminology from TERMIUM Plus (Government of Canada terminology database).
-Uses Selenium for JavaScript rendering.
+Result pages are fetched over plain HTTP; Selenium is only used when the
+results need JavaScript rendering.
 """
 
+import atexit
 import os
+import threading
 import time
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Dict, Optional
 from urllib.parse import quote_plus, unquote
 
-from bs4 import BeautifulSoup
+import requests
+from lxml import etree
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -19,7 +25,72 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
+from tools.scrape_cache import cached
 
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+HTTP_TIMEOUT_SECONDS = 10
+
+_SESSION = requests.Session()
+_SESSION.headers['User-Agent'] = USER_AGENT
+
+# Subresources the browser never needs for reading results
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.woff*", "*.css", "*.mp4",
+    "*/analytics*", "*googletagmanager*", "*doubleclick*",
+]
+
+# Elements that show the results page has rendered (records or no-results notice)
+RESULTS_READY_SELECTOR = "section.recordSet, .noResult"
+
+# Serializes only the element holding the records (#resultrecs or <main>,
+# else <body>), minus scripts and styles, instead of the whole page_source.
+# A copy is trimmed so the live page is left as is.
+_RESULTS_HTML_JS = """
+var record = document.querySelector('section.recordSet, .recordSet');
+var container = (record && record.closest('#resultrecs, main')) || document.body;
+var copy = container.cloneNode(true);
+copy.querySelectorAll('script, style, noscript, iframe').forEach(function (n) { n.remove(); });
+return copy.outerHTML;
+"""
+
+# TERMIUM's "no results" notice
+_NO_RESULT_RE = re.compile(r'class="[^"]*\bnoResult\b')
+
+# Patterns used for every record (see _extract_termium_record / _clean_description)
+_DEF_TITLE_RE = re.compile(r'finition', re.I)
+_OBS_TITLE_RE = re.compile(r'observation', re.I)
+# Trailing fiche reference ("2, fiche 2, Français, -couleur") and/or the
+# comma or semicolon left in front of it
+_DESC_TAIL_RE = re.compile(
+    r'(?:\s*[,;])?(?:\s*\d+,\s*fiche\s*\d+,\s*(?:Fran.ais|Anglais|Espagnol|Portugais),?\s*-?\s*\S*)?\s*$', re.I
+)
+_RECORD_PREFIX_RE = re.compile(r'^Record number:\s*\d+,\s*Textual support number:\s*\d+\s*')
+_WS_RE = re.compile(r'\s+')
+
+# Record lookups, evaluated by lxml in C
+_HTML_PARSER = etree.HTMLParser(encoding='utf-8')
+_RECORD_CLASS = "contains(concat(' ', normalize-space(@class), ' '), ' recordSet ')"
+_RECORD_SECTIONS_XP = etree.XPath(f"//section[{_RECORD_CLASS}]")
+_RECORD_ELEMENTS_XP = etree.XPath(f"//*[{_RECORD_CLASS}]")
+_EN_TERMS_XP = etree.XPath(".//span[@lang='en']")
+_LABELLED_ABBRS_XP = etree.XPath(".//abbr[string() = $label]")
+_TITLED_ABBRS_XP = etree.XPath(".//abbr[@title]")
+_NOTE_PARAGRAPH_XP = etree.XPath("ancestor::h5[1]/following-sibling::*[1][self::p]")
+_PARAGRAPHS_XP = etree.XPath(".//p")
+_H5_XP = etree.XPath(".//h5")
+_NEXT_UL_XP = etree.XPath("(descendant::ul | following::ul)[1]")
+_LI_XP = etree.XPath(".//li")
+# Never-visible subtrees, emptied once per page so text lookups skip them
+_HIDDEN_TAGS = ('script', 'style', 'noscript', 'svg', 'template')
+
+# One headless Chrome reused across scrape() calls (Selenium sessions aren't
+# thread-safe, so callers take turns on it)
+_DRIVER = None
+_DRIVER_LOCK = threading.Lock()
+
+
+@cached('termium')
 def scrape(search_term: str, language_pair: str = "fr-en") -> List[Dict[str, str]]:
     """
     Scrape TERMIUM Plus for French-to-English term translations.
@@ -40,42 +111,34 @@ def scrape(search_term: str, language_pair: str = "fr-en") -> List[Dict[str, str
     """
     print(f"Searching TERMIUM Plus for: '{search_term}'")
 
-    # Configure Chrome options for headless browsing
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")  # Run in background
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--disable-extensions")
-    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
-    chrome_options.add_argument("--window-size=1920,1080")
-    chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
-    if os.environ.get("CHROME_BIN"):
-        chrome_options.binary_location = os.environ["CHROME_BIN"]
+    # Construct TERMIUM Plus search URL (French interface)
+    encoded_term = quote_plus(search_term)
+    url = f"https://www.btb.termiumplus.gc.ca/tpv2alpha/alpha-fra.html?lang=fra&i=1&srchtxt={encoded_term}&index=alt&codom2nd_wet=1#resultrecs"
+
+    # Server-rendered results need no browser
+    html = _fetch_html(url)
+    if html is not None:
+        results = _parse_results(html, url)
+        if results:
+            print(f"[OK] Found {len(results)} result(s)")
+            return results
+        if _NO_RESULT_RE.search(html):
+            print(f"No results found for '{search_term}'")
+            return []
 
-    driver = None
     try:
-        # Initialize Chrome driver
-        driver = webdriver.Chrome(options=chrome_options)
+        with _DRIVER_LOCK:
+            driver = _get_driver()
+            driver.delete_all_cookies()
 
-        # Construct TERMIUM Plus search URL (French interface)
-        encoded_term = quote_plus(search_term)
-        url = f"https://www.btb.termiumplus.gc.ca/tpv2alpha/alpha-fra.html?lang=fra&i=1&srchtxt={encoded_term}&index=alt&codom2nd_wet=1#resultrecs"
-
-        print(f"Loading: {url}")
-        driver.get(url)
+            print(f"Loading: {url}")
+            driver.get(url)
 
-        # Wait for results to load (or timeout quickly if no results)
-        try:
-            WebDriverWait(driver, 8).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "section.recordSet, .noResult, #resultrecs"))
-            )
-        except TimeoutException:
-            print("Warning: Timeout waiting for results.")
-            time.sleep(1)
+            # Wait for results to load (or timeout quickly if no results)
+            _wait_for_results(driver)
 
-        # Parse results
-        results = _parse_results(driver)
+            # Parse results
+            results = _parse_results(driver.execute_script(_RESULTS_HTML_JS), driver.current_url)
 
         if not results:
             print(f"No results found for '{search_term}'")
@@ -86,25 +149,103 @@ def scrape(search_term: str, language_pair: str = "fr-en") -> List[Dict[str, str
 
     except Exception as e:
         print(f"[ERROR] Error scraping TERMIUM Plus: {e}")
+        with _DRIVER_LOCK:
+            close_driver()  # Don't reuse a session that may be broken
         # Return manual link as fallback
         return [{
             'english_term': f"[Recherche manuelle]",
             'description': f"Impossible d'extraire les résultats. Veuillez rechercher manuellement sur TERMIUM Plus.",
             'domain': "",
-            'source_url': f"https://www.btb.termiumplus.gc.ca/tpv2alpha/alpha-fra.html?lang=fra&i=1&srchtxt={quote_plus(search_term)}"
+            'source_url': f"https://www.btb.termiumplus.gc.ca/tpv2alpha/alpha-fra.html?lang=fra&i=1&srchtxt={encoded_term}"
         }]
 
-    finally:
-        if driver:
+
+def _wait_for_results(driver) -> None:
+    """
+    Wait until the result records (or the "no results" notice) are rendered.
+
+    On timeout, give the page one more second and carry on with whatever
+    page_source has loaded.
+    """
+    try:
+        WebDriverWait(driver, 8, poll_frequency=0.1).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, RESULTS_READY_SELECTOR))
+        )
+    except TimeoutException:
+        print("Warning: Timeout waiting for results.")
+        time.sleep(1)
+
+
+@lru_cache(maxsize=1)
+def _get_chrome_options() -> Options:
+    """Configure Chrome for headless scraping (built once, reused on driver restarts)."""
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")  # Run in background
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument(f"--user-agent={USER_AGENT}")
+    # Block assets _parse_results() never reads (JavaScript stays on)
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.stylesheets": 2,
+        "profile.managed_default_content_settings.fonts": 2,
+        "profile.managed_default_content_settings.plugins": 2,
+    })
+    if os.environ.get("CHROME_BIN"):
+        chrome_options.binary_location = os.environ["CHROME_BIN"]
+    return chrome_options
+
+
+def _get_driver():
+    """Return the shared Chrome driver, starting it on first use (call with _DRIVER_LOCK held)."""
+    global _DRIVER
+    if _DRIVER is None:
+        driver = webdriver.Chrome(options=_get_chrome_options())
+        try:
+            # Also drop media and trackers at the network layer
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except Exception:
             driver.quit()
+            raise
+        _DRIVER = driver
+    return _DRIVER
 
 
-def _parse_results(driver) -> List[Dict[str, str]]:
+@atexit.register
+def close_driver():
+    """Shut down the shared Chrome driver, if running (e.g. at the end of a CLI run)."""
+    global _DRIVER
+    if _DRIVER is not None:
+        try:
+            _DRIVER.quit()
+        except Exception:
+            pass
+        _DRIVER = None
+
+
+def _fetch_html(url: str) -> Optional[str]:
+    """Fetch a page's HTML with a plain HTTP GET; None if it fails."""
+    try:
+        resp = _SESSION.get(url, timeout=HTTP_TIMEOUT_SECONDS)
+        resp.raise_for_status()
+        return resp.text
+    except requests.RequestException as e:
+        print(f"HTTP fetch failed, falling back to browser ({e})")
+        return None
+
+
+def _parse_results(html: str, source_url: str) -> List[Dict[str, str]]:
     """
-    Parse search results from TERMIUM Plus page using BeautifulSoup.
+    Parse search results from TERMIUM Plus page using lxml.
 
     Args:
-        driver: Selenium WebDriver instance
+        html: Page HTML
+        source_url: URL the page was loaded from
 
     Returns:
         List of all English term variants with english_term, description, domain, source_url
@@ -112,21 +253,26 @@ def _parse_results(driver) -> List[Dict[str, str]]:
     results = []
 
     try:
-        # Get page source and parse with BeautifulSoup
-        html = driver.page_source
-        soup = BeautifulSoup(html, 'html.parser')
+        # Parse page source
+        root = etree.fromstring(html.encode('utf-8'), _HTML_PARSER) if html else None
+        if root is None:
+            return results
+
+        # Empty script, style and other hidden elements; text after them stays
+        for element in list(root.iter(*_HIDDEN_TAGS)):
+            element.clear(keep_tail=True)
 
         # TERMIUM organizes results in <section class="panel panel-info recordSet">
-        record_sections = soup.find_all('section', class_='recordSet')
+        record_sections = _RECORD_SECTIONS_XP(root)
 
         if not record_sections:
             # Fallback to any element with recordSet class
-            record_sections = soup.find_all(class_='recordSet')
+            record_sections = _RECORD_ELEMENTS_XP(root)
 
         for i, section in enumerate(record_sections[:10]):
             try:
                 # _extract_termium_record now returns a LIST of variants
-                variants = _extract_termium_record(section, driver.current_url)
+                variants = _extract_termium_record(section, source_url)
                 for variant in variants:
                     if variant and variant.get('english_term'):
                         results.append(variant)
@@ -140,7 +286,7 @@ def _parse_results(driver) -> List[Dict[str, str]]:
     return results
 
 
-def _extract_termium_record(section, source_url: str) -> List[Dict[str, str]]:
+def _extract_termium_record(section: etree._Element, source_url: str) -> List[Dict[str, str]]:
     """
     Extract ALL English term variants from a TERMIUM record section.
 
@@ -157,57 +303,20 @@ def _extract_termium_record(section, source_url: str) -> List[Dict[str, str]]:
     domain = ""
 
     # Find ALL English terms - look for span with lang="en"
-    en_terms = section.find_all('span', attrs={'lang': 'en'})
+    en_terms = _EN_TERMS_XP(section)
 
-    # Find definition - look for DEF abbreviation and get following paragraph
-    def_abbrs = section.find_all('abbr', string='DEF')
-    if not def_abbrs:
-        # Try finding by title attribute
-        def_abbrs = section.find_all('abbr', attrs={'title': re.compile(r'finition', re.I)})
-
-    if def_abbrs:
-        for abbr in def_abbrs:
-            # The definition text is usually in the same h5 parent or following p
-            parent_h5 = abbr.find_parent('h5')
-            if parent_h5:
-                # Get the next sibling which should be the definition paragraph
-                next_elem = parent_h5.find_next_sibling()
-                if next_elem and next_elem.name == 'p':
-                    # Use separator to ensure proper spacing between nested elements
-                    raw_text = next_elem.get_text(separator=' ', strip=True)
-                    def_text = ' '.join(raw_text.split())  # Normalize whitespace
-                    # Clean up: remove trailing fiche references
-                    def_text = _clean_description(def_text)
-                    if def_text and len(def_text) > 10:
-                        description = def_text[:500]
-                        break
+    # Find definition - the paragraph after the h5 holding the DEF abbreviation
+    description = _note_text(section, 'DEF', _DEF_TITLE_RE)
 
     # If no DEF found, try OBS (Observation) abbreviation
     if not description:
-        obs_abbrs = section.find_all('abbr', string='OBS')
-        if not obs_abbrs:
-            obs_abbrs = section.find_all('abbr', attrs={'title': re.compile(r'observation', re.I)})
-
-        for abbr in obs_abbrs:
-            parent_h5 = abbr.find_parent('h5')
-            if parent_h5:
-                next_elem = parent_h5.find_next_sibling()
-                if next_elem and next_elem.name == 'p':
-                    # Use separator to ensure proper spacing
-                    raw_text = next_elem.get_text(separator=' ', strip=True)
-                    obs_text = ' '.join(raw_text.split())  # Normalize whitespace
-                    obs_text = _clean_description(obs_text)
-                    if obs_text and len(obs_text) > 10:
-                        description = obs_text[:500]
-                        break
+        description = _note_text(section, 'OBS', _OBS_TITLE_RE)
 
     # If still no description, look for any meaningful paragraph in the section
     if not description:
-        paragraphs = section.find_all('p')
-        for p in paragraphs:
-            # Use separator to ensure proper spacing
-            raw_text = p.get_text(separator=' ', strip=True)
-            text = ' '.join(raw_text.split())  # Normalize whitespace
+        for p in _PARAGRAPHS_XP(section):
+            # Normalize whitespace
+            text = _ws(_text(p, ' '))
             # Skip short texts - be less restrictive (don't skip 'fiche' entirely)
             if len(text) > 30 and not any(skip in text.lower() for skip in ['conserver', 'record number']):
                 text = _clean_description(text)
@@ -216,23 +325,22 @@ def _extract_termium_record(section, source_url: str) -> List[Dict[str, str]]:
                     break
 
     # Find domain - look for h5 containing "Domaine" or "Subject" (remove class filter)
-    domain_headers = section.find_all('h5')
-    for h5 in domain_headers:
-        h5_text = h5.get_text(strip=True)
+    for h5 in _H5_XP(section):
+        h5_text = _text(h5)
         if 'Domaine' in h5_text or 'Subject' in h5_text:
             # Domain list is in the next ul (not necessarily a sibling)
-            domain_list = h5.find_next('ul')
+            domain_list = _NEXT_UL_XP(h5)
             if domain_list:
-                domains = [li.get_text(strip=True) for li in domain_list.find_all('li')]
+                domains = [_text(li) for li in _LI_XP(domain_list[0])]
                 domain = ', '.join(domains[:3])  # Limit to 3 domains
                 break
 
     # Create a variant entry for EACH English term found
     seen_terms = set()  # Avoid duplicates
     for en_term_elem in en_terms:
-        raw_term = en_term_elem.get_text(strip=True)
-        # Decode URL-encoded characters (e.g., %20 -> space)
-        english_term = unquote(raw_term)
+        raw_term = _text(en_term_elem)
+        # Decode URL-encoded characters (e.g., %20 -> space); most terms have none
+        english_term = unquote(raw_term) if '%' in raw_term else raw_term
 
         # Skip empty terms or duplicates
         if not english_term or english_term.lower() in seen_terms:
@@ -249,18 +357,70 @@ def _extract_termium_record(section, source_url: str) -> List[Dict[str, str]]:
     return variants
 
 
+def _note_text(section: etree._Element, label: str, title_re: re.Pattern) -> str:
+    """
+    Return the cleaned paragraph following a labelled note header (DEF, OBS).
+
+    The note's <abbr> is matched by its text, or failing that by its title;
+    its text is in the paragraph right after the enclosing h5.
+    """
+    abbrs = _LABELLED_ABBRS_XP(section, label=label)
+    if not abbrs:
+        # Try finding by title attribute
+        abbrs = [abbr for abbr in _TITLED_ABBRS_XP(section) if title_re.search(abbr.get('title'))]
+
+    for abbr in abbrs:
+        next_elem = _NOTE_PARAGRAPH_XP(abbr)
+        if next_elem:
+            # Use separator to ensure proper spacing between nested elements
+            note_text = _ws(_text(next_elem[0], ' '))  # Normalize whitespace
+            # Clean up: remove trailing fiche references
+            note_text = _clean_description(note_text)
+            if note_text and len(note_text) > 10:
+                return note_text[:500]
+
+    return ""
+
+
+def _text(element: etree._Element, separator: str = '') -> str:
+    """An element's visible text, each piece stripped and joined with separator."""
+    return separator.join(filter(None, (t.strip() for t in element.itertext())))
+
+
+def _ws(text: str) -> str:
+    """Collapse every whitespace run to a single space and trim the ends."""
+    return _WS_RE.sub(' ', text).strip()
+
+
 def _clean_description(text: str) -> str:
     """Remove trailing fiche metadata from description text."""
-    # Remove patterns like "2, fiche 2, Français, -couleur" or "1, fiche 10, Anglais, - colour" at the end
-    # Handle various spacing patterns around the hyphen and term
-    cleaned = re.sub(r'\s*\d+,\s*fiche\s*\d+,\s*(?:Fran.ais|Anglais|Espagnol|Portugais),?\s*-?\s*\S*\s*$', '', text, flags=re.IGNORECASE)
+    # Remove patterns like "2, fiche 2, Français, -couleur" or "1, fiche 10, Anglais, - colour"
+    # at the end, along with any punctuation left in front of them
+    cleaned = _DESC_TAIL_RE.sub('', text, count=1)
     # Also remove any "Record number:" prefixes that might appear
-    cleaned = re.sub(r'^Record number:\s*\d+,\s*Textual support number:\s*\d+\s*', '', cleaned)
-    # Remove trailing punctuation that may be left over
-    cleaned = re.sub(r'\s*[,;]\s*$', '', cleaned)
+    cleaned = _RECORD_PREFIX_RE.sub('', cleaned)
     return cleaned.strip()
 
 
+def scrape_many(terms: List[str], concurrency: int = 8) -> Dict[str, List[Dict[str, str]]]:
+    """
+    Scrape several terms concurrently.
+
+    Lookups are I/O-bound, so up to `concurrency` run at once (browser fallbacks
+    still take turns on the shared driver).
+
+    Args:
+        terms: Terms to search for
+        concurrency: Maximum number of lookups in flight
+
+    Returns:
+        Dictionary mapping each term to its scrape() results
+    """
+    unique_terms = list(dict.fromkeys(terms))
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(unique_terms)))) as executor:
+        return dict(zip(unique_terms, executor.map(scrape, unique_terms)))
+
+
 def get_manual_search_url(search_term: str) -> str:
     """
     Get the manual search URL for TERMIUM Plus (French interface).
@@ -277,29 +437,14 @@ def get_manual_search_url(search_term: str) -> str:
 
 def debug_fetch_html(search_term: str) -> str:
     """Fetch and return the raw HTML for debugging purposes."""
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--disable-extensions")
-    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
-    chrome_options.add_argument("--window-size=1920,1080")
-    chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
-    if os.environ.get("CHROME_BIN"):
-        chrome_options.binary_location = os.environ["CHROME_BIN"]
-
-    driver = None
-    try:
-        driver = webdriver.Chrome(options=chrome_options)
-        encoded_term = quote_plus(search_term)
-        url = f"https://www.btb.termiumplus.gc.ca/tpv2alpha/alpha-fra.html?lang=fra&i=1&srchtxt={encoded_term}&index=alt&codom2nd_wet=1#resultrecs"
+    encoded_term = quote_plus(search_term)
+    url = f"https://www.btb.termiumplus.gc.ca/tpv2alpha/alpha-fra.html?lang=fra&i=1&srchtxt={encoded_term}&index=alt&codom2nd_wet=1#resultrecs"
+    with _DRIVER_LOCK:
+        driver = _get_driver()
+        driver.delete_all_cookies()
         driver.get(url)
-        time.sleep(3)
+        _wait_for_results(driver)
         return driver.page_source
-    finally:
-        if driver:
-            driver.quit()
 
 
 if __name__ == "__main__":
@@ -322,12 +467,15 @@ if __name__ == "__main__":
 
     test_terms = ["couleur", "rigueur"]
 
+    # Look up every test term at once, then report them in order
+    results_by_term = scrape_many(test_terms)
+
     for term in test_terms:
-        print(f"\nSearching for: {term}")
+        print(f"\nResults for: {term}")
         print("=" * 50)
 
         try:
-            results = scrape(term)
+            results = results_by_term[term]
 
             if results:
                 print(f"\nFound {len(results)} English variant(s):")
@@ -347,3 +495,5 @@ if __name__ == "__main__":
             print(f"Error: {e}")
 
         print()
+
+    close_driver()
@@ -11,17 +11,37 @@ No Azure app registration needed. The sharing URL provides both
 read (download) and write (upload via REST API) access.
 """
 
+import atexit
+import hashlib
+import json
+import logging
 import os
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Tuple
 from urllib.parse import urlparse, parse_qs
 
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Downloads are written to disk in pieces of this size
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Where the sharing URL resolves to (site, file path) - stable, so kept across restarts
+LOCATION_CACHE_FILE = Path(__file__).parent.parent / '.tmp' / 'sharepoint_location.json'
+
+# ETag of the last downloaded copy, and when SharePoint was last asked about it
+DOWNLOAD_STATE_FILE = Path(__file__).parent.parent / '.tmp' / 'sharepoint_download.json'
+
+# A local copy downloaded or confirmed this recently is used without asking again
+DOWNLOAD_TTL_SECONDS = 60
+
 
 class SharePointClient:
     """
@@ -34,7 +54,15 @@ class SharePointClient:
 
     def __init__(self):
         self.sharing_url = os.getenv('SHAREPOINT_SHARING_URL', '')
+        # One connection pool for every request, so keep-alive connections
+        # (and their TLS sessions) survive across auth, download and upload
+        self._http = requests.Session()
+        self._http.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+        # Set to _http once it holds a valid FedAuth cookie
         self._session: Optional[requests.Session] = None
+        # Transfers run one at a time on a background thread, in submission
+        # order, so an upload is never overtaken by a later download
+        self._transfers = ThreadPoolExecutor(max_workers=1, thread_name_prefix='sharepoint')
         self._session_created_at: float = 0
         self._digest: Optional[str] = None
         self._digest_expires_at: float = 0
@@ -74,21 +102,28 @@ class SharePointClient:
             self._digest = None
             self._digest_expires_at = 0
 
-        # Step 1: Extract file GUID from first redirect (no viewer loaded)
+        # Start from an empty cookie jar; pooled connections are kept
+        self._http.cookies.clear()
+
+        # Step 1: Extract file GUID from first redirect (no viewer loaded),
+        # unless the file's location is already known (this run or a cached one)
         guid = None
-        try:
-            resp0 = requests.get(self.sharing_url, allow_redirects=False, timeout=10)
-            redirect_url = resp0.headers.get('Location', '')
-            if redirect_url:
-                parsed_redirect = urlparse(redirect_url)
-                params = parse_qs(parsed_redirect.query)
-                guid = params.get('sourcedoc', [''])[0].strip('{}')
-
-                # Derive base URL from redirect path
-                path_before_layouts = parsed_redirect.path.split('/_layouts/')[0]
-                self._base_url = f"{parsed_redirect.scheme}://{parsed_redirect.netloc}{path_before_layouts}"
-        except Exception:
-            pass
+        if not (self._folder_url and self._file_name):
+            self._load_location()
+        if not (self._folder_url and self._file_name):
+            try:
+                resp0 = self._http.get(self.sharing_url, allow_redirects=False, timeout=10)
+                redirect_url = resp0.headers.get('Location', '')
+                if redirect_url:
+                    parsed_redirect = urlparse(redirect_url)
+                    params = parse_qs(parsed_redirect.query)
+                    guid = params.get('sourcedoc', [''])[0].strip('{}')
+
+                    # Derive base URL from redirect path
+                    path_before_layouts = parsed_redirect.path.split('/_layouts/')[0]
+                    self._base_url = f"{parsed_redirect.scheme}://{parsed_redirect.netloc}{path_before_layouts}"
+            except Exception:
+                pass
 
         # Fallback: derive base URL from sharing URL
         if not self._base_url:
@@ -103,7 +138,7 @@ class SharePointClient:
             raise RuntimeError("Could not derive SharePoint base URL from sharing URL")
 
         # Step 2: Get FedAuth cookie via download URL (no viewer opened)
-        session = requests.Session()
+        session = self._http
         download_url = self.sharing_url
         if '?' in download_url:
             download_url += '&download=1'
@@ -130,6 +165,12 @@ class SharePointClient:
         self._digest = None
         self._digest_expires_at = 0
 
+    def close(self):
+        """Finish queued transfers, then drop the session and close its pooled connections."""
+        self._transfers.shutdown(wait=True)
+        self._invalidate_session()
+        self._http.close()
+
     def _resolve_file_path(self, session: requests.Session, guid: str):
         """Resolve file GUID to server-relative URL via GetFileById."""
         if self._folder_url and self._file_name:
@@ -147,12 +188,104 @@ class SharePointClient:
                 self._file_name = data.get('Name', '')
                 if self._server_relative_url:
                     self._folder_url = '/'.join(self._server_relative_url.split('/')[:-1])
-                print(f"[SharePoint] Resolved: {self._file_name} "
-                      f"({data.get('Length', '?')} bytes)")
+                logger.info("[SharePoint] Resolved: %s (%s bytes)",
+                            self._file_name, data.get('Length', '?'))
+                if self._folder_url and self._file_name:
+                    self._save_location()
             else:
-                print(f"[SharePoint] Warning: GetFileById returned {resp.status_code}")
+                logger.warning("[SharePoint] GetFileById returned %s", resp.status_code)
         except Exception as e:
-            print(f"[SharePoint] Warning: Could not resolve file path: {e}")
+            logger.warning("[SharePoint] Could not resolve file path: %s", e)
+
+    def _location_key(self) -> str:
+        """Identify the sharing URL a cached location belongs to."""
+        return hashlib.sha1(self.sharing_url.encode('utf-8')).hexdigest()
+
+    def _load_location(self):
+        """Restore the base URL and file path resolved by an earlier run, if any."""
+        try:
+            with open(LOCATION_CACHE_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if data.get('key') != self._location_key():
+            return
+        if data.get('base_url') and data.get('folder_url') and data.get('file_name'):
+            self._base_url = data['base_url']
+            self._server_relative_url = data.get('server_relative_url', '')
+            self._folder_url = data['folder_url']
+            self._file_name = data['file_name']
+
+    def _save_location(self):
+        """Remember the resolved base URL and file path for later runs."""
+        try:
+            LOCATION_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            data = {
+                'key': self._location_key(),
+                'base_url': self._base_url,
+                'server_relative_url': self._server_relative_url,
+                'folder_url': self._folder_url,
+                'file_name': self._file_name,
+            }
+            # Temp file + atomic rename, so a reader never sees half a file
+            tmp_path = LOCATION_CACHE_FILE.with_name(f"{LOCATION_CACHE_FILE.name}.tmp-{os.getpid()}")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, LOCATION_CACHE_FILE)
+        except OSError as e:
+            logger.warning("[SharePoint] Could not cache file location: %s", e)
+
+    def _forget_location(self):
+        """Drop the resolved location (e.g. the file moved) so the next auth resolves it again."""
+        self._base_url = None
+        self._server_relative_url = None
+        self._folder_url = None
+        self._file_name = None
+        try:
+            LOCATION_CACHE_FILE.unlink()
+        except OSError:
+            pass
+
+    def _load_download_state(self, dest: Path) -> Optional[dict]:
+        """
+        Return the recorded state of the last download to dest, or None.
+
+        The record only counts while dest is exactly the file that was
+        downloaded (same size and mtime), so local edits are never masked.
+        """
+        try:
+            with open(DOWNLOAD_STATE_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            stat = dest.stat()
+        except (OSError, ValueError):
+            return None
+
+        if (data.get('key') != self._location_key() or data.get('path') != str(dest)
+                or data.get('size') != stat.st_size or data.get('mtime') != stat.st_mtime):
+            return None
+        return data
+
+    def _save_download_state(self, dest: Path, etag: Optional[str]):
+        """Record the ETag of the copy now at dest and when it was checked."""
+        try:
+            stat = dest.stat()
+            DOWNLOAD_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            data = {
+                'key': self._location_key(),
+                'path': str(dest),
+                'size': stat.st_size,
+                'mtime': stat.st_mtime,
+                'etag': etag,
+                'checked_at': time.time(),
+            }
+            # Temp file + atomic rename, so a reader never sees half a file
+            tmp_path = DOWNLOAD_STATE_FILE.with_name(f"{DOWNLOAD_STATE_FILE.name}.tmp-{os.getpid()}")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, DOWNLOAD_STATE_FILE)
+        except OSError as e:
+            logger.warning("[SharePoint] Could not record download state: %s", e)
 
     def _get_digest(self) -> str:
         """Get a request digest for write operations."""
@@ -177,11 +310,30 @@ class SharePointClient:
     # Download
     # ------------------------------------------------------------------
 
-    def download(self, local_path: str) -> bool:
+    def download(self, local_path: str, bypass_ttl: bool = False) -> bool:
         """
         Download the SharePoint file to a local path.
         Uses the sharing URL with &download=1 (fast, no REST API needed).
+
+        An unchanged file is not transferred again: the request carries the
+        last copy's ETag, and a copy checked in the last DOWNLOAD_TTL_SECONDS
+        is used without asking at all, unless bypass_ttl is set. Pass
+        bypass_ttl before editing, so a recent change on SharePoint is
+        never overwritten by the upload that follows.
+        """
+        return self.download_async(local_path, bypass_ttl).result()
+
+    def download_async(self, local_path: str, bypass_ttl: bool = False) -> Future:
+        """
+        Queue a download() on the transfer thread.
+
+        Returns a Future resolving to download()'s result, so the caller can
+        do other network work (e.g. Claude calls) while the file transfers.
         """
+        return self._transfers.submit(self._download, local_path, bypass_ttl)
+
+    def _download(self, local_path: str, bypass_ttl: bool = False) -> bool:
+        """Internal download (runs on the transfer thread)."""
         if not self.enabled:
             return False
 
@@ -193,23 +345,59 @@ class SharePointClient:
             else:
                 download_url += '?download=1'
 
-            resp = requests.get(download_url, allow_redirects=True, timeout=30)
-            resp.raise_for_status()
-
-            # Verify it's a valid XLSX
-            if resp.content[:4] != b'PK\x03\x04':
-                print("[SharePoint] Download returned non-XLSX content, skipping")
-                return False
-
-            Path(local_path).parent.mkdir(parents=True, exist_ok=True)
-            with open(local_path, 'wb') as f:
-                f.write(resp.content)
-
-            print(f"[SharePoint] Downloaded glossary ({len(resp.content)} bytes) -> {local_path}")
+            dest = Path(local_path)
+            known = self._load_download_state(dest)
+            if (known and not bypass_ttl
+                    and time.time() - known.get('checked_at', 0) < DOWNLOAD_TTL_SECONDS):
+                logger.info("[SharePoint] Glossary checked recently, using local copy")
+                return True
+
+            headers = {}
+            if known and known.get('etag'):
+                headers['If-None-Match'] = known['etag']
+
+            # Stream to a temp file next to the destination, then swap it in,
+            # so the body is never held in memory or left half-written
+            with self._http.get(download_url, headers=headers, allow_redirects=True,
+                                timeout=30, stream=True) as resp:
+                if resp.status_code == 304:
+                    self._save_download_state(dest, known['etag'])
+                    logger.info("[SharePoint] Glossary up to date (304)")
+                    return True
+                resp.raise_for_status()
+                chunks = resp.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE)
+
+                # Verify it's a valid XLSX
+                head = b''
+                for chunk in chunks:
+                    head += chunk
+                    if len(head) >= 4:
+                        break
+                if head[:4] != b'PK\x03\x04':
+                    logger.warning("[SharePoint] Download returned non-XLSX content, skipping")
+                    return False
+
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = dest.with_name(f"{dest.name}.download-{os.getpid()}")
+                try:
+                    total = len(head)
+                    with open(tmp_path, 'wb') as f:
+                        f.write(head)
+                        for chunk in chunks:
+                            f.write(chunk)
+                            total += len(chunk)
+                    os.replace(tmp_path, dest)
+                finally:
+                    if tmp_path.exists():
+                        tmp_path.unlink()
+                etag = resp.headers.get('ETag')
+
+            self._save_download_state(dest, etag)
+            logger.info("[SharePoint] Downloaded glossary (%d bytes) -> %s", total, local_path)
             return True
 
         except Exception as e:
-            print(f"[SharePoint] Download failed: {e}")
+            logger.error("[SharePoint] Download failed: %s", e)
             return False
 
     # ------------------------------------------------------------------
@@ -224,25 +412,25 @@ class SharePointClient:
         if not self._folder_url or not self._file_name:
             return False, "Could not resolve file path on SharePoint", 0
 
+        # Pass the open file so requests streams it instead of reading it all
+        # first; the size comes from the open handle, so it matches what is sent
         with open(local_path, 'rb') as f:
-            data = f.read()
-
-        resp = session.post(
-            f"{self._base_url}/_api/web/GetFolderByServerRelativePath("
-            f"decodedurl='{self._folder_url}')/Files/Add("
-            f"url='{self._file_name}',overwrite=true)",
-            headers={
-                'Accept': 'application/json;odata=verbose',
-                'X-RequestDigest': digest,
-            },
-            data=data,
-            timeout=30,
-        )
+            size = os.fstat(f.fileno()).st_size
+            resp = session.post(
+                f"{self._base_url}/_api/web/GetFolderByServerRelativePath("
+                f"decodedurl='{self._folder_url}')/Files/Add("
+                f"url='{self._file_name}',overwrite=true)",
+                headers={
+                    'Accept': 'application/json;odata=verbose',
+                    'X-RequestDigest': digest,
+                    'Content-Length': str(size),
+                },
+                data=f,
+                timeout=30,
+            )
 
         if resp.status_code in (200, 201):
-            result = resp.json().get('d', {})
-            size = result.get('Length', len(data))
-            print(f"[SharePoint] Uploaded glossary ({size} bytes)")
+            logger.info("[SharePoint] Uploaded glossary (%d bytes)", size)
             return True, "Synced to SharePoint", resp.status_code
 
         if resp.status_code == 423:
@@ -264,6 +452,19 @@ class SharePointClient:
 
         Returns (success, message) tuple.
         """
+        return self.upload_async(local_path).result()
+
+    def upload_async(self, local_path: str) -> Future:
+        """
+        Queue an upload() on the transfer thread.
+
+        Returns a Future resolving to upload()'s (success, message) tuple.
+        The file is read when the upload runs, so later local edits are included.
+        """
+        return self._transfers.submit(self._upload, local_path)
+
+    def _upload(self, local_path: str) -> Tuple[bool, str]:
+        """Internal upload with one re-authentication retry (runs on the transfer thread)."""
         if not self.enabled:
             return False, "SharePoint sync not configured"
 
@@ -272,15 +473,17 @@ class SharePointClient:
             if ok:
                 return True, msg
 
-            # Auth expired? Re-authenticate and retry once
-            if status in (401, 403):
-                print("[SharePoint] Session expired, re-authenticating...")
+            # Auth expired (or the file moved)? Re-authenticate and retry once
+            if status in (401, 403, 404):
+                logger.info("[SharePoint] Session expired, re-authenticating...")
+                if status == 404:
+                    self._forget_location()
                 self._invalidate_session()
                 ok, msg, status = self._do_upload(local_path)
                 if ok:
                     return True, msg
 
-            print(f"[SharePoint] Upload failed: {msg}")
+            logger.error("[SharePoint] Upload failed: %s", msg)
             return False, msg
 
         except Exception as e:
@@ -292,7 +495,7 @@ class SharePointClient:
                     return True, msg
                 return False, msg
             except Exception as e2:
-                print(f"[SharePoint] Upload failed after retry: {e2}")
+                logger.error("[SharePoint] Upload failed after retry: %s", e2)
                 return False, f"SharePoint sync error: {e2}"
 
 
@@ -311,16 +514,28 @@ def get_sharepoint_client() -> SharePointClient:
     return _instance
 
 
+@atexit.register
+def _close_on_exit():
+    """Close the singleton's pooled connections before the process exits."""
+    if _instance is not None:
+        _instance.close()
+
+
 def is_sharepoint_enabled() -> bool:
     """Check if SharePoint sync is configured."""
     return get_sharepoint_client().enabled
 
 
-def download_glossary(local_path: str) -> bool:
+def download_glossary(local_path: str, bypass_ttl: bool = False) -> bool:
     """Convenience: download glossary from SharePoint to local path."""
-    return get_sharepoint_client().download(local_path)
+    return get_sharepoint_client().download(local_path, bypass_ttl)
 
 
 def upload_glossary(local_path: str) -> Tuple[bool, str]:
     """Convenience: upload local glossary back to SharePoint."""
     return get_sharepoint_client().upload(local_path)
+
+
+def upload_glossary_async(local_path: str) -> Future:
+    """Convenience: queue an upload of the local glossary; returns a Future of (success, message)."""
+    return get_sharepoint_client().upload_async(local_path)
@@ -4,10 +4,16 @@ Translation Engine using Claude API
 Translates French text to English using Claude AI with PSP-specific rules and glossary.
 """
 
+import atexit
+import logging
 import os
 import re
+import string
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from dotenv import load_dotenv
 import anthropic
 
@@ -16,6 +22,8 @@ from tools.fetch_glossary import fetch_glossary
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Configuration
 ANTHROPIC_API_KEY = os.getenv('ANTHROPIC_API_KEY')
 PROMPT_TEMPLATE_PATH = Path(__file__).parent.parent / 'config' / 'prompt_template.txt'
@@ -26,11 +34,62 @@ MODEL = "claude-sonnet-4-20250514"  # Claude Sonnet 4 (latest)
 MAX_TOKENS = 8000
 TEMPERATURE = 0.3  # Lower temperature for consistency
 
+# Up to this many glossary terms, terms_used is found with a substring
+# pre-filter and per-term searches; larger glossaries use one compiled pattern
+SMALL_GLOSSARY_TERMS = 50
+
+# Last glossary formatted for the prompt: (glossary, term count, text). Holding
+# the dict itself means its identity can't be reused by another object
+_formatted_glossary: Optional[Tuple[Dict[str, str], int, str]] = None
+
+# One Anthropic client for every call, so its keep-alive connections are reused
+_client: Optional[anthropic.Anthropic] = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> anthropic.Anthropic:
+    """Return the shared Anthropic client (one connection pool), creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
+    return _client
+
+
+@atexit.register
+def _close_client():
+    """Close the shared Anthropic client's connections."""
+    if _client is not None:
+        _client.close()
+
+
+def warmup(force_refresh: bool = False) -> Dict[str, str]:
+    """
+    Load the glossary while the other translation prerequisites get ready.
+
+    The prompt template and the Anthropic client are prepared on worker
+    threads while the glossary is fetched (which may include a SharePoint
+    download), so the first translate() call finds everything in place.
+    Failures there are left for translate() to report.
+
+    Args:
+        force_refresh: Passed to fetch_glossary()
+
+    Returns:
+        The glossary dictionary
+    """
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        executor.submit(_load_template)
+        executor.submit(_get_client)
+        return executor.submit(fetch_glossary, force_refresh=force_refresh).result()
+
 
 def translate(
     french_text: str,
     glossary: Optional[Dict[str, str]] = None,
-    rules_path: Optional[str] = None
+    rules_path: Optional[str] = None,
+    skip_terms_used: bool = False
 ) -> Dict:
     """
     Translate French text to English using Claude API with PSP rules.
@@ -39,11 +98,13 @@ def translate(
         french_text: The French text to translate
         glossary: Optional glossary dictionary. If None, fetches from Google Sheets
         rules_path: Optional path to translation rules file
+        skip_terms_used: Don't look for glossary terms in the text (terms_used
+            comes back empty) when the caller only needs the translation
 
     Returns:
         Dictionary containing:
         - translated_text: The English translation
-        - terms_used: List of glossary terms applied (not implemented yet)
+        - terms_used: List of glossary terms found in the French text
         - cost: Estimated API cost in USD
         - model: Model used
         - input_tokens: Number of input tokens
@@ -62,25 +123,21 @@ def translate(
 
     # Fetch glossary if not provided
     if glossary is None:
-        print("Fetching glossary...")
+        logger.info("Fetching glossary...")
         glossary = fetch_glossary()
 
     # Track which glossary terms appear in the French text
     terms_used = []
-    if glossary:
-        for french_term, english_term in glossary.items():
-            # Word boundary matching to avoid false positives
-            pattern = r'\b' + re.escape(french_term) + r'\b'
-            if re.search(pattern, french_text, re.IGNORECASE):
-                terms_used.append({'french': french_term, 'english': english_term})
+    if glossary and not skip_terms_used:
+        terms_used = _find_terms_used(french_text, glossary)
 
     # Load prompt template
     prompt = _build_prompt(french_text, glossary, rules_path)
 
     # Call Claude API
-    print(f"Translating with {MODEL}...")
+    logger.info("Translating with %s...", MODEL)
     try:
-        client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
+        client = _get_client()
 
         message = client.messages.create(
             model=MODEL,
@@ -115,18 +172,106 @@ def translate(
             'output_tokens': output_tokens
         }
 
-        print("[OK] Translation complete")
-        print(f"  Input tokens: {input_tokens}")
-        print(f"  Output tokens: {output_tokens}")
-        print(f"  Estimated cost: ${cost:.4f}")
+        logger.info("Translation complete (input tokens: %d, output tokens: %d, estimated cost: $%.4f)",
+                    input_tokens, output_tokens, cost)
 
         return result
 
     except Exception as e:
-        print(f"[ERROR] Translation failed: {e}")
+        logger.error("Translation failed: %s", e)
         raise
 
 
+def translate_batch(
+    french_texts: List[str],
+    glossary: Optional[Dict[str, str]] = None,
+    rules_path: Optional[str] = None,
+    concurrency: int = 4
+) -> List[Dict]:
+    """
+    Translate several texts concurrently.
+
+    Each translation is one network-bound Claude call, so up to `concurrency`
+    run at once (kept small to stay within API rate limits). The glossary is
+    fetched once for the whole batch.
+
+    Args:
+        french_texts: The French texts to translate
+        glossary: Optional glossary dictionary. If None, fetches it once
+        rules_path: Optional path to translation rules file
+        concurrency: Maximum number of translations in flight
+
+    Returns:
+        One translate() result per text, in order
+
+    Raises:
+        ValueError: If ANTHROPIC_API_KEY is not set
+        Exception: If any API call fails
+    """
+    if not french_texts:
+        return []
+
+    if glossary is None:
+        logger.info("Fetching glossary...")
+        glossary = fetch_glossary()
+
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(french_texts)))) as executor:
+        return list(executor.map(lambda text: translate(text, glossary, rules_path), french_texts))
+
+
+def _find_terms_used(french_text: str, glossary: Dict[str, str]) -> List[Dict[str, str]]:
+    """
+    List the glossary terms that appear in the text as whole words (case-insensitive).
+
+    Small glossaries skip terms that aren't even a substring of the lowercased
+    text and search only the rest; larger ones are matched in one pass with a
+    single compiled pattern.
+
+    Args:
+        french_text: The French text to translate
+        glossary: Dictionary of French-English term pairs
+
+    Returns:
+        List of {'french': ..., 'english': ...} dicts, in glossary order
+    """
+    if len(glossary) <= SMALL_GLOSSARY_TERMS:
+        lower_text = french_text.lower()
+        return [
+            {'french': french_term, 'english': english_term}
+            for french_term, english_term in glossary.items()
+            if french_term.lower() in lower_text
+            and re.search(r'\b' + re.escape(french_term) + r'\b', french_text, re.IGNORECASE)
+        ]
+
+    # Longest term matched at each word boundary
+    found = {match.lower() for match in _glossary_pattern(frozenset(glossary)).findall(french_text)}
+
+    terms_used = []
+    for french_term, english_term in glossary.items():
+        key = french_term.lower()
+        if key in found or (
+            # A shorter term can start where a longer one matched
+            # ("programme" in "programme de soutien"); check those directly
+            any(match.startswith(key) for match in found)
+            and re.search(r'\b' + re.escape(french_term) + r'\b', french_text, re.IGNORECASE)
+        ):
+            terms_used.append({'french': french_term, 'english': english_term})
+
+    return terms_used
+
+
+@lru_cache(maxsize=4)
+def _glossary_pattern(terms: frozenset) -> re.Pattern:
+    """
+    Compile one word-boundary pattern matching any glossary term.
+
+    Longer terms come first so each position reports its longest match;
+    the lookahead lets matches overlap.
+    """
+    alternation = '|'.join(re.escape(term) for term in sorted(terms, key=len, reverse=True))
+    return re.compile(r'(?=\b(' + alternation + r')\b)', re.IGNORECASE)
+
+
 def _build_prompt(
     french_text: str,
     glossary: Dict[str, str],
@@ -143,12 +288,8 @@ def _build_prompt(
     Returns:
         Complete prompt string ready for Claude API
     """
-    # Load prompt template
-    if not PROMPT_TEMPLATE_PATH.exists():
-        raise FileNotFoundError(f"Prompt template not found at {PROMPT_TEMPLATE_PATH}")
-
-    with open(PROMPT_TEMPLATE_PATH, 'r', encoding='utf-8') as f:
-        template = f.read()
+    # Load prompt template (read and parsed once per process)
+    template = _load_template()
 
     # Format glossary terms for prompt
     glossary_text = _format_glossary(glossary)
@@ -158,14 +299,38 @@ def _build_prompt(
     # but we could load them dynamically if needed
 
     # Inject variables into template
-    prompt = template.format(
-        glossary_terms=glossary_text,
-        french_text=french_text
+    values = {
+        'glossary_terms': glossary_text,
+        'french_text': french_text,
+    }
+    prompt = ''.join(
+        literal + (values[field] if field is not None else '')
+        for literal, field in template
     )
 
     return prompt
 
 
+@lru_cache(maxsize=1)
+def _load_template() -> Tuple[Tuple[str, Optional[str]], ...]:
+    """
+    Read the prompt template and split it into (literal text, field name) pieces.
+
+    Parsing once means each prompt is a single join, with the same
+    result as str.format() (including {{ }} escapes).
+
+    Raises:
+        FileNotFoundError: If the template file is missing
+    """
+    if not PROMPT_TEMPLATE_PATH.exists():
+        raise FileNotFoundError(f"Prompt template not found at {PROMPT_TEMPLATE_PATH}")
+
+    with open(PROMPT_TEMPLATE_PATH, 'r', encoding='utf-8') as f:
+        template = f.read()
+
+    return tuple((literal, field) for literal, field, _, _ in string.Formatter().parse(template))
+
+
 def _format_glossary(glossary: Dict[str, str]) -> str:
     """
     Format glossary dictionary into a readable string for the prompt.
@@ -176,15 +341,22 @@ def _format_glossary(glossary: Dict[str, str]) -> str:
     Returns:
         Formatted string with term pairs
     """
+    global _formatted_glossary
+
     if not glossary:
         return "No glossary terms available."
 
+    # Callers pass the same dict until the glossary is reloaded (fetch_glossary
+    # builds a new one), so reuse the text built for it last time
+    cached = _formatted_glossary
+    if cached is not None and cached[0] is glossary and cached[1] == len(glossary):
+        return cached[2]
+
     # Format as a list with French → English
-    lines = []
-    for french, english in glossary.items():
-        lines.append(f"- {french} → {english}")
+    text = "\n".join(f"- {french} → {english}" for french, english in glossary.items())
 
-    return "\n".join(lines)
+    _formatted_glossary = (glossary, len(glossary), text)
+    return text
 
 
 def estimate_cost(text: str, glossary_size: int = 100) -> float:
@@ -216,6 +388,8 @@ def estimate_cost(text: str, glossary_size: int = 100) -> float:
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.getenv('LOG_LEVEL', 'INFO'))
+
     # Test the translation engine
     print("Testing Translation Engine...")
     print("-" * 50)
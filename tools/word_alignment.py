@@ -5,22 +5,73 @@ Maps French words to their English equivalents after translation.
 Used for synchronized highlighting between French and English text.
 """
 
+import atexit
 import os
 import re
 import json
-from typing import Dict, List, Tuple
+import logging
+import threading
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from dotenv import load_dotenv
 import anthropic
 
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json is used when orjson isn't installed
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Configuration
 ANTHROPIC_API_KEY = os.getenv('ANTHROPIC_API_KEY')
 MODEL = "claude-haiku-4-5-20251001"  # Use Haiku for cost efficiency
 MAX_TOKENS = 4000
 TEMPERATURE = 0
 
+# Texts whose words are mostly shared between French and English (names,
+# numbers, dates) are aligned locally, without calling Claude
+LOCAL_ALIGN_MIN_SHARED = 0.7
+
+# Alignments kept for texts re-aligned unchanged (e.g. re-runs while editing)
+ALIGNMENT_CACHE_SIZE = 256
+_alignment_cache: "OrderedDict[Tuple[str, str], Dict]" = OrderedDict()
+_alignment_cache_lock = threading.Lock()
+
+# One Anthropic client for every call, so its keep-alive connections are reused
+_client: Optional[anthropic.Anthropic] = None
+_client_lock = threading.Lock()
+
+# Markdown and color markers stripped before splitting words. Colored
+# highlights (==#COLOR:) and colors (::#COLOR:) come before the bare
+# == and :: so their color codes are removed too
+_MARKUP_RE = re.compile(r'\*\*|\*|__|_|~~|\+\+|==#[A-Fa-f0-9]+:|==|::#[A-Fa-f0-9]+:|::')
+_WORD_RE = re.compile(r"\b[\w'-]+\b")
+
+# Background alignments (see generate_alignment_async)
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='alignment')
+
+
+def _get_client() -> anthropic.Anthropic:
+    """Return the shared Anthropic client (one connection pool), creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
+    return _client
+
+
+@atexit.register
+def _close_client():
+    """Close the shared Anthropic client's connections."""
+    if _client is not None:
+        _client.close()
+
 
 def generate_alignment(french_text: str, english_text: str) -> Dict:
     """
@@ -36,10 +87,21 @@ def generate_alignment(french_text: str, english_text: str) -> Dict:
         - en_words: List of English words
         - fr_to_en: Dict mapping French word indices to list of English word indices
         - en_to_fr: Dict mapping English word indices to list of French word indices
+        - cost: API cost in USD (0 when no call was made)
+        - method: 'claude', 'local' (shared-word alignment) or 'cache'
     """
     if not ANTHROPIC_API_KEY:
         raise ValueError("ANTHROPIC_API_KEY not set in .env file.")
 
+    cache_key = (french_text, english_text)
+    with _alignment_cache_lock:
+        cached = _alignment_cache.get(cache_key)
+        if cached is not None:
+            _alignment_cache.move_to_end(cache_key)
+    if cached is not None:
+        logger.info("Word alignment loaded from cache")
+        return {**cached, 'cost': 0.0, 'method': 'cache'}
+
     # Extract words from both texts (preserving order)
     fr_words = extract_words(french_text)
     en_words = extract_words(english_text)
@@ -52,11 +114,26 @@ def generate_alignment(french_text: str, english_text: str) -> Dict:
             'en_to_fr': {}
         }
 
+    # Mostly shared words: matching them is enough, skip the API call
+    local_alignment = _align_shared_words(fr_words, en_words)
+    if local_alignment is not None:
+        result = {
+            'fr_words': fr_words,
+            'en_words': en_words,
+            'fr_to_en': local_alignment['fr_to_en'],
+            'en_to_fr': local_alignment['en_to_fr'],
+            'cost': 0.0,
+            'method': 'local'
+        }
+        logger.info("Word alignment complete (local, no API call)")
+        _remember_alignment(cache_key, result)
+        return result
+
     # Build prompt for Claude
     prompt = _build_alignment_prompt(fr_words, en_words)
 
     try:
-        client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
+        client = _get_client()
 
         message = client.messages.create(
             model=MODEL,
@@ -80,18 +157,23 @@ def generate_alignment(french_text: str, english_text: str) -> Dict:
         # Haiku pricing: $0.25 input, $1.25 output per million tokens
         cost = (input_tokens / 1_000_000 * 0.25) + (output_tokens / 1_000_000 * 1.25)
 
-        print(f"[OK] Word alignment complete (cost: ${cost:.4f})")
+        logger.info("Word alignment complete (cost: $%.4f)", cost)
 
-        return {
+        result = {
             'fr_words': fr_words,
             'en_words': en_words,
             'fr_to_en': alignment['fr_to_en'],
             'en_to_fr': alignment['en_to_fr'],
-            'cost': cost
+            'cost': cost,
+            'method': 'claude'
         }
+        # An unparseable reply comes back empty; leave it uncached so it is retried
+        if alignment['fr_to_en'] or alignment['en_to_fr']:
+            _remember_alignment(cache_key, result)
+        return result
 
     except Exception as e:
-        print(f"[ERROR] Word alignment failed: {e}")
+        logger.error("Word alignment failed: %s", e)
         # Return empty alignment on failure
         return {
             'fr_words': fr_words,
@@ -101,6 +183,19 @@ def generate_alignment(french_text: str, english_text: str) -> Dict:
         }
 
 
+def generate_alignment_async(french_text: str, english_text: str) -> Future:
+    """
+    Start generate_alignment() in the background.
+
+    Lets the caller carry on (e.g. logging, the next translation) while the
+    alignment call is in flight.
+
+    Returns:
+        Future resolving to the generate_alignment() result
+    """
+    return _executor.submit(generate_alignment, french_text, english_text)
+
+
 def extract_words(text: str) -> List[str]:
     """
     Extract words from text, removing markdown formatting.
@@ -111,16 +206,57 @@ def extract_words(text: str) -> List[str]:
     Returns:
         List of words in order
     """
-    # Remove markdown formatting markers
-    clean_text = text
-    clean_text = re.sub(r'\*\*|\*|__|_|~~|==|\+\+', '', clean_text)
-    clean_text = re.sub(r'::#[A-Fa-f0-9]+:|::', '', clean_text)
-    clean_text = re.sub(r'==#[A-Fa-f0-9]+:', '', clean_text)
+    # Remove markdown formatting markers (one pass)
+    clean_text = _MARKUP_RE.sub('', text)
 
     # Extract words (alphanumeric sequences)
-    words = re.findall(r'\b[\w\'-]+\b', clean_text, re.UNICODE)
+    return _WORD_RE.findall(clean_text)
 
-    return words
+
+def _align_shared_words(fr_words: List[str], en_words: List[str]) -> Optional[Dict]:
+    """
+    Align identical words (case-insensitive) when both texts are mostly made of them.
+
+    Args:
+        fr_words: List of French words
+        en_words: List of English words
+
+    Returns:
+        Dict with fr_to_en and en_to_fr mappings, or None if fewer than
+        LOCAL_ALIGN_MIN_SHARED of either text's words appear in the other
+    """
+    fr_lower = [w.lower() for w in fr_words]
+    en_lower = [w.lower() for w in en_words]
+    shared = set(fr_lower) & set(en_lower)
+
+    fr_shared = sum(w in shared for w in fr_lower)
+    en_shared = sum(w in shared for w in en_lower)
+    if min(fr_shared / len(fr_lower), en_shared / len(en_lower)) < LOCAL_ALIGN_MIN_SHARED:
+        return None
+
+    en_positions = defaultdict(list)
+    for en_idx, word in enumerate(en_lower):
+        if word in shared:
+            en_positions[word].append(en_idx)
+
+    fr_to_en = {}
+    en_to_fr = defaultdict(list)
+    for fr_idx, word in enumerate(fr_lower):
+        if word in shared:
+            fr_to_en[fr_idx] = list(en_positions[word])
+            for en_idx in en_positions[word]:
+                en_to_fr[en_idx].append(fr_idx)
+
+    return {'fr_to_en': fr_to_en, 'en_to_fr': dict(en_to_fr)}
+
+
+def _remember_alignment(cache_key: Tuple[str, str], result: Dict) -> None:
+    """Keep an alignment for a text pair, evicting the oldest past ALIGNMENT_CACHE_SIZE."""
+    with _alignment_cache_lock:
+        _alignment_cache[cache_key] = result
+        _alignment_cache.move_to_end(cache_key)
+        while len(_alignment_cache) > ALIGNMENT_CACHE_SIZE:
+            _alignment_cache.popitem(last=False)
 
 
 def _build_alignment_prompt(fr_words: List[str], en_words: List[str]) -> str:
@@ -134,17 +270,17 @@ def _build_alignment_prompt(fr_words: List[str], en_words: List[str]) -> str:
     Returns:
         Prompt string
     """
-    # Format words with indices
-    fr_indexed = [f"{i}:{w}" for i, w in enumerate(fr_words)]
-    en_indexed = [f"{i}:{w}" for i, w in enumerate(en_words)]
+    # Format words with indices, straight into each joined block
+    fr_block = ' | '.join(f"{i}:{w}" for i, w in enumerate(fr_words))
+    en_block = ' | '.join(f"{i}:{w}" for i, w in enumerate(en_words))
 
     prompt = f"""You are a translation alignment expert. Given a French text and its English translation, identify which French words correspond to which English words.
 
 FRENCH WORDS (index:word):
-{' | '.join(fr_indexed)}
+{fr_block}
 
 ENGLISH WORDS (index:word):
-{' | '.join(en_indexed)}
+{en_block}
 
 TASK: Create a mapping where each French word index maps to the English word index(es) that represent the same meaning.
 
@@ -185,16 +321,14 @@ def _parse_alignment_response(response: str, num_fr: int, num_en: int) -> Dict:
     Returns:
         Dict with fr_to_en and en_to_fr mappings
     """
-    fr_to_en = {}
-    en_to_fr = {}
+    # Sets dedupe indices as the mappings are built
+    fr_to_en = defaultdict(set)
+    en_to_fr = defaultdict(set)
 
     try:
-        # Extract JSON from response (handle potential extra text)
-        json_match = re.search(r'\{[\s\S]*\}', response)
-        if not json_match:
+        data = _load_json_object(response)
+        if data is None:
             return {'fr_to_en': {}, 'en_to_fr': {}}
-
-        data = json.loads(json_match.group())
         alignments = data.get('alignments', [])
 
         for alignment in alignments:
@@ -207,23 +341,49 @@ def _parse_alignment_response(response: str, num_fr: int, num_en: int) -> Dict:
 
             # Build mappings
             for fr_idx in fr_indices:
-                if fr_idx not in fr_to_en:
-                    fr_to_en[fr_idx] = []
-                fr_to_en[fr_idx].extend(en_indices)
+                fr_to_en[fr_idx].update(en_indices)
 
             for en_idx in en_indices:
-                if en_idx not in en_to_fr:
-                    en_to_fr[en_idx] = []
-                en_to_fr[en_idx].extend(fr_indices)
-
-        # Deduplicate
-        fr_to_en = {k: list(set(v)) for k, v in fr_to_en.items()}
-        en_to_fr = {k: list(set(v)) for k, v in en_to_fr.items()}
+                en_to_fr[en_idx].update(fr_indices)
 
     except (json.JSONDecodeError, KeyError, TypeError) as e:
-        print(f"[WARN] Failed to parse alignment response: {e}")
+        logger.warning("Failed to parse alignment response: %s", e)
+
+    return {
+        'fr_to_en': {k: list(v) for k, v in fr_to_en.items()},
+        'en_to_fr': {k: list(v) for k, v in en_to_fr.items()},
+    }
+
+
+def _load_json_object(response: str):
+    """
+    Parse the JSON object in a Claude response, or return None if there is none.
 
-    return {'fr_to_en': fr_to_en, 'en_to_fr': en_to_fr}
+    A bare object is parsed as is; otherwise (code fences, extra text) the
+    span from the first '{' to the last '}' is parsed.
+
+    Raises:
+        json.JSONDecodeError: If that span isn't valid JSON (orjson's error subclasses it)
+    """
+    payload = response.strip()
+    if payload.startswith('{'):
+        try:
+            return _json_loads(payload)
+        except json.JSONDecodeError:
+            pass
+
+    start = response.find('{')
+    end = response.rfind('}')
+    if start == -1 or end < start:
+        return None
+    return _json_loads(response[start:end + 1])
+
+
+def _json_loads(text: str):
+    """Parse JSON text (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
 
 
 def get_english_indices_for_french(alignment: Dict, fr_indices: List[int]) -> List[int]:
@@ -247,6 +407,8 @@ def get_english_indices_for_french(alignment: Dict, fr_indices: List[int]) -> Li
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.getenv('LOG_LEVEL', 'INFO'))
+
     # Test the alignment
     print("Testing Word Alignment...")
     print("-" * 50)